@@ -0,0 +1,135 @@
+"""
+Synthetic reference domains for the benchmark suite.
+
+They exercise engine overhead, not modelling: every domain does as little
+work as possible so the numbers reflect simulate / RNG.fork / summary costs.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+from policy_eval.abstractions.actor import Observation
+from policy_eval.abstractions.policy import PolicyContext
+from policy_eval.core.types import Event, Trajectory
+
+
+class CounterDomain:
+    """
+    Zero actors; state is an integer. Measures pure per-step engine overhead.
+    """
+    name = "counter"
+
+    def initial_state(self, rng: Any) -> int:
+        return 0
+
+    def actors(self, state: int):
+        return []
+
+    def policy_context(self, state: int, t: int) -> PolicyContext:
+        return PolicyContext(t=t, system_view=state)
+
+    def observe(self, state: int, actor, t: int) -> Observation:
+        raise RuntimeError("no actors")
+
+    def transition(self, state: int, policy_action: int, actor_actions, rng: Any, t: int) -> int:
+        return state + int(policy_action)
+
+    def record(self, state: int, t: int) -> Event:
+        return Event(t=t, payload=state)
+
+    def finalize(self, events, final_state) -> Trajectory:
+        return Trajectory(events=tuple(events), final_state=final_state)
+
+
+class CoinActor:
+    def __init__(self, i: int) -> None:
+        self.id = f"a{i}"
+
+    def act(self, obs: Observation, rng: Any) -> int:
+        return int(rng.random() < obs.data)
+
+
+class CrowdDomain:
+    """
+    n_actors scalar actors, each drawing one coin flip per step.
+    """
+    name = "crowd"
+
+    def __init__(self, n_actors: int) -> None:
+        self.crowd = [CoinActor(i) for i in range(n_actors)]
+
+    def initial_state(self, rng: Any) -> int:
+        return 0
+
+    def actors(self, state: int):
+        return self.crowd
+
+    def policy_context(self, state: int, t: int) -> PolicyContext:
+        return PolicyContext(t=t, system_view=state)
+
+    def observe(self, state: int, actor, t: int) -> Observation:
+        return Observation(t=t, data=0.5)
+
+    def transition(self, state: int, policy_action: int, actor_actions, rng: Any, t: int) -> int:
+        return state + sum(actor_actions)
+
+    def record(self, state: int, t: int) -> Event:
+        return Event(t=t, payload=state)
+
+    def finalize(self, events, final_state) -> Trajectory:
+        return Trajectory(events=tuple(events), final_state=final_state)
+
+
+class CoinPopulation:
+    draws_per_actor = 1
+
+    def __init__(self, n_actors: int) -> None:
+        self.ids = tuple(f"a{i}" for i in range(n_actors))
+
+    def act_batch(self, obs: Observation, draws: np.ndarray) -> np.ndarray:
+        return draws[:, 0] < obs.data
+
+
+class PopulationCrowdDomain(CrowdDomain):
+    """
+    CrowdDomain with its actors simulated as one ActorPopulation.
+    """
+    name = "crowd_population"
+
+    def __init__(self, n_actors: int) -> None:
+        self.crowd = []
+        self.pop = CoinPopulation(n_actors)
+
+    def population(self, state: int) -> CoinPopulation:
+        return self.pop
+
+    def observe_population(self, state: int, population, t: int) -> Observation:
+        return Observation(t=t, data=0.5)
+
+    def transition(self, state: int, policy_action: int, actor_actions, rng: Any, t: int) -> int:
+        return state + int(np.count_nonzero(actor_actions))
+
+
+class Increment:
+    def __init__(self, k: int) -> None:
+        self.k = k
+        self.name = f"inc_{k}"
+
+    def decide(self, ctx: PolicyContext) -> int:
+        return self.k
+
+
+class FinalValue:
+    name = "final"
+
+    def evaluate(self, traj: Trajectory) -> float:
+        return float(traj.final_state)
+
+
+class NegFinalValue:
+    name = "neg_final"
+
+    def evaluate(self, traj: Trajectory) -> float:
+        return -float(traj.final_state) ** 0.5
@@ -0,0 +1,216 @@
+"""
+Benchmark suite for the engine hot paths.
+
+    python benchmarks/run.py --out bench.json
+    python benchmarks/run.py --quick --compare bench.json
+
+Each case is timed (best of --repeat) and then run once more under
+tracemalloc for peak memory. Results are written as JSON so runs from
+different commits can be compared with --compare.
+"""
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable
+
+import numpy as np
+
+from policy_eval.core.rng import RNG
+from policy_eval.core.types import RunConfig
+from policy_eval.engine.evaluate import evaluate
+from policy_eval.engine.compare import DistSummary
+from policy_eval.engine.pareto import MetricSpec, pareto_front
+from policy_eval.engine.simulator import simulate
+
+from domains import (
+    CounterDomain,
+    CrowdDomain,
+    FinalValue,
+    Increment,
+    NegFinalValue,
+    PopulationCrowdDomain,
+)
+
+
+@dataclass(frozen=True)
+class Case:
+    """
+    workload() runs once; trials/steps/ops say how much work one call does.
+    """
+    name: str
+    workload: Callable[[], Any]
+    trials: int = 0
+    steps: int = 0
+    ops: int = 0
+
+
+def _cases(scale: float) -> list[Case]:
+    def n(x: int) -> int:
+        return max(1, int(x * scale))
+
+    counter_seeds, counter_h = n(200), 100
+    crowd_actors, crowd_h = 1000, n(20)
+    long_h = n(50_000)
+    grid_policies, grid_seeds, grid_h = 12, n(300), 20
+    forks = n(50_000)
+    front_policies, front_metrics = n(5000), 3
+
+    def counter() -> None:
+        cfg = RunConfig(horizon=counter_h)
+        for seed in range(counter_seeds):
+            simulate(CounterDomain(), Increment(1), cfg, seed=seed)
+
+    def crowd(domain: Any) -> Callable[[], None]:
+        return lambda: simulate(domain, Increment(0), RunConfig(horizon=crowd_h), seed=0)
+
+    def long_horizon() -> None:
+        simulate(CounterDomain(), Increment(1), RunConfig(horizon=long_h), seed=0)
+
+    def grid() -> None:
+        evaluate(
+            domain=CounterDomain(),
+            policies=[Increment(k) for k in range(grid_policies)],
+            metrics=[FinalValue(), NegFinalValue()],
+            seeds=range(grid_seeds),
+            cfg=RunConfig(horizon=grid_h),
+            pareto_metrics=[
+                MetricSpec(name="final", direction="higher_better"),
+                MetricSpec(name="neg_final", direction="higher_better"),
+            ],
+        )
+
+    def fork(scheme: str) -> Callable[[], None]:
+        rng = RNG(0, scheme=scheme)  # type: ignore[arg-type]
+
+        def run() -> None:
+            for t in range(forks):
+                rng.fork("actor", "a", t)
+
+        return run
+
+    front_values = np.random.default_rng(0).normal(size=(front_policies, front_metrics))
+    front_summaries = {
+        (f"p{i}", f"m{k}"): DistSummary(n=1, mean=v, std=0, min=v, p10=v, p50=v, p90=v, max=v)
+        for i, row in enumerate(front_values)
+        for k, v in enumerate(row)
+    }
+    front_specs = [
+        MetricSpec(name=f"m{k}", direction="higher_better") for k in range(front_metrics)
+    ]
+
+    def front() -> None:
+        pareto_front(front_summaries, front_specs)
+
+    return [
+        Case("counter", counter, trials=counter_seeds, steps=counter_seeds * counter_h),
+        Case("crowd_1k", crowd(CrowdDomain(crowd_actors)), trials=1, steps=crowd_h),
+        Case(
+            "crowd_1k_population",
+            crowd(PopulationCrowdDomain(crowd_actors)),
+            trials=1,
+            steps=crowd_h,
+        ),
+        Case("long_horizon", long_horizon, trials=1, steps=long_h),
+        Case(
+            "many_policies_seeds",
+            grid,
+            trials=grid_policies * grid_seeds,
+            steps=grid_policies * grid_seeds * grid_h,
+        ),
+        Case("rng_fork_v1", fork("v1"), ops=forks),
+        Case("rng_fork_v2", fork("v2"), ops=forks),
+        Case("pareto_front_5k", front, ops=front_policies),
+    ]
+
+
+def _measure(case: Case, repeat: int) -> dict[str, float]:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        case.workload()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    case.workload()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    out = {"seconds": best, "peak_mem_bytes": float(peak)}
+    if case.trials:
+        out["trials_per_sec"] = case.trials / best
+    if case.steps:
+        out["us_per_step"] = best / case.steps * 1e6
+    if case.ops:
+        out["us_per_op"] = best / case.ops * 1e6
+    return out
+
+
+def _meta() -> dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def _compare(current: dict[str, Any], baseline: dict[str, Any]) -> None:
+    if current.get("quick") != baseline.get("quick"):
+        print("warning: comparing --quick and full-size runs", file=sys.stderr)
+    # time-like fields: lower is better; ratio > 1 means slower than baseline
+    print(f"\n{'case':<22}{'field':<16}{'baseline':>12}{'current':>12}{'ratio':>8}")
+    for name, fields in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            continue
+        for field in ("seconds", "us_per_step", "us_per_op", "peak_mem_bytes"):
+            if field in fields and field in base and base[field]:
+                ratio = fields[field] / base[field]
+                print(f"{name:<22}{field:<16}{base[field]:>12.4g}{fields[field]:>12.4g}{ratio:>8.2f}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--out", help="write results as JSON to this path")
+    parser.add_argument("--compare", help="baseline JSON to compare against")
+    parser.add_argument("--quick", action="store_true", help="shrink workloads ~10x")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--only", nargs="*", help="run only these cases")
+    args = parser.parse_args(argv)
+
+    cases = _cases(0.1 if args.quick else 1.0)
+    if args.only:
+        cases = [c for c in cases if c.name in args.only]
+
+    results = {}
+    for case in cases:
+        results[case.name] = _measure(case, args.repeat)
+        fields = ", ".join(f"{k}={v:.4g}" for k, v in results[case.name].items())
+        print(f"{case.name:<22}{fields}")
+
+    report = {"meta": _meta(), "quick": args.quick, "results": results}
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            _compare(report, json.load(f))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,9 +3,26 @@ policy-eval: a simulation-based framework for evaluating and comparing policies
 in systems with human behavior under uncertainty.
 """
 
-from policy_eval.core.types import Event, RunConfig, Trajectory
-from policy_eval.engine.evaluate import EvaluationResult, evaluate
-from policy_eval.engine.pareto import MetricSpec
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from policy_eval.core.types import Event, RunConfig, Trajectory
+    from policy_eval.engine.evaluate import EvaluationResult, evaluate
+    from policy_eval.engine.pareto import MetricSpec
+
+# public name -> defining module; imported on first access (PEP 562) so
+# `import policy_eval` and the CLI start without loading NumPy
+_LAZY = {
+    "Event": "policy_eval.core.types",
+    "RunConfig": "policy_eval.core.types",
+    "Trajectory": "policy_eval.core.types",
+    "MetricSpec": "policy_eval.engine.pareto",
+    "EvaluationResult": "policy_eval.engine.evaluate",
+    "evaluate": "policy_eval.engine.evaluate",
+}
 
 __all__ = [
     "Event",
@@ -15,3 +32,16 @@ __all__ = [
     "EvaluationResult",
     "evaluate",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
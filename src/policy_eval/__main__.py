@@ -0,0 +1,5 @@
+import sys
+
+from policy_eval.cli import main
+
+sys.exit(main())
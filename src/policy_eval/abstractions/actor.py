@@ -1,6 +1,6 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Any, Protocol
+from typing import Any, Protocol, Sequence
 
 
 @dataclass(frozen=True)
@@ -26,3 +26,21 @@ class Actor(Protocol):
         Action type is domain-defined.
         """
         ...
+
+
+class ActorPopulation(Protocol):
+    """
+    Many actors acting as one vectorized block.
+    """
+
+    ids: Sequence[str]
+    draws_per_actor: int
+
+    def act_batch(self, obs: Observation, draws: Any) -> Any:
+        """
+        obs.data is batched along its first axis, in ids order.
+        draws[i] holds draws_per_actor uniforms in [0, 1) from actor ids[i]'s
+        own stream (keyed on its id, not its position).
+        Returns one action per actor, in ids order.
+        """
+        ...
@@ -1,7 +1,7 @@
 from __future__ import annotations
 from typing import Any, Protocol
 
-from policy_eval.abstractions.actor import Actor, Observation
+from policy_eval.abstractions.actor import Actor, ActorPopulation, Observation
 from policy_eval.abstractions.policy import PolicyContext
 from policy_eval.core.types import Event, Trajectory
 
@@ -40,3 +40,102 @@ class Domain(Protocol):
 
     def finalize(self, events: list[Event], final_state: Any) -> Trajectory:
         ...
+
+
+class PopulationDomain(Domain, Protocol):
+    """
+    A Domain whose actors are simulated as one ActorPopulation.
+
+    When a domain provides population(), simulate uses it instead of the
+    per-actor actors()/observe() loop, and transition receives the
+    population's action array as actor_actions.
+    """
+
+    def population(self, state: Any) -> ActorPopulation:
+        ...
+
+    def observe_population(
+        self, state: Any, population: ActorPopulation, t: int
+    ) -> Observation:
+        """
+        Batched observation, one row per actor in population.ids order.
+        Policy-blind, like observe.
+        """
+        ...
+
+
+class ColumnarDomain(Domain, Protocol):
+    """
+    A Domain whose per-step payload has a fixed numeric schema.
+
+    When a domain provides event_dtype, simulate records record_row into a
+    structured array preallocated to cfg.horizon and returns a
+    ColumnarTrajectory (record and finalize are not used).
+    """
+
+    event_dtype: Any  # numpy dtype spec of the payload fields, e.g. [("x", "f8")]
+
+    def record_row(self, state: Any, t: int) -> Any:
+        """
+        Payload field values in event_dtype order (a tuple, or a scalar
+        for a single field).
+        """
+        ...
+
+
+class CheckpointDomain(Domain, Protocol):
+    """
+    A Domain that controls how its state is written to checkpoints
+    (see engine.checkpoint); without these hooks the state is pickled.
+    """
+
+    def serialize_state(self, state: Any) -> bytes:
+        ...
+
+    def restore_state(self, blob: bytes) -> Any:
+        """
+        Inverse of serialize_state; the restored state must continue the
+        run exactly as the original would.
+        """
+        ...
+
+
+class BatchDomain(Protocol):
+    """
+    Optional vectorized counterpart of Domain.
+
+    Every method works on a batch of N seeds at once; state, policy views
+    and records are domain-defined batched objects (typically NumPy arrays
+    with a leading axis of length N). Randomness stays per seed: rngs[i] is
+    the same stream Domain would receive for seed i.
+    """
+
+    name: str
+
+    def initial_state(self, rngs: list[Any]) -> Any:
+        ...
+
+    def policy_context(self, state: Any, t: int) -> PolicyContext:
+        """
+        system_view is batched along its first axis.
+        """
+        ...
+
+    def transition(
+        self,
+        state: Any,
+        policy_actions: Any,
+        rngs: list[Any],
+        t: int,
+    ) -> Any:
+        ...
+
+    def record(self, state: Any, t: int) -> Any:
+        ...
+
+    def finalize(self, records: list[Any], final_state: Any) -> list[Trajectory]:
+        """
+        records[t] is what record returned at step t.
+        Returns one Trajectory per seed, in batch order.
+        """
+        ...
@@ -1,7 +1,7 @@
 from __future__ import annotations
 from typing import Protocol
 
-from policy_eval.core.types import Trajectory
+from policy_eval.core.types import ColumnarTrajectory, Trajectory
 
 
 class Metric(Protocol):
@@ -11,7 +11,7 @@ class Metric(Protocol):
 
     name: str
 
-    def evaluate(self, traj: Trajectory) -> float:
+    def evaluate(self, traj: Trajectory | ColumnarTrajectory) -> float:
         """
         Pure function of the trajectory.
         Must not mutate anything.
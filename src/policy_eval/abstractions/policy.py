@@ -1,6 +1,6 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Any, Protocol
+from typing import Any, Protocol, Sequence
 
 
 @dataclass(frozen=True)
@@ -26,3 +26,31 @@ class Policy(Protocol):
         Action type is domain-defined.
         """
         ...
+
+
+class BatchPolicy(Policy, Protocol):
+    """
+    A Policy that can also decide for a batch of seeds at once.
+    """
+
+    def decide_batch(self, ctx: PolicyContext) -> Any:
+        """
+        ctx.system_view is batched along its first axis.
+        Returns one action per seed (e.g. an array of length N).
+        """
+        ...
+
+
+class MultiSeedPolicy(Policy, Protocol):
+    """
+    A Policy that decides for many independent runs in one call,
+    e.g. one model inference over a batch of contexts.
+    """
+
+    def decide_many(self, ctxs: Sequence[PolicyContext]) -> Sequence[Any]:
+        """
+        ctxs come from different seeds at the same timestep.
+        Returns one action per context, in order; each must equal what
+        decide would return for that context.
+        """
+        ...
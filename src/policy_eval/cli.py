@@ -0,0 +1,358 @@
+"""
+policy-eval command-line runner.
+
+    policy-eval run experiment.toml [--workers N] [--out result.pkl] [--json summary.json]
+    policy-eval worker http://coordinator:8765 [--token T]
+
+An experiment spec names import paths ("package.module:attr") and their
+keyword arguments; see ExperimentSpec for the layout. Heavy modules are
+only imported once a command runs, so --help stays fast.
+"""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import MISSING, dataclass, field, fields
+from importlib import import_module
+import itertools
+import json
+from pathlib import Path
+import sys
+from typing import Any, Literal, Sequence
+
+Backend = Literal["serial", "process", "distributed"]
+
+
+class SpecError(ValueError):
+    """
+    The experiment spec is malformed.
+    """
+
+
+@dataclass(frozen=True)
+class Component:
+    """
+    factory: "package.module:attr", called with args. grid: lists of values
+    expanded as a cartesian product, one component per combination.
+    """
+    factory: str
+    args: dict[str, Any] = field(default_factory=dict)
+    grid: dict[str, list[Any]] = field(default_factory=dict)
+
+    def build(self) -> list[Any]:
+        fn = _resolve(self.factory)
+        keys = list(self.grid)
+        return [
+            fn(**self.args, **dict(zip(keys, combo)))
+            for combo in itertools.product(*(self.grid[k] for k in keys))
+        ]
+
+
+@dataclass(frozen=True)
+class ExperimentSpec:
+    """
+    Parsed experiment file:
+
+        [domain]                      # factory, args
+        [[policies]]                  # factory, args, grid (one or more)
+        [[metrics]]                   # factory, args
+        [seeds]                       # start/stop[/step] or values = [...]
+        [run]                         # RunConfig fields; [run.sampling] holds
+                                      # SeedPlan fields
+        [[pareto]]                    # MetricSpec fields (optional)
+        [backend]                     # kind, workers, streaming, shared_table,
+                                      # cache, store, host, port, lease_seeds,
+                                      # lease_timeout, token, local_workers
+    """
+    domain: Component
+    policies: tuple[Component, ...]
+    metrics: tuple[Component, ...]
+    seeds: tuple[int, ...]
+    run: dict[str, Any]
+    pareto: tuple[dict[str, Any], ...] | None = None
+    backend: dict[str, Any] = field(default_factory=dict)
+
+
+def _resolve(path: str) -> Any:
+    module, _, attr = path.partition(":")
+    if not attr:
+        raise SpecError(f"Expected 'package.module:attr', got {path!r}")
+    try:
+        obj: Any = import_module(module)
+        for part in attr.split("."):
+            obj = getattr(obj, part)
+    except (ImportError, AttributeError) as exc:
+        raise SpecError(f"Cannot import {path!r}: {exc}") from exc
+    return obj
+
+
+def _build(cls: type, raw: Any, where: str) -> Any:
+    """
+    cls(**raw) for a spec dataclass, with unknown or missing keys and
+    rejected values reported as SpecError.
+    """
+    if not isinstance(raw, dict):
+        raise SpecError(f"{where} must be a table")
+    known = {f.name for f in fields(cls)}
+    unknown = set(raw) - known
+    if unknown:
+        raise SpecError(f"{where}: unknown keys {sorted(unknown)}; expected some of {sorted(known)}")
+    required = {
+        f.name for f in fields(cls) if f.default is MISSING and f.default_factory is MISSING
+    }
+    missing = required - set(raw)
+    if missing:
+        raise SpecError(f"{where}: missing keys {sorted(missing)}")
+    try:
+        return cls(**raw)
+    except (TypeError, ValueError) as exc:
+        raise SpecError(f"{where}: {exc}") from exc
+
+
+def _component(raw: Any, where: str) -> Component:
+    if not isinstance(raw, dict) or "factory" not in raw:
+        raise SpecError(f"{where} needs a 'factory' import path")
+    unknown = set(raw) - {"factory", "args", "grid"}
+    if unknown:
+        raise SpecError(f"{where}: unknown keys {sorted(unknown)}")
+    return Component(factory=raw["factory"], args=raw.get("args", {}), grid=raw.get("grid", {}))
+
+
+def _seeds(raw: Any) -> tuple[int, ...]:
+    if not isinstance(raw, (list, dict)):
+        raise SpecError("[seeds] must be a table or a list")
+    if isinstance(raw, dict) and "values" not in raw and "stop" not in raw:
+        raise SpecError("[seeds] needs 'stop' (and optionally 'start', 'step') or 'values'")
+    try:
+        if isinstance(raw, list):
+            return tuple(int(s) for s in raw)
+        if "values" in raw:
+            return tuple(int(s) for s in raw["values"])
+        return tuple(range(raw.get("start", 0), raw["stop"], raw.get("step", 1)))
+    except (TypeError, ValueError) as exc:
+        raise SpecError(f"[seeds]: {exc}") from exc
+
+
+# [backend] keys each kind uses
+_BACKEND_KEYS: dict[str, frozenset[str]] = {
+    "serial": frozenset({"kind", "streaming", "shared_table", "cache", "store"}),
+    "process": frozenset({"kind", "workers", "streaming", "shared_table", "cache", "store"}),
+    "distributed": frozenset(
+        {"kind", "host", "port", "lease_seeds", "lease_timeout", "token", "local_workers"}
+    ),
+}
+
+
+def _backend(raw: Any) -> dict[str, Any]:
+    if not isinstance(raw, dict):
+        raise SpecError("[backend] must be a table")
+    kind = raw.get("kind", "serial")
+    if kind not in _BACKEND_KEYS:
+        raise SpecError(f"Unknown backend {kind!r}")
+    unknown = set(raw) - _BACKEND_KEYS[kind]
+    if unknown:
+        raise SpecError(
+            f"[backend]: unknown keys {sorted(unknown)} for kind = {kind!r}; "
+            f"expected some of {sorted(_BACKEND_KEYS[kind])}"
+        )
+    return dict(raw)
+
+
+def parse_spec(raw: dict[str, Any]) -> ExperimentSpec:
+    if not isinstance(raw, dict):
+        raise SpecError("The spec must be a table of sections")
+    for key in ("domain", "policies", "metrics", "seeds", "run"):
+        if key not in raw:
+            raise SpecError(f"Missing [{key}] section")
+    backend = _backend(raw.get("backend", {}))
+    domain = _component(raw["domain"], "[domain]")
+    if domain.grid:
+        raise SpecError("[domain] builds a single domain and cannot have a grid")
+    return ExperimentSpec(
+        domain=domain,
+        policies=tuple(_component(p, "[[policies]]") for p in raw["policies"]),
+        metrics=tuple(_component(m, "[[metrics]]") for m in raw["metrics"]),
+        seeds=_seeds(raw["seeds"]),
+        run=dict(raw["run"]),
+        pareto=tuple(raw["pareto"]) if "pareto" in raw else None,
+        backend=backend,
+    )
+
+
+def load_spec(path: str | Path) -> ExperimentSpec:
+    """
+    Reads a .toml spec, or .yaml/.yml when PyYAML is installed.
+    """
+    path = Path(path)
+    if path.suffix in (".yaml", ".yml"):
+        try:
+            import yaml
+        except ImportError as exc:
+            raise SpecError("YAML specs need PyYAML; use TOML or `pip install pyyaml`") from exc
+        with open(path, encoding="utf-8") as f:
+            try:
+                raw = yaml.safe_load(f)
+            except yaml.YAMLError as exc:
+                raise SpecError(f"{path}: invalid YAML: {exc}") from exc
+    else:
+        import tomllib
+
+        with open(path, "rb") as f:
+            try:
+                raw = tomllib.load(f)
+            except tomllib.TOMLDecodeError as exc:
+                raise SpecError(f"{path}: invalid TOML: {exc}") from exc
+    return parse_spec(raw)
+
+
+def run_spec(spec: ExperimentSpec, *, workers: int | None = None) -> Any:
+    """
+    Builds the spec's objects and evaluates them on its backend.
+    Returns an EvaluationResult.
+    """
+    from policy_eval.core.rng import SeedPlan
+    from policy_eval.core.types import RunConfig
+    from policy_eval.engine.evaluate import evaluate
+    from policy_eval.engine.pareto import MetricSpec
+
+    (domain,) = spec.domain.build()
+    policies = [p for c in spec.policies for p in c.build()]
+    metrics = [m for c in spec.metrics for m in c.build()]
+    run = dict(spec.run)
+    if "sampling" in run:
+        run["sampling"] = _build(SeedPlan, run["sampling"], "[run.sampling]")
+    cfg = _build(RunConfig, run, "[run]")
+    pareto = None
+    if spec.pareto is not None:
+        pareto = [_build(MetricSpec, p, "[[pareto]]") for p in spec.pareto]
+
+    backend = spec.backend
+    kind: Backend = backend.get("kind", "serial")
+    if kind == "serial" and workers is not None:
+        raise SpecError('--workers needs kind = "process" or "distributed" in [backend]')
+    grid = dict(domain=domain, policies=policies, metrics=metrics, seeds=spec.seeds, cfg=cfg)
+
+    if kind == "distributed":
+        return _run_distributed(grid, pareto, backend, workers)
+
+    cache = store = None
+    if "cache" in backend:
+        from policy_eval.engine.cache import TrialCache
+
+        cache = TrialCache(Path(backend["cache"]))
+    if "store" in backend:
+        from policy_eval.engine.store import TrajectoryStore
+
+        store = TrajectoryStore(Path(backend["store"]))
+    if kind == "process":
+        workers = workers or backend.get("workers")
+    try:
+        return evaluate(
+            pareto_metrics=pareto,
+            workers=workers,
+            streaming=bool(backend.get("streaming", False)),
+            shared_table=bool(backend.get("shared_table", False)),
+            cache=cache,
+            store=store,
+            **grid,
+        )
+    finally:
+        if store is not None:
+            store.close()
+
+
+def _run_distributed(
+    grid: dict[str, Any], pareto: Any, backend: dict[str, Any], workers: int | None
+) -> Any:
+    import multiprocessing
+
+    from policy_eval.engine.distributed import Coordinator, run_worker
+
+    options = {
+        k: backend[k]
+        for k in ("host", "port", "lease_seeds", "lease_timeout", "token")
+        if k in backend
+    }
+    local = workers if workers is not None else backend.get("local_workers", 0)
+    with Coordinator(**options, **grid) as coordinator:
+        print(f"coordinator listening on {coordinator.url}", file=sys.stderr, flush=True)
+        procs = [
+            multiprocessing.Process(
+                target=run_worker, args=(coordinator.url,), kwargs={"token": options.get("token")}
+            )
+            for _ in range(local)
+        ]
+        for p in procs:
+            p.start()
+        coordinator.wait()
+        for p in procs:
+            p.join()
+        return coordinator.result(pareto_metrics=pareto)
+
+
+def _report(result: Any) -> str:
+    rows = [("policy", "metric", "n", "mean", "std", "p10", "p50", "p90")]
+    for (policy, metric), s in result.summaries.items():
+        rows.append(
+            (policy, metric, str(s.n), *(f"{v:.6g}" for v in (s.mean, s.std, s.p10, s.p50, s.p90)))
+        )
+    widths = [max(len(r[i]) for r in rows) for i in range(len(rows[0]))]
+    lines = ["  ".join(c.ljust(w) for c, w in zip(r, widths)).rstrip() for r in rows]
+    if result.pareto is not None:
+        lines.append("")
+        lines.append("pareto front: " + ", ".join(result.pareto))
+    return "\n".join(lines)
+
+
+def _cmd_run(args: argparse.Namespace) -> int:
+    result = run_spec(load_spec(args.spec), workers=args.workers)
+    print(_report(result))
+    if args.out is not None:
+        result.save(args.out)
+    if args.json is not None:
+        payload = {
+            "summaries": [
+                {"policy": p, "metric": m, **s.__dict__}
+                for (p, m), s in result.summaries.items()
+            ],
+            "pareto": result.pareto,
+        }
+        Path(args.json).write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    return 0
+
+
+def _cmd_worker(args: argparse.Namespace) -> int:
+    from policy_eval.engine.distributed import run_worker
+
+    done = run_worker(args.url, token=args.token)
+    print(f"completed {done} leases", file=sys.stderr)
+    return 0
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="policy-eval", description="Evaluate policies from an experiment spec."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="run an experiment spec (.toml, or .yaml with PyYAML)")
+    run.add_argument("spec", help="path to the experiment spec")
+    run.add_argument("--workers", type=int, default=None, help="override the backend's workers")
+    run.add_argument("--out", default=None, help="save the EvaluationResult (pickle) here")
+    run.add_argument("--json", default=None, help="write summaries and Pareto front as JSON")
+    run.set_defaults(func=_cmd_run)
+
+    worker = commands.add_parser("worker", help="pull leases from a distributed coordinator")
+    worker.add_argument("url", help="coordinator URL, e.g. http://host:8765")
+    worker.add_argument("--token", default=None, help="shared token, if the coordinator set one")
+    worker.set_defaults(func=_cmd_worker)
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = _parser().parse_args(argv)
+    try:
+        return args.func(args)
+    except SpecError as exc:
+        print(f"policy-eval: {exc}", file=sys.stderr)
+        return 2
@@ -1,9 +1,312 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 import hashlib
+from typing import Any, Literal
 
 import numpy as np
+from numpy.random.bit_generator import ISeedSequence
+
+
+RngScheme = Literal["v1", "v2"]
+RNG_SCHEMES: tuple[RngScheme, ...] = ("v1", "v2")
+
+SamplingMode = Literal["independent", "antithetic", "stratified", "sobol"]
+SAMPLING_MODES: tuple[SamplingMode, ...] = ("independent", "antithetic", "stratified", "sobol")
+
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+_MIX1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX2 = np.uint64(0x94D049BB133111EB)
+
+
+def _mix64(z: np.ndarray) -> np.ndarray:
+    """
+    splitmix64 finalizer, elementwise on uint64 arrays (wrapping arithmetic).
+    """
+    z = (z ^ (z >> np.uint64(30))) * _MIX1
+    z = (z ^ (z >> np.uint64(27))) * _MIX2
+    return z ^ (z >> np.uint64(31))
+
+
+class _DigestSeed(ISeedSequence):
+    """
+    Seeds a bit generator straight from a hash digest.
+    The digest is already well mixed, so SeedSequence's extra hashing
+    (the bulk of generator construction cost) is skipped.
+    """
+
+    __slots__ = ("_digest",)
+
+    def __init__(self, digest: bytes) -> None:
+        self._digest = digest
+
+    def generate_state(self, n_words: int, dtype=np.uint32) -> np.ndarray:
+        dt = np.dtype(dtype)
+        need = n_words * dt.itemsize
+        buf = self._digest
+        while len(buf) < need:
+            buf += hashlib.blake2b(buf, digest_size=64).digest()
+        return np.frombuffer(buf, dtype=dt, count=n_words).copy()
+
+
+# Joe & Kuo (2008) direction numbers for Sobol dimensions 2..16:
+# (degree s, coefficients a, initial m_1..m_s). Dimension 1 is van der Corput.
+_SOBOL_PARAMS = (
+    (1, 0, (1,)),
+    (2, 1, (1, 3)),
+    (3, 1, (1, 3, 1)),
+    (3, 2, (1, 1, 1)),
+    (4, 1, (1, 1, 3, 3)),
+    (4, 4, (1, 3, 5, 13)),
+    (5, 2, (1, 1, 5, 5, 17)),
+    (5, 4, (1, 1, 5, 5, 5)),
+    (5, 7, (1, 1, 7, 11, 19)),
+    (5, 11, (1, 1, 5, 1, 1)),
+    (5, 13, (1, 1, 1, 3, 11)),
+    (5, 14, (1, 3, 5, 5, 31)),
+    (6, 1, (1, 3, 3, 9, 7, 49)),
+    (6, 13, (1, 1, 1, 15, 21, 21)),
+    (6, 16, (1, 3, 1, 13, 27, 49)),
+)
+SOBOL_MAX_DIMS = len(_SOBOL_PARAMS) + 1
+_SOBOL_BITS = 32
+_MIRROR = 1.0 - 2.0**-53  # maps random()'s lattice k * 2**-53 onto itself
+
+
+@dataclass(frozen=True)
+class SeedPlan:
+    """
+    Lays seeds out for variance reduction (RunConfig.sampling).
+
+    - "independent": every seed is an independent draw.
+    - "antithetic": seeds 2k and 2k + 1 share every stream; the odd seed's
+      draws are mirrored (u -> 1 - u, z -> -z, see _MirroredGenerator).
+    - "stratified": each block of `block` consecutive seeds is a Latin
+      hypercube over the first `dims` uniforms drawn from the "init" fork.
+    - "sobol": as "stratified", with scrambled Sobol points (block must be
+      a power of two, dims at most SOBOL_MAX_DIMS).
+
+    Only "antithetic" changes streams other than "init". Pairs and blocks
+    are independent replicates (see group), which engine.variance uses to
+    estimate standard errors. key seeds the permutations and scrambles.
+    """
+    mode: SamplingMode = "independent"
+    block: int = 64
+    dims: int = 8
+    key: int = 0
+
+    def __post_init__(self) -> None:
+        if self.mode not in SAMPLING_MODES:
+            raise ValueError(f"Unknown sampling mode {self.mode!r}; expected one of {SAMPLING_MODES}")
+        if self.block < 2 or self.dims < 1:
+            raise ValueError("SeedPlan needs block >= 2 and dims >= 1")
+        if self.mode == "sobol":
+            if self.block & (self.block - 1):
+                raise ValueError(f"Sobol blocks must be a power of two, got {self.block}")
+            if self.dims > SOBOL_MAX_DIMS:
+                raise ValueError(f"Sobol points have at most {SOBOL_MAX_DIMS} dims")
+
+    def group(self, seed: int) -> int:
+        """
+        Replicate a seed belongs to: its antithetic pair or design block.
+        """
+        if self.mode == "antithetic":
+            return seed // 2
+        if self.mode in ("stratified", "sobol"):
+            return seed // self.block
+        return seed
+
+    def stream_seed(self, seed: int) -> int:
+        return seed & ~1 if self.mode == "antithetic" else seed
+
+    def point(self, seed: int) -> np.ndarray | None:
+        """
+        The seed's design point in [0, 1)^dims, or None for modes without one.
+        """
+        if self.mode not in ("stratified", "sobol"):
+            return None
+        return _design(self, seed // self.block)[seed % self.block]
+
+    def wrap(self, gen: np.random.Generator, seed: int, keys: tuple[object, ...]) -> Any:
+        if self.mode == "antithetic" and seed & 1:
+            return _MirroredGenerator(gen)
+        if keys == ("init",) and self.mode in ("stratified", "sobol"):
+            return _DesignGenerator(gen, self.point(seed))
+        return gen
+
+
+@lru_cache(maxsize=64)
+def _design(plan: SeedPlan, block: int) -> np.ndarray:
+    """
+    Design points of one block, shape (plan.block, plan.dims); each block
+    is independently randomized.
+    """
+    rng = RNG(plan.key).fork(plan.mode, block)
+    n, d = plan.block, plan.dims
+    if plan.mode == "stratified":
+        strata = np.stack([rng.permutation(n) for _ in range(d)], axis=1)
+        points = (strata + rng.random((n, d))) / n
+    else:
+        points = _sobol(n, d, rng)
+    points.flags.writeable = False
+    return points
+
+
+def _sobol(n: int, d: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    First n Sobol points in d dims, with a random linear matrix scramble
+    and digital shift per dimension.
+    """
+    bits = _SOBOL_BITS
+    v = np.zeros((d, bits), dtype=np.uint64)
+    v[0] = 1 << np.arange(bits - 1, -1, -1, dtype=np.uint64)
+    for j, (s, a, m) in enumerate(_SOBOL_PARAMS[: d - 1], start=1):
+        for k in range(bits):
+            if k < s:
+                v[j, k] = m[k] << (bits - 1 - k)
+            else:
+                x = v[j, k - s] ^ (v[j, k - s] >> np.uint64(s))
+                for i in range(1, s):
+                    if (a >> (s - 1 - i)) & 1:
+                        x ^= v[j, k - i]
+                v[j, k] = x
+
+    # scramble: output bit r is the parity of input bits 0..r under a random
+    # unit lower-triangular matrix (bit 0 is the most significant)
+    shifts = np.arange(bits - 1, -1, -1, dtype=np.uint64)
+    v_bits = (v[:, :, None] >> shifts) & np.uint64(1)  # (d, direction, bit)
+    lower = np.tril(rng.integers(0, 2, size=(d, bits, bits), dtype=np.uint64), -1)
+    lower += np.eye(bits, dtype=np.uint64)
+    scrambled = np.einsum("drb,dkb->dkr", lower, v_bits) & np.uint64(1)
+    v = (scrambled << shifts).sum(axis=2, dtype=np.uint64)
+
+    gray = np.arange(n, dtype=np.uint64)
+    gray ^= gray >> np.uint64(1)
+    x = np.zeros((n, d), dtype=np.uint64)
+    for k in range(max(1, int(n - 1).bit_length())):
+        on = ((gray >> np.uint64(k)) & np.uint64(1)).astype(bool)
+        x[on] ^= v[:, k]
+    x ^= rng.integers(0, 2**bits, size=d, dtype=np.uint64)
+    return (x.astype(np.float64) + 0.5) / 2.0**bits
+
+
+def _ndtri(u: np.ndarray) -> np.ndarray:
+    """
+    Standard normal quantile (Acklam's rational approximation, relative
+    error below 1.2e-9).
+    """
+    a = (-3.969683028665376e01, 2.209460984245205e02, -2.759285104469687e02,
+         1.383577518672690e02, -3.066479806614716e01, 2.506628277459239e00)
+    b = (-5.447609879822406e01, 1.615858368580409e02, -1.556989798598866e02,
+         6.680131188771972e01, -1.328068155288572e01)
+    c = (-7.784894002430293e-03, -3.223964580411365e-01, -2.400758277161838e00,
+         -2.549732539343734e00, 4.374664141464968e00, 2.938163982698783e00)
+    e = (7.784695709041462e-03, 3.224671290700398e-01, 2.445134137142996e00,
+         3.754408661907416e00)
+    u = np.asarray(u, dtype=np.float64)
+    out = np.empty_like(u)
+    lo = u < 0.02425
+    hi = u > 1 - 0.02425
+    mid = ~(lo | hi)
+
+    q = u[mid] - 0.5
+    r = q * q
+    num = (((((a[0] * r + a[1]) * r + a[2]) * r + a[3]) * r + a[4]) * r + a[5]) * q
+    den = ((((b[0] * r + b[1]) * r + b[2]) * r + b[3]) * r + b[4]) * r + 1
+    out[mid] = num / den
+
+    for mask, sign, tail in ((lo, 1.0, u[lo]), (hi, -1.0, 1 - u[hi])):
+        q = np.sqrt(-2 * np.log(tail))
+        num = ((((c[0] * q + c[1]) * q + c[2]) * q + c[3]) * q + c[4]) * q + c[5]
+        den = (((e[0] * q + e[1]) * q + e[2]) * q + e[3]) * q + 1
+        out[mask] = sign * num / den
+    return out
+
+
+class _MirroredGenerator:
+    """
+    Antithetic twin of a Generator: same underlying draws, mirrored.
+    random/uniform map u -> 1 - u, integers x -> low + high - x, normal
+    x -> 2 * loc - x. Other methods return the twin's draws unchanged.
+    """
+
+    def __init__(self, gen: np.random.Generator) -> None:
+        self._gen = gen
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._gen, name)
+
+    def random(self, size: Any = None, **kwargs: Any) -> Any:
+        return _MIRROR - self._gen.random(size, **kwargs)
+
+    def uniform(self, low: Any = 0.0, high: Any = 1.0, size: Any = None) -> Any:
+        return low + (high - low) * (_MIRROR - self._gen.random(size))
+
+    def integers(
+        self, low: Any, high: Any = None, size: Any = None, dtype: Any = np.int64, endpoint: bool = False
+    ) -> Any:
+        x = self._gen.integers(low, high, size=size, dtype=dtype, endpoint=endpoint)
+        if high is None:
+            low, high = 0, low
+        top = high if endpoint else high - 1
+        return (low + top - x).astype(dtype) if size is not None else type(x)(low + top - x)
+
+    def normal(self, loc: Any = 0.0, scale: Any = 1.0, size: Any = None) -> Any:
+        return 2 * loc - self._gen.normal(loc, scale, size)
+
+    def standard_normal(self, size: Any = None, **kwargs: Any) -> Any:
+        return -self._gen.standard_normal(size, **kwargs)
+
+
+class _DesignGenerator:
+    """
+    Generator whose first uniforms are the coordinates of a design point,
+    then the wrapped generator's. random, uniform, integers, normal,
+    standard_normal and exponential invert their CDF at those uniforms;
+    other methods use the wrapped generator directly.
+    """
+
+    def __init__(self, gen: np.random.Generator, point: np.ndarray) -> None:
+        self._gen = gen
+        self._point = point
+        self._used = 0
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._gen, name)
+
+    def _uniforms(self, size: Any) -> Any:
+        n = 1 if size is None else int(np.prod(size))
+        take = self._point[self._used : self._used + n]
+        self._used += len(take)
+        u = take if len(take) == n else np.concatenate((take, self._gen.random(n - len(take))))
+        return float(u[0]) if size is None else u.reshape(size)
+
+    def random(self, size: Any = None) -> Any:
+        return self._uniforms(size)
+
+    def uniform(self, low: Any = 0.0, high: Any = 1.0, size: Any = None) -> Any:
+        return low + (high - low) * self._uniforms(size)
+
+    def integers(
+        self, low: Any, high: Any = None, size: Any = None, dtype: Any = np.int64, endpoint: bool = False
+    ) -> Any:
+        if high is None:
+            low, high = 0, low
+        if endpoint:
+            high = high + 1
+        x = np.floor(low + (high - low) * np.asarray(self._uniforms(size)))
+        return x.astype(dtype) if size is not None else np.dtype(dtype).type(x)
+
+    def normal(self, loc: Any = 0.0, scale: Any = 1.0, size: Any = None) -> Any:
+        return loc + scale * self.standard_normal(size)
+
+    def standard_normal(self, size: Any = None) -> Any:
+        z = _ndtri(np.atleast_1d(self._uniforms(size)))
+        return float(z[0]) if size is None else z.reshape(size)
+
+    def exponential(self, scale: Any = 1.0, size: Any = None) -> Any:
+        return -scale * np.log1p(-np.asarray(self._uniforms(size)))[()]
 
 
 @dataclass(frozen=True)
@@ -13,21 +316,70 @@ class RNG:
 
     Key idea: allow deterministic substreams so randomness is invariant to
     call order and policy-dependent branching.
+
+    scheme selects how substreams are derived. Streams differ between
+    schemes, so results are only comparable within one scheme:
+    - "v1": blake2b-64 of the keys seeds default_rng (PCG64 via SeedSequence).
+    - "v2": blake2b-256 of the keys seeds SFC64 directly; several times
+      cheaper per fork.
+
+    plan: variance-reduction layout of seeds (see SeedPlan); None draws
+    every seed independently.
     """
     seed: int
+    scheme: RngScheme = "v1"
+    plan: SeedPlan | None = None
+
+    def __post_init__(self) -> None:
+        if self.scheme not in RNG_SCHEMES:
+            raise ValueError(f"Unknown rng scheme {self.scheme!r}; expected one of {RNG_SCHEMES}")
 
     def generator(self) -> np.random.Generator:
         return np.random.default_rng(self.seed)
 
-    def fork(self, *keys: object) -> np.random.Generator:
+    def key(self, *keys: object) -> int:
         """
-        Create a deterministic sub-RNG from (seed, keys...).
-        Same seed+keys => same stream. Policy name is NOT included.
+        Stable 64-bit key for (seed, keys...), e.g. to name an actor's stream.
         """
+        seed = self.seed if self.plan is None else self.plan.stream_seed(self.seed)
         h = hashlib.blake2b(digest_size=8)
-        h.update(str(self.seed).encode("utf-8"))
+        h.update(str(seed).encode("utf-8"))
         for k in keys:
             h.update(b"|")
             h.update(str(k).encode("utf-8"))
-        sub_seed = int.from_bytes(h.digest(), "big", signed=False)
-        return np.random.default_rng(sub_seed)
+        return int.from_bytes(h.digest(), "big", signed=False)
+
+    def uniforms(self, stream_keys: np.ndarray, t: int, k: int) -> np.ndarray:
+        """
+        Counter-based block of uniforms in [0, 1), shape (len(stream_keys), k).
+
+        Row i depends only on (stream_keys[i], t, column), never on the row's
+        position, so draws are invariant to how streams are ordered. Costs a
+        few array ops regardless of the number of streams.
+        """
+        keys = np.asarray(stream_keys, dtype=np.uint64)
+        step = _mix64(np.array([t], dtype=np.uint64) + _GOLDEN)
+        cols = np.arange(1, k + 1, dtype=np.uint64) * _GOLDEN
+        z = _mix64(_mix64(keys ^ step)[:, None] + cols[None, :])
+        u = (z >> np.uint64(11)).astype(np.float64) * (1.0 / (1 << 53))
+        if self.plan is not None and self.plan.mode == "antithetic" and self.seed & 1:
+            return _MIRROR - u
+        return u
+
+    def fork(self, *keys: object) -> np.random.Generator:
+        """
+        Create a deterministic sub-RNG from (seed, keys...).
+        Same seed+keys => same stream. Policy name is NOT included.
+        With a plan the stream may come back mirrored or design-driven
+        (see SeedPlan.wrap).
+        """
+        if self.scheme == "v2":
+            seed = self.seed if self.plan is None else self.plan.stream_seed(self.seed)
+            msg = "|".join([str(seed), *map(str, keys)]).encode("utf-8")
+            digest = hashlib.blake2b(msg, digest_size=32, person=b"policy-eval-v2").digest()
+            gen = np.random.Generator(np.random.SFC64(_DigestSeed(digest)))
+        else:
+            gen = np.random.default_rng(self.key(*keys))
+        if self.plan is None:
+            return gen
+        return self.plan.wrap(gen, self.seed, keys)
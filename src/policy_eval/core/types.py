@@ -1,13 +1,31 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Any
 
+import numpy as np
+
+from policy_eval.core.rng import RngScheme, SeedPlan
+
 
 @dataclass(frozen=True)
 class RunConfig:
-    """Generic run settings (domain-agnostic)."""
+    """
+    Generic run settings (domain-agnostic).
+
+    rng_scheme: substream derivation scheme (see core.rng.RNG). Keep "v1"
+    to reproduce results produced before "v2" existed.
+    warmup: number of leading steps during which the policy is not
+    consulted (transition gets policy_action=None). That prefix is the
+    same for every policy, so run_experiment simulates it once per seed.
+    sampling: variance-reduction layout of the seeds (see core.rng.SeedPlan);
+    None treats every seed as an independent draw.
+    """
     horizon: int
+    rng_scheme: RngScheme = "v1"
+    warmup: int = 0
+    sampling: SeedPlan | None = None
 
 
 @dataclass(frozen=True)
@@ -28,3 +46,42 @@ class Trajectory:
     """
     events: tuple[Event, ...]
     final_state: Any
+
+
+@dataclass(frozen=True, eq=False)
+class ColumnarTrajectory:
+    """
+    Trajectory with fixed-schema numeric payloads, one row per timestep.
+
+    data is a structured array with a "t" field plus one field per payload
+    column. Metrics can reduce columns directly; events is a lazily built
+    compatibility view with dict payloads. Immutable by design.
+    """
+    data: np.ndarray
+    final_state: Any
+
+    def __post_init__(self) -> None:
+        self.data.flags.writeable = False
+
+    @property
+    def columns(self) -> dict[str, np.ndarray]:
+        return {name: self.data[name] for name in self.data.dtype.names}
+
+    @cached_property
+    def events(self) -> tuple[Event, ...]:
+        fields = [f for f in self.data.dtype.names if f != "t"]
+        return tuple(
+            Event(t=int(row["t"]), payload={f: row[f].item() for f in fields})
+            for row in self.data
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ColumnarTrajectory):
+            return NotImplemented
+        return (
+            self.data.dtype == other.data.dtype
+            and np.array_equal(self.data, other.data)
+            and self.final_state == other.final_state
+        )
+
+    __hash__ = None  # type: ignore[assignment]
@@ -3,6 +3,8 @@ from __future__ import annotations
 from collections import defaultdict
 from dataclasses import dataclass
 
+import numpy as np
+
 from policy_eval.engine.experiment import TrialResult
 
 
@@ -26,8 +28,12 @@ def summarize(trials: list[TrialResult]) -> dict[tuple[str, str], SummaryStats]:
 
     out: dict[tuple[str, str], SummaryStats] = {}
     for key, vals in buckets.items():
-        n = len(vals)
-        mean = sum(vals) / n
-        out[key] = SummaryStats(n=n, mean=mean, min=min(vals), max=max(vals))
+        arr = np.asarray(vals, dtype=np.float64)
+        out[key] = SummaryStats(
+            n=arr.size,
+            mean=float(arr.mean()),
+            min=float(arr.min()),
+            max=float(arr.max()),
+        )
 
     return out
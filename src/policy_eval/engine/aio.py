@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+from typing import Any, Iterable
+
+from policy_eval.abstractions.domain import Domain
+from policy_eval.abstractions.metric import Metric
+from policy_eval.abstractions.policy import Policy
+from policy_eval.core.rng import RNG
+from policy_eval.core.types import RunConfig
+from policy_eval.engine.checkpoint import Checkpoint
+from policy_eval.engine.experiment import TrialResult, _score
+from policy_eval.engine.profile import Profiler, instrument
+from policy_eval.engine import simulator
+from policy_eval.engine.simulator import Prefix, RunResult
+
+
+async def _resolve(value: Any) -> Any:
+    # decide/act/act_batch may be plain methods or coroutines
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
+async def _drive(steps: simulator._StepGen, policy: Policy | None) -> Any:
+    """
+    Async twin of simulator._drive for generators built with awaitable=True.
+    A step's actor calls are gathered and their results taken in actor
+    order, so completion order cannot change the run.
+    """
+    try:
+        request = next(steps)
+        while True:
+            if isinstance(request, simulator._Await):
+                if request.batch:
+                    value = await _resolve(request.actions)
+                else:
+                    value = list(await asyncio.gather(*map(_resolve, request.actions)))
+            else:
+                value = await _resolve(policy.decide(request))  # type: ignore[union-attr]
+            request = steps.send(value)
+    except StopIteration as done:
+        return done.value
+
+
+async def simulate_prefix_async(
+    domain: Domain,
+    cfg: RunConfig,
+    seed: int,
+    *,
+    profiler: Profiler | None = None,
+) -> Prefix:
+    """
+    Async simulate_prefix: the policy-independent first cfg.warmup steps.
+    """
+    base: Any = RNG(seed, scheme=cfg.rng_scheme, plan=cfg.sampling)
+    if profiler is not None:
+        domain, _, base = instrument(domain, None, base, profiler, "(warmup)")
+    steps = simulator._begin_steps(domain, cfg, base, seed, None, awaitable=True)
+    state, events, warmup = await _drive(steps, None)
+    return Prefix(seed=seed, t=warmup, state=state, events=simulator._recorded(events))
+
+
+async def simulate_async(
+    domain: Domain,
+    policy: Policy,
+    cfg: RunConfig,
+    seed: int,
+    *,
+    prefix: Prefix | None = None,
+    profiler: Profiler | None = None,
+    checkpoint: Checkpoint | None = None,
+) -> RunResult:
+    """
+    simulate for I/O-bound policies and actors: decide, act and act_batch
+    may return awaitables. Actor calls within a timestep run concurrently.
+
+    Streams and options are the ones simulate uses, so a run matches its
+    synchronous counterpart exactly. Profiled decide/act times run until
+    the awaited result arrives.
+    """
+    domain, policy, base, run_checkpoint = simulator._prepare(
+        domain, policy, cfg, seed, profiler, checkpoint
+    )
+    steps = simulator._run_steps(domain, cfg, base, seed, prefix, run_checkpoint, awaitable=True)
+    state, events = await _drive(steps, policy)
+    return simulator._result(domain, policy, seed, state, events, run_checkpoint)
+
+
+async def run_experiment_async(
+    *,
+    domain: Domain,
+    policies: Iterable[Policy],
+    metrics: Iterable[Metric],
+    seeds: Iterable[int],
+    cfg: RunConfig,
+    concurrency: int = 32,
+    keep_runs: bool = True,
+    profiler: Profiler | None = None,
+) -> list[TrialResult]:
+    """
+    Async run_experiment: at most `concurrency` seeds are in flight, each
+    running its policies concurrently. Results come back in policy-major,
+    seed-minor order and equal the synchronous ones.
+
+    With cfg.warmup > 0 each seed's warm-up is simulated once and shared
+    by all policies.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    policies_list = list(policies)
+    metrics_list = list(metrics)
+    seeds_list = list(seeds)
+    limit = asyncio.Semaphore(concurrency)
+
+    async def trial(policy: Policy, seed: int, prefix: Prefix | None) -> TrialResult:
+        run = await simulate_async(domain, policy, cfg, seed, prefix=prefix, profiler=profiler)
+        return _score(run, metrics_list, keep_runs, profiler)
+
+    async def seed_trials(seed: int) -> list[TrialResult]:
+        async with limit:
+            prefix = None
+            if cfg.warmup > 0 and len(policies_list) > 1:
+                prefix = await simulate_prefix_async(domain, cfg, seed, profiler=profiler)
+            return list(await asyncio.gather(*(trial(p, seed, prefix) for p in policies_list)))
+
+    by_seed = await asyncio.gather(*(seed_trials(s) for s in seeds_list))
+    return [by_seed[si][pi] for pi in range(len(policies_list)) for si in range(len(seeds_list))]
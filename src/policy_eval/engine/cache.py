@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from dataclasses import MISSING, dataclass, field, fields, is_dataclass
+import hashlib
+import json
+import os
+from pathlib import Path
+import pickle
+import tempfile
+from typing import TYPE_CHECKING, Any, Iterator
+
+from policy_eval.core.types import RunConfig
+
+if TYPE_CHECKING:
+    from policy_eval.engine.simulator import RunResult
+
+
+@dataclass(frozen=True)
+class CachedTrial:
+    metrics: dict[str, float]
+    run: RunResult | None  # None when the cache does not store runs
+
+
+def _settings(obj: Any) -> Any:
+    """
+    The fields of a config dataclass that differ from their defaults,
+    recursively, so adding a field with a default keeps existing keys.
+    """
+    if not is_dataclass(obj) or isinstance(obj, type):
+        return obj
+    out = {}
+    for f in fields(obj):
+        value = getattr(obj, f.name)
+        if f.default is not MISSING and value == f.default:
+            continue
+        if f.default_factory is not MISSING and value == f.default_factory():
+            continue
+        out[f.name] = _settings(value)
+    return out
+
+
+def trial_key(domain: Any, policy: Any, seed: int, cfg: RunConfig) -> str:
+    """
+    Content address of one (domain, policy, seed, config) grid cell.
+
+    Domains and policies may expose a `version` attribute; bump it whenever
+    their behavior changes so stale entries stop matching. cfg contributes
+    its non-default settings (rng scheme and sampling plan included).
+    """
+    fingerprint = {
+        "domain": [domain.name, getattr(domain, "version", None)],
+        "policy": [policy.name, getattr(policy, "version", None)],
+        "seed": seed,
+        "cfg": _settings(cfg),
+    }
+    blob = json.dumps(fingerprint, sort_keys=True, default=repr).encode("utf-8")
+    return hashlib.sha256(blob).hexdigest()
+
+
+@dataclass
+class TrialCache:
+    """
+    Content-addressed on-disk cache of scored runs, keyed by trial_key.
+
+    Each entry is one pickle file holding metric values and, if store_runs,
+    the RunResult, so new metrics can be scored without re-simulating.
+    max_bytes bounds the directory size; least recently used entries are
+    evicted first.
+    """
+    directory: Path
+    max_bytes: int | None = None
+    store_runs: bool = True
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+
+    def __post_init__(self) -> None:
+        self.directory = Path(self.directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.pkl"
+
+    def get(self, key: str) -> CachedTrial | None:
+        """
+        The entry under key, or None when it is absent or cannot be loaded
+        (truncated, or pickled from classes that have since changed).
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                entry = pickle.load(f)
+        except Exception:
+            return None
+        if not isinstance(entry, CachedTrial):
+            return None
+        try:
+            os.utime(path)  # mark as recently used
+        except OSError:
+            pass  # evicted meanwhile
+        return entry
+
+    def put(self, key: str, entry: CachedTrial) -> None:
+        if not self.store_runs and entry.run is not None:
+            entry = CachedTrial(metrics=entry.metrics, run=None)
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+        # write-then-rename so readers never see a partial entry
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        out = []
+        for path in self.directory.glob("*/*.pkl"):
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            out.append((st.st_mtime, st.st_size, path))
+        return out
+
+    def size_bytes(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self) -> None:
+        """
+        Drop least recently used entries until the cache fits in max_bytes.
+        """
+        if self.max_bytes is None:
+            return
+        entries = sorted(self._entries(), key=lambda e: e[0])
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def runs(self) -> Iterator[RunResult]:
+        """
+        Every cached run, in no particular order.
+        """
+        for _, _, path in self._entries():
+            with open(path, "rb") as f:
+                entry = pickle.load(f)
+            if entry.run is not None:
+                yield entry.run
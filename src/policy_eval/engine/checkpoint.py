@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import os
+from pathlib import Path
+import pickle
+import tempfile
+from typing import Any
+
+import numpy as np
+
+from policy_eval.core.types import Event, RunConfig
+from policy_eval.engine.cache import trial_key
+
+
+@dataclass(frozen=True)
+class Checkpoint:
+    """
+    Snapshot a run every `every` steps into directory, and resume from the
+    latest snapshot when the same (domain, policy, seed, cfg) run is
+    simulated again.
+
+    Each snapshot holds t, the serialized state (domain.serialize_state if
+    provided, else pickle) and the length of the run's event log, which
+    is appended to incrementally rather than rewritten. keep=False removes
+    the files once the run completes.
+
+    Only the run itself (t, state and events) is restored. Policies and
+    actors that keep mutable state of their own, outside the domain
+    state, are not snapshotted: a resumed run equals an uninterrupted one
+    only if their behavior depends on the domain state alone.
+    """
+    directory: Path
+    every: int
+    keep: bool = False
+
+    def __post_init__(self) -> None:
+        if self.every < 1:
+            raise ValueError("Checkpoint.every must be at least 1")
+        object.__setattr__(self, "directory", Path(self.directory))
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    t: int
+    state: Any
+    events: list[Event] | np.ndarray  # structured rows for columnar domains
+
+
+def _serialize(domain: Any, state: Any) -> bytes:
+    serialize = getattr(domain, "serialize_state", None)
+    if serialize is not None:
+        return serialize(state)
+    return pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _restore(domain: Any, blob: bytes) -> Any:
+    restore = getattr(domain, "restore_state", None)
+    if restore is not None:
+        return restore(blob)
+    return pickle.loads(blob)
+
+
+class RunCheckpoint:
+    """
+    Checkpoint files of one run: <key>.ckpt (the latest snapshot, replaced
+    atomically) and <key>.events (append-only event log).
+    """
+
+    def __init__(
+        self,
+        checkpoint: Checkpoint,
+        domain: Any,
+        policy: Any,
+        seed: int,
+        cfg: RunConfig,
+        row_dtype: np.dtype | None = None,
+    ) -> None:
+        checkpoint.directory.mkdir(parents=True, exist_ok=True)
+        key = trial_key(domain, policy, seed, cfg)
+        self.every = checkpoint.every
+        self.keep = checkpoint.keep
+        self.snap_path = checkpoint.directory / f"{key}.ckpt"
+        self.log_path = checkpoint.directory / f"{key}.events"
+        self.row_dtype = row_dtype
+        self.logged = 0  # events already in the log
+        self.log_bytes = 0
+
+    def load(self, domain: Any) -> Snapshot | None:
+        """
+        The latest snapshot, or None (and no leftover files) when there is
+        none or its event log is missing or shorter than recorded.
+        """
+        try:
+            with open(self.snap_path, "rb") as f:
+                snap = pickle.load(f)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            # a log written before the first snapshot would offset the next one
+            self.log_path.unlink(missing_ok=True)
+            return None
+        n, nbytes = snap["events"], snap["log_bytes"]
+        try:
+            complete = self.log_path.stat().st_size >= nbytes
+        except FileNotFoundError:
+            complete = False
+        if not complete:
+            self.snap_path.unlink(missing_ok=True)
+            self.log_path.unlink(missing_ok=True)
+            return None
+        # drop whatever was logged after the snapshot was taken
+        with open(self.log_path, "r+b") as log:
+            log.truncate(nbytes)
+            log.seek(0)
+            if self.row_dtype is not None:
+                events: list[Event] | np.ndarray = np.fromfile(log, dtype=self.row_dtype, count=n)
+            else:
+                events = []
+                while log.tell() < nbytes:
+                    events.extend(pickle.load(log))
+        self.logged, self.log_bytes = n, nbytes
+        return Snapshot(t=snap["t"], state=_restore(domain, snap["state"]), events=events)
+
+    def save(self, domain: Any, t: int, state: Any, events: Any) -> None:
+        """
+        events: every event so far (a list, or structured rows).
+        """
+        with open(self.log_path, "ab") as log:
+            new = events[self.logged :]
+            if self.row_dtype is not None:
+                log.write(np.ascontiguousarray(new).tobytes())
+            elif len(new):
+                pickle.dump(list(new), log, protocol=pickle.HIGHEST_PROTOCOL)
+            log.flush()
+            os.fsync(log.fileno())
+            self.log_bytes = log.tell()
+        self.logged = len(events)
+
+        snap = {
+            "t": t,
+            "state": _serialize(domain, state),
+            "events": self.logged,
+            "log_bytes": self.log_bytes,
+        }
+        fd, tmp = tempfile.mkstemp(dir=self.snap_path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(snap, f, protocol=pickle.HIGHEST_PROTOCOL)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.snap_path)
+
+    def finish(self) -> None:
+        if self.keep:
+            return
+        for path in (self.snap_path, self.log_path):
+            path.unlink(missing_ok=True)
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable
+
+import numpy as np
+
+from policy_eval.engine.compare import DistSummary, summarize_array
+from policy_eval.engine.experiment import TrialResult
+
+
+@dataclass(frozen=True)
+class MetricTable:
+    """
+    Columnar trial metric values.
+
+    values[p, m, s] is metric m of policy p on seed s. Every policy must
+    have been run on the same seeds in the same order, so the seed axis
+    lines up across policies (common random numbers).
+    """
+    policies: tuple[str, ...]
+    metrics: tuple[str, ...]
+    seeds: tuple[int, ...]
+    values: np.ndarray
+
+    @property
+    def policy_index(self) -> dict[str, int]:
+        return {p: i for i, p in enumerate(self.policies)}
+
+    @property
+    def metric_index(self) -> dict[str, int]:
+        return {m: i for i, m in enumerate(self.metrics)}
+
+    @classmethod
+    def from_trials(cls, trials: Iterable[TrialResult]) -> MetricTable:
+        """
+        Builds the table in one pass over trials.
+        Raises ValueError if the trials do not form a complete, aligned grid.
+        """
+        metric_names: tuple[str, ...] | None = None
+        seeds_by_policy: dict[str, list[int]] = {}
+        rows_by_policy: dict[str, list[tuple[float, ...]]] = {}
+
+        for tr in trials:
+            names = tuple(mr.metric for mr in tr.metrics)
+            if metric_names is None:
+                metric_names = names
+            elif names != metric_names:
+                raise ValueError("Trials were scored with different metrics")
+            seeds_by_policy.setdefault(tr.policy, []).append(tr.seed)
+            rows_by_policy.setdefault(tr.policy, []).append(
+                tuple(mr.value for mr in tr.metrics)
+            )
+
+        if metric_names is None:
+            raise ValueError("Cannot build a MetricTable from no trials")
+
+        policies = tuple(seeds_by_policy)
+        seeds = seeds_by_policy[policies[0]]
+        if any(seeds_by_policy[p] != seeds for p in policies[1:]):
+            raise ValueError("Policies were not run on the same seeds")
+
+        # [policy, seed, metric] -> [policy, metric, seed]
+        values = np.asarray(
+            [rows_by_policy[p] for p in policies], dtype=np.float64
+        ).reshape(len(policies), len(seeds), len(metric_names))
+        return cls(
+            policies=policies,
+            metrics=metric_names,
+            seeds=tuple(seeds),
+            values=np.ascontiguousarray(values.transpose(0, 2, 1)),
+        )
+
+    def summarize(self) -> dict[tuple[str, str], DistSummary]:
+        """
+        Returns {(policy_name, metric_name) -> DistSummary}, computed for all
+        cells at once.
+        """
+        stats = summarize_array(self.values)
+        return {
+            (p, m): stats[i][j]
+            for i, p in enumerate(self.policies)
+            for j, m in enumerate(self.metrics)
+        }
+
+    def concat(self, other: MetricTable) -> MetricTable:
+        """
+        Joins two tables over the same metrics that share either their
+        policies (new seeds) or their seeds (new policies).
+        """
+        if other.metrics != self.metrics:
+            raise ValueError("Tables were scored with different metrics")
+        if other.policies == self.policies and not set(self.seeds) & set(other.seeds):
+            return MetricTable(
+                policies=self.policies,
+                metrics=self.metrics,
+                seeds=self.seeds + other.seeds,
+                values=np.concatenate((self.values, other.values), axis=2),
+            )
+        if other.seeds == self.seeds and not set(self.policies) & set(other.policies):
+            return MetricTable(
+                policies=self.policies + other.policies,
+                metrics=self.metrics,
+                seeds=self.seeds,
+                values=np.concatenate((self.values, other.values), axis=0),
+            )
+        raise ValueError("Tables share neither their policies nor their seeds")
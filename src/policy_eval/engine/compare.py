@@ -3,6 +3,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Iterable, Literal
 
+import numpy as np
+
 from policy_eval.engine.experiment import TrialResult
 
 
@@ -38,6 +40,47 @@ def _quantile(sorted_vals: list[float], q: float) -> float:
     return float(sorted_vals[lo] * (1 - frac) + sorted_vals[hi] * frac)
 
 
+def summarize_array(values: np.ndarray) -> np.ndarray:
+    """
+    Vectorized DistSummary over the last axis of values.
+    Returns an object array of DistSummary with shape values.shape[:-1].
+
+    Quantiles use the same linear interpolation as _quantile.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    n = values.shape[-1]
+    if n == 0:
+        raise ValueError("Cannot summarize an empty distribution")
+
+    ordered = np.sort(values, axis=-1)
+    mean = ordered.mean(axis=-1)
+    std = ordered.std(axis=-1)
+
+    def quantile(q: float) -> np.ndarray:
+        pos = (n - 1) * q
+        lo = int(pos)
+        hi = min(lo + 1, n - 1)
+        frac = pos - lo
+        return ordered[..., lo] * (1 - frac) + ordered[..., hi] * frac
+
+    cols = (
+        mean,
+        std,
+        ordered[..., 0],
+        quantile(0.10),
+        quantile(0.50),
+        quantile(0.90),
+        ordered[..., -1],
+    )
+    out = np.empty(values.shape[:-1], dtype=object)
+    for idx in np.ndindex(out.shape):
+        c = [float(col[idx]) for col in cols]
+        out[idx] = DistSummary(
+            n=n, mean=c[0], std=c[1], min=c[2], p10=c[3], p50=c[4], p90=c[5], max=c[6]
+        )
+    return out
+
+
 def summarize_distributions(
     trials: Iterable[TrialResult],
 ) -> dict[tuple[str, str], DistSummary]:
@@ -49,27 +92,19 @@ def summarize_distributions(
     for tr in trials:
         for mr in tr.metrics:
             key = (tr.policy, mr.metric)
-            buckets.setdefault(key, []).append(float(mr.value))
-
-    out: dict[tuple[str, str], DistSummary] = {}
-    for key, vals in buckets.items():
-        vals_sorted = sorted(vals)
-        n = len(vals_sorted)
-        mean = sum(vals_sorted) / n
-        var = sum((x - mean) ** 2 for x in vals_sorted) / n
-        std = var**0.5
-
-        out[key] = DistSummary(
-            n=n,
-            mean=mean,
-            std=std,
-            min=vals_sorted[0],
-            p10=_quantile(vals_sorted, 0.10),
-            p50=_quantile(vals_sorted, 0.50),
-            p90=_quantile(vals_sorted, 0.90),
-            max=vals_sorted[-1],
-        )
-    return out
+            buckets.setdefault(key, []).append(mr.value)
+
+    if not buckets:
+        return {}
+
+    keys = list(buckets)
+    lengths = {len(v) for v in buckets.values()}
+    if len(lengths) == 1:
+        # complete grid: one vectorized pass over a [key, seed] matrix
+        stats = summarize_array(np.array([buckets[k] for k in keys], dtype=np.float64))
+        return dict(zip(keys, stats))
+
+    return {k: summarize_array(np.asarray(buckets[k], dtype=np.float64))[()] for k in keys}
 
 
 def dominates(
@@ -94,6 +129,28 @@ def dominates(
         return va <= vb - tol
 
 
+def dominance_matrix(
+    summaries: dict[tuple[str, str], DistSummary],
+    *,
+    metric: str,
+    direction: Direction,
+    criterion: Literal["mean", "p50", "p90", "min"] = "mean",
+    tol: float = 0.0,
+) -> tuple[list[str], np.ndarray]:
+    """
+    Sorted policy names and a boolean [winner, loser] matrix of dominates()
+    over every pair (the diagonal is False). Prefer this to the report
+    for large policy sets; the pair list grows quadratically.
+    """
+    policies = sorted({p for (p, m) in summaries.keys() if m == metric})
+    v = np.array([getattr(summaries[(p, metric)], criterion) for p in policies], dtype=np.float64)
+    if direction == "lower_better":
+        v = -v
+    wins = v[:, None] >= v[None, :] + tol
+    np.fill_diagonal(wins, False)
+    return policies, wins
+
+
 def pairwise_dominance_report(
     summaries: dict[tuple[str, str], DistSummary],
     *,
@@ -105,18 +162,7 @@ def pairwise_dominance_report(
     """
     Returns list of (winner_policy, loser_policy) pairs for the given metric.
     """
-    # collect policies that have this metric
-    policies = sorted({p for (p, m) in summaries.keys() if m == metric})
-    wins: list[tuple[str, str]] = []
-
-    for i in range(len(policies)):
-        for j in range(len(policies)):
-            if i == j:
-                continue
-            pa, pb = policies[i], policies[j]
-            a = summaries[(pa, metric)]
-            b = summaries[(pb, metric)]
-            if dominates(a, b, direction=direction, criterion=criterion, tol=tol):
-                wins.append((pa, pb))
-
-    return wins
+    policies, wins = dominance_matrix(
+        summaries, metric=metric, direction=direction, criterion=criterion, tol=tol
+    )
+    return [(policies[i], policies[j]) for i, j in zip(*np.nonzero(wins))]
@@ -0,0 +1,315 @@
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import hmac
+import json
+import pickle
+import threading
+import time
+from typing import Any, Iterable
+from urllib.parse import parse_qs, urlparse
+import urllib.error
+import urllib.request
+
+import numpy as np
+
+from policy_eval.abstractions.domain import Domain
+from policy_eval.abstractions.metric import Metric
+from policy_eval.abstractions.policy import Policy
+from policy_eval.core.types import RunConfig
+from policy_eval.engine.columnar import MetricTable
+from policy_eval.engine.evaluate import EvaluationResult, EvaluationSpec
+from policy_eval.engine.pareto import MetricSpec, pareto_front
+from policy_eval.engine.shm import fill_scores, table_units
+
+_TOKEN_HEADER = "X-Policy-Eval-Token"
+
+
+@dataclass(frozen=True)
+class Job:
+    """
+    Everything a worker needs besides its leases. Sent pickled, so workers
+    must only be pointed at coordinators they trust.
+    """
+    domain: Domain
+    policies: tuple[Policy, ...]
+    metrics: tuple[Metric, ...]
+    cfg: RunConfig
+
+
+class Coordinator:
+    """
+    Serves a policies x seeds grid to workers over HTTP.
+
+    The grid is cut into units (seed chunks per policy, or across all
+    policies when cfg.warmup > 0, as run_experiment does). Workers POST
+    /lease, run the unit and POST the [policy, metric, seed] float64 block
+    back. A lease not returned within lease_timeout is re-issued to the
+    next idle worker; the first result for a unit wins and later copies
+    are ignored (they are identical anyway). Results are placed by index,
+    so reassembly does not depend on which worker ran what.
+
+    token: if set, every request must carry it in the X-Policy-Eval-Token
+    header.
+    """
+
+    def __init__(
+        self,
+        *,
+        domain: Domain,
+        policies: Iterable[Policy],
+        metrics: Iterable[Metric],
+        seeds: Iterable[int],
+        cfg: RunConfig,
+        lease_seeds: int = 64,
+        lease_timeout: float = 60.0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        token: str | None = None,
+    ) -> None:
+        self.job = Job(
+            domain=domain, policies=tuple(policies), metrics=tuple(metrics), cfg=cfg
+        )
+        self.seeds = tuple(seeds)
+        self.lease_timeout = lease_timeout
+        self.token = token
+        self.values = np.full(
+            (len(self.job.policies), len(self.job.metrics), len(self.seeds)), np.nan
+        )
+        self._units = [
+            (rows, col, col + len(unit_seeds))
+            for _, rows, unit_seeds, col in table_units(
+                list(self.job.policies), list(self.seeds), cfg, max(1, lease_seeds)
+            )
+        ]
+        self._blob = pickle.dumps(self.job, protocol=pickle.HIGHEST_PROTOCOL)
+        self._lock = threading.Lock()
+        self._pending = deque(range(len(self._units)))
+        self._leases: dict[int, int] = {}  # lease id -> unit
+        self._issued: dict[int, float] = {}  # unit -> time of its latest lease
+        self._done: set[int] = set()
+        self._next_lease = 0
+        self._finished = threading.Event()
+        if not self._units:
+            self._finished.set()
+        self.reissued = 0
+
+        self._server = ThreadingHTTPServer((host, port), _Handler)
+        self._server.daemon_threads = True
+        self._server.coordinator = self  # type: ignore[attr-defined]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def lease(self) -> dict[str, Any]:
+        with self._lock:
+            if self._finished.is_set():
+                return {"status": "done"}
+            now = time.monotonic()
+            if self._pending:
+                unit = self._pending.popleft()
+            else:
+                # re-issue the unit whose latest lease is the oldest past its
+                # timeout; earlier leases stay valid in case they finish first
+                stale = [
+                    (issued, unit)
+                    for unit, issued in self._issued.items()
+                    if unit not in self._done and now - issued >= self.lease_timeout
+                ]
+                if not stale:
+                    return {"status": "wait", "retry": min(1.0, self.lease_timeout / 4)}
+                _, unit = min(stale)
+                self.reissued += 1
+            lease_id = self._next_lease
+            self._next_lease += 1
+            self._leases[lease_id] = unit
+            self._issued[unit] = now
+        rows, start, stop = self._units[unit]
+        return {
+            "status": "lease",
+            "lease": lease_id,
+            "rows": rows,
+            "seeds": list(self.seeds[start:stop]),
+        }
+
+    def submit(self, lease_id: int, payload: bytes) -> bool:
+        with self._lock:
+            unit = self._leases.get(lease_id)
+            if unit is None or unit in self._done:
+                return False
+            rows, start, stop = self._units[unit]
+            shape = (len(rows), len(self.job.metrics), stop - start)
+            block = np.frombuffer(payload, dtype=np.float64)
+            if block.size != np.prod(shape):
+                raise ValueError(f"Lease {lease_id} expects {shape}, got {block.size} values")
+            self.values[rows, :, start:stop] = block.reshape(shape)
+            self._done.add(unit)
+            del self._issued[unit]
+            if len(self._done) == len(self._units):
+                self._finished.set()
+        return True
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """
+        Blocks until every unit has a result; False on timeout.
+        """
+        return self._finished.wait(timeout)
+
+    def result(self, pareto_metrics: list[MetricSpec] | None = None) -> EvaluationResult:
+        """
+        Reassembles the finished grid into an EvaluationResult (no trials;
+        table, summaries and Pareto front are exact).
+        """
+        if not self._finished.is_set():
+            raise RuntimeError("The sweep has not finished yet")
+        table = MetricTable(
+            policies=tuple(p.name for p in self.job.policies),
+            metrics=tuple(m.name for m in self.job.metrics),
+            seeds=self.seeds,
+            values=self.values.copy(),
+        )
+        summaries = table.summarize()
+        pareto_set = None
+        if pareto_metrics is not None:
+            pareto_set = pareto_front(summaries, pareto_metrics)
+        return EvaluationResult(
+            trials=[],
+            summaries=summaries,
+            pareto=pareto_set,
+            table=table,
+            spec=EvaluationSpec(
+                domain=self.job.domain,
+                policies=self.job.policies,
+                metrics=self.job.metrics,
+                seeds=self.seeds,
+                cfg=self.job.cfg,
+                pareto_metrics=tuple(pareto_metrics) if pareto_metrics is not None else None,
+            ),
+        )
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def __enter__(self) -> Coordinator:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: Any
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass  # keep test and worker output quiet
+
+    def _reply(self, code: int, body: bytes, content_type: str = "application/json") -> None:
+        self.send_response(code)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _json(self, obj: Any, code: int = 200) -> None:
+        self._reply(code, json.dumps(obj).encode("utf-8"))
+
+    def _authorized(self) -> bool:
+        token = self.server.coordinator.token
+        given = self.headers.get(_TOKEN_HEADER) or ""
+        if token is not None and not hmac.compare_digest(given.encode(), token.encode()):
+            self._json({"error": "bad token"}, 403)
+            return False
+        return True
+
+    def do_GET(self) -> None:
+        if not self._authorized():
+            return
+        if urlparse(self.path).path == "/job":
+            self._reply(200, self.server.coordinator._blob, "application/octet-stream")
+        else:
+            self._json({"error": "not found"}, 404)
+
+    def do_POST(self) -> None:
+        if not self._authorized():
+            return
+        coordinator: Coordinator = self.server.coordinator
+        url = urlparse(self.path)
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if url.path == "/lease":
+            self._json(coordinator.lease())
+        elif url.path == "/result":
+            try:
+                lease_id = int(parse_qs(url.query)["lease"][0])
+                accepted = coordinator.submit(lease_id, body)
+            except (KeyError, ValueError) as exc:
+                self._json({"error": str(exc)}, 400)
+                return
+            self._json({"accepted": accepted})
+        else:
+            self._json({"error": "not found"}, 404)
+
+
+def _request(url: str, token: str | None, data: bytes | None = None) -> bytes:
+    req = urllib.request.Request(url, data=data, method="GET" if data is None else "POST")
+    if token is not None:
+        req.add_header(_TOKEN_HEADER, token)
+    with urllib.request.urlopen(req) as resp:
+        return resp.read()
+
+
+def _gone(exc: OSError) -> bool:
+    # a coordinator that finished and closed refuses or drops the connection
+    reason = exc.reason if isinstance(exc, urllib.error.URLError) else exc
+    return isinstance(reason, (ConnectionRefusedError, ConnectionResetError))
+
+
+def run_worker(url: str, *, token: str | None = None, max_leases: int | None = None) -> int:
+    """
+    Pulls leases from the coordinator at url until the sweep is done (or
+    max_leases have been run) and returns how many it completed. Once the
+    job is fetched, a coordinator that has gone away counts as done.
+    """
+    url = url.rstrip("/")
+    job: Job = pickle.loads(_request(f"{url}/job", token))
+    completed = 0
+    while max_leases is None or completed < max_leases:
+        try:
+            lease = json.loads(_request(f"{url}/lease", token, b""))
+        except OSError as exc:
+            if not _gone(exc):
+                raise
+            break
+        if lease["status"] == "done":
+            break
+        if lease["status"] == "wait":
+            time.sleep(lease["retry"])
+            continue
+        rows, seeds = lease["rows"], lease["seeds"]
+        block = np.empty((len(rows), len(job.metrics), len(seeds)), dtype=np.float64)
+        fill_scores(
+            block,
+            job.domain,
+            [job.policies[r] for r in rows],
+            list(range(len(rows))),
+            list(job.metrics),
+            job.cfg,
+            seeds,
+            0,
+            None,
+        )
+        try:
+            _request(f"{url}/result?lease={lease['lease']}", token, block.tobytes())
+        except OSError as exc:
+            if not _gone(exc):
+                raise
+            break
+        completed += 1
+    return completed
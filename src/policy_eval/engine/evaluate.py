@@ -1,22 +1,261 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Iterable
+from concurrent.futures import Executor
+import copy
+from dataclasses import dataclass, replace
+import os
+from pathlib import Path
+import pickle
+import tempfile
+from typing import Iterable, Mapping
 
 from policy_eval.abstractions.domain import Domain
 from policy_eval.abstractions.metric import Metric
 from policy_eval.abstractions.policy import Policy
 from policy_eval.core.types import RunConfig
+from policy_eval.engine.cache import TrialCache
+from policy_eval.engine.columnar import MetricTable
 from policy_eval.engine.compare import DistSummary, summarize_distributions
-from policy_eval.engine.experiment import TrialResult, run_experiment
+from policy_eval.engine.experiment import TrialResult, iter_experiment, run_experiment
+from policy_eval.engine.online import OnlineDist, accumulate
 from policy_eval.engine.pareto import MetricSpec, pareto_front
+from policy_eval.engine.profile import Profiler
+from policy_eval.engine.shm import run_metric_table
+from policy_eval.engine.store import TrajectoryStore
+from policy_eval.engine.variance import Estimate, variance_report
+
+
+@dataclass(frozen=True)
+class EvaluationSpec:
+    """
+    What an evaluation covered, so it can be extended later.
+    """
+    domain: Domain
+    policies: tuple[Policy, ...]
+    metrics: tuple[Metric, ...]
+    seeds: tuple[int, ...]
+    cfg: RunConfig
+    pareto_metrics: tuple[MetricSpec, ...] | None = None
 
 
 @dataclass(frozen=True)
 class EvaluationResult:
-    trials: list[TrialResult]
+    trials: list[TrialResult]  # empty when evaluated with streaming or shared_table
     summaries: dict[tuple[str, str], DistSummary]
     pareto: list[str] | None
+    table: MetricTable | None = None  # [policy, metric, seed] metric values
+    profile: Profiler | None = None  # per-phase timings when evaluate(profile=True)
+    spec: EvaluationSpec | None = None  # set by evaluate; needed by extend
+    # mergeable per-(policy, metric) state; built on demand when None
+    accumulators: dict[tuple[str, str], OnlineDist] | None = None
+
+    def extend(
+        self,
+        *,
+        seeds: Iterable[int] = (),
+        policies: Iterable[Policy] = (),
+        workers: int | None = None,
+        executor: Executor | None = None,
+        cache: TrialCache | None = None,
+        store: TrajectoryStore | None = None,
+    ) -> EvaluationResult:
+        """
+        Evaluates only the new grid cells, existing policies on the new
+        seeds and new policies on all seeds, and merges them in (see
+        merge). Seeds and policies already covered are skipped.
+        """
+        if self.spec is None:
+            raise ValueError("Only results produced by evaluate can be extended")
+        spec = self.spec
+        known_seeds = set(spec.seeds)
+        known_policies = {p.name for p in spec.policies}
+        new_seeds = list(dict.fromkeys(s for s in seeds if s not in known_seeds))
+        new_policies = list({p.name: p for p in policies if p.name not in known_policies}.values())
+
+        kwargs = dict(
+            domain=spec.domain,
+            metrics=spec.metrics,
+            cfg=spec.cfg,
+            workers=workers,
+            executor=executor,
+            streaming=not self.trials and self.table is None,
+            shared_table=not self.trials and self.table is not None,
+            cache=cache,
+            profile=self.profile is not None,
+            store=store,
+        )
+        result = self
+        if new_seeds:
+            result = result.merge(evaluate(policies=spec.policies, seeds=new_seeds, **kwargs))
+        if new_policies:
+            all_seeds = list(spec.seeds) + new_seeds
+            result = result.merge(evaluate(policies=new_policies, seeds=all_seeds, **kwargs))
+        return result
+
+    def merge(self, other: EvaluationResult) -> EvaluationResult:
+        """
+        Combines two results over disjoint (policy, seed) cells of the
+        same domain, metrics and config.
+
+        When both tables line up they are concatenated and the summaries
+        are exact, as from a single evaluate. Otherwise summaries come from
+        merged OnlineDist accumulators: mean, std, min and max are exact,
+        and quantiles are exact until a distribution outgrows the sketch
+        (then they are estimates, as with streaming=True). The Pareto front
+        is recomputed from the merged summaries.
+
+        Raises ValueError if the results share a (policy, seed) cell.
+        """
+        overlap = _cells(self) & _cells(other)
+        if overlap:
+            policy, seed = min(overlap)
+            raise ValueError(
+                f"Cannot merge results that both cover {len(overlap)} (policy, seed) cells, "
+                f"e.g. ({policy!r}, {seed})"
+            )
+        table = None
+        if self.table is not None and other.table is not None:
+            try:
+                table = self.table.concat(other.table)
+            except ValueError:
+                table = None
+
+        accs = None
+        if table is not None:
+            summaries = table.summarize()
+        else:
+            accs = {k: copy.deepcopy(v) for k, v in _accumulators(self).items()}
+            for key, acc in _accumulators(other).items():
+                if key in accs:
+                    accs[key].merge(acc)
+                else:
+                    accs[key] = acc
+            summaries = {key: acc.summary() for key, acc in accs.items()}
+
+        spec = _merge_specs(self.spec, other.spec)
+        pareto_metrics = spec.pareto_metrics if spec is not None else None
+        pareto_set = None
+        if pareto_metrics is not None:
+            pareto_set = pareto_front(summaries, list(pareto_metrics))
+        elif self.pareto is not None:
+            raise ValueError("Cannot recompute the Pareto front without its metric specs")
+
+        profile = self.profile
+        if profile is not None and other.profile is not None:
+            profile = copy.deepcopy(profile)
+            profile.merge(other.profile)
+
+        return EvaluationResult(
+            trials=_merge_trials(self.trials, other.trials, spec),
+            summaries=summaries,
+            pareto=pareto_set,
+            table=table,
+            profile=profile,
+            spec=spec,
+            accumulators=accs,
+        )
+
+    def estimates(
+        self, controls: Mapping[str, float] | None = None, confidence: float = 0.95
+    ) -> dict[tuple[str, str], Estimate]:
+        """
+        Means with standard errors and effective sample sizes that account
+        for cfg.sampling and optional control variates (see
+        engine.variance.variance_report). Needs the table.
+        """
+        if self.table is None:
+            raise ValueError("Estimates need the [policy, metric, seed] table")
+        plan = self.spec.cfg.sampling if self.spec is not None else None
+        return variance_report(self.table, plan, controls=controls, confidence=confidence)
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """
+        Pickles the result (domain, policies and metrics included, so they
+        must be picklable, as for workers). Written atomically.
+        """
+        path = Path(path)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+
+    @staticmethod
+    def load(path: str | os.PathLike[str]) -> EvaluationResult:
+        with open(path, "rb") as f:
+            result = pickle.load(f)
+        if not isinstance(result, EvaluationResult):
+            raise TypeError(f"{path} does not hold an EvaluationResult")
+        return result
+
+
+def _cells(result: EvaluationResult) -> set[tuple[str, int]]:
+    """
+    The (policy name, seed) cells a result covers, from its per-seed
+    values when it has them, else from its spec.
+    """
+    if result.table is not None:
+        return {(p, s) for p in result.table.policies for s in result.table.seeds}
+    if result.trials:
+        return {(tr.policy, tr.seed) for tr in result.trials}
+    if result.spec is not None:
+        return {(p.name, s) for p in result.spec.policies for s in result.spec.seeds}
+    return set()
+
+
+def _accumulators(result: EvaluationResult) -> dict[tuple[str, str], OnlineDist]:
+    if result.accumulators is not None:
+        return result.accumulators
+    if result.table is not None:
+        t = result.table
+        return {
+            (p, m): OnlineDist.from_values(t.values[i, j])
+            for i, p in enumerate(t.policies)
+            for j, m in enumerate(t.metrics)
+        }
+    if result.trials:
+        return accumulate(result.trials)
+    raise ValueError("Result holds neither accumulators nor per-seed values to merge")
+
+
+def _merge_specs(a: EvaluationSpec | None, b: EvaluationSpec | None) -> EvaluationSpec | None:
+    if a is None or b is None:
+        return a or b
+    if a.cfg != b.cfg:
+        raise ValueError("Cannot merge results run with different configs")
+    if [m.name for m in a.metrics] != [m.name for m in b.metrics]:
+        raise ValueError("Cannot merge results scored with different metrics")
+    names = {p.name for p in a.policies}
+    return replace(
+        a,
+        policies=a.policies + tuple(p for p in b.policies if p.name not in names),
+        seeds=tuple(dict.fromkeys(a.seeds + b.seeds)),
+        pareto_metrics=a.pareto_metrics if a.pareto_metrics is not None else b.pareto_metrics,
+    )
+
+
+def _merge_trials(
+    a: list[TrialResult], b: list[TrialResult], spec: EvaluationSpec | None
+) -> list[TrialResult]:
+    trials = a + b
+    if spec is not None:
+        # back to policy-major, seed-minor order
+        rank = {p.name: i for i, p in enumerate(spec.policies)}
+        seed_rank = {s: i for i, s in enumerate(spec.seeds)}
+        trials.sort(key=lambda tr: (rank.get(tr.policy, len(rank)), seed_rank.get(tr.seed, 0)))
+    return trials
+
+
+def _summarize(
+    trials: list[TrialResult],
+) -> tuple[MetricTable | None, dict[tuple[str, str], DistSummary]]:
+    """
+    Summaries through a MetricTable when trials form a complete grid.
+    """
+    try:
+        table = MetricTable.from_trials(trials)
+    except ValueError:
+        return None, summarize_distributions(trials)
+    return table, table.summarize()
 
 
 def evaluate(
@@ -27,24 +266,116 @@ def evaluate(
     seeds: Iterable[int],
     cfg: RunConfig,
     pareto_metrics: list[MetricSpec] | None = None,
+    workers: int | None = None,
+    executor: Executor | None = None,
+    streaming: bool = False,
+    cache: TrialCache | None = None,
+    profile: bool = False,
+    store: TrajectoryStore | None = None,
+    shared_table: bool = False,
 ) -> EvaluationResult:
     """
     One-stop API:
-    - runs trials
+    - runs trials (optionally on a process pool and/or through an on-disk
+      trial cache, see run_experiment)
     - summarizes distributions
     - optionally computes Pareto front across multiple metrics
+
+    streaming=True scores each run as it finishes, drops its trajectory and
+    keeps only online accumulators (see engine.online), so memory stays
+    constant in the number of seeds. Quantiles are then sketch estimates
+    once a distribution exceeds the sketch size; no trials are retained.
+    Scores reach the accumulators in grid order whatever the workers, so
+    summaries do not depend on the worker count.
+
+    shared_table=True keeps only the scores, as an exact MetricTable:
+    workers write them into a shared-memory [policy, metric, seed] block
+    (see engine.shm) and no trials are sent back. Memory grows with the
+    grid (8 bytes per value), so for unbounded seed counts use streaming.
+    Not combinable with streaming, cache or store.
+
+    store: write every trajectory to this TrajectoryStore as it is
+    produced; trials then hold lazy views, so results of large sweeps can
+    be audited or rescored without keeping trajectories in memory.
+
+    profile=True times every simulation phase and metric scoring per
+    (domain, policy) and attaches the Profiler to the result.
+
+    The result remembers what it covered; see EvaluationResult.extend to
+    add seeds or policies later without redoing the existing cells.
     """
-    trials = run_experiment(
-        domain=domain,
-        policies=policies,
-        metrics=metrics,
-        seeds=seeds,
-        cfg=cfg,
-    )
-    summaries = summarize_distributions(trials)
+    policies = list(policies)
+    metrics = list(metrics)
+    seeds = list(seeds)
+    profiler = Profiler() if profile else None
+    table = None
+    accumulators = None
+    trials: list[TrialResult]
+    if shared_table:
+        if streaming or cache is not None or store is not None:
+            raise ValueError("shared_table cannot be combined with streaming, cache or store")
+        trials = []
+        table = run_metric_table(
+            domain=domain,
+            policies=policies,
+            metrics=metrics,
+            seeds=seeds,
+            cfg=cfg,
+            workers=workers,
+            executor=executor,
+            profiler=profiler,
+        )
+        summaries = table.summarize()
+    elif streaming:
+        trials = []
+        accumulators = accumulate(
+            iter_experiment(
+                domain=domain,
+                policies=policies,
+                metrics=metrics,
+                seeds=seeds,
+                cfg=cfg,
+                workers=workers,
+                executor=executor,
+                keep_runs=False,
+                cache=cache,
+                profiler=profiler,
+                store=store,
+            )
+        )
+        summaries = {key: acc.summary() for key, acc in accumulators.items()}
+    else:
+        trials = run_experiment(
+            domain=domain,
+            policies=policies,
+            metrics=metrics,
+            seeds=seeds,
+            cfg=cfg,
+            workers=workers,
+            executor=executor,
+            cache=cache,
+            profiler=profiler,
+            store=store,
+        )
+        table, summaries = _summarize(trials)
 
     pareto_set = None
     if pareto_metrics is not None:
         pareto_set = pareto_front(summaries, pareto_metrics)
 
-    return EvaluationResult(trials=trials, summaries=summaries, pareto=pareto_set)
+    return EvaluationResult(
+        trials=trials,
+        summaries=summaries,
+        pareto=pareto_set,
+        table=table,
+        profile=profiler,
+        spec=EvaluationSpec(
+            domain=domain,
+            policies=tuple(policies),
+            metrics=tuple(metrics),
+            seeds=tuple(seeds),
+            cfg=cfg,
+            pareto_metrics=tuple(pareto_metrics) if pareto_metrics is not None else None,
+        ),
+        accumulators=accumulators,
+    )
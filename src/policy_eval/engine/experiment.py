@@ -1,13 +1,26 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Iterable
+from collections import deque
+import os
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from time import perf_counter_ns
+from typing import Any, Callable, Iterable, Iterator, TypeVar
 
 from policy_eval.abstractions.domain import Domain
 from policy_eval.abstractions.metric import Metric
 from policy_eval.abstractions.policy import Policy
 from policy_eval.core.types import RunConfig
-from policy_eval.engine.simulator import RunResult, simulate
+from policy_eval.engine.cache import CachedTrial, TrialCache, trial_key
+from policy_eval.engine.profile import Profiler
+from policy_eval.engine.simulator import (
+    Prefix,
+    RunResult,
+    simulate,
+    simulate_many,
+    simulate_prefix,
+)
+from policy_eval.engine.store import StoredRun, TrajectoryStore
 
 
 @dataclass(frozen=True)
@@ -22,7 +35,451 @@ class TrialResult:
     policy: str
     seed: int
     metrics: tuple[MetricResult, ...]
-    run: RunResult
+    # None when the run was dropped after scoring; a lazy view when stored
+    run: RunResult | StoredRun | None
+
+
+def _score(
+    run: RunResult,
+    metrics_list: list[Metric],
+    keep_runs: bool = True,
+    profiler: Profiler | None = None,
+) -> TrialResult:
+    if profiler is None:
+        scored = tuple(
+            MetricResult(metric=m.name, value=float(m.evaluate(run.trajectory)))
+            for m in metrics_list
+        )
+    else:
+        start = perf_counter_ns()
+        scored = tuple(
+            MetricResult(metric=m.name, value=float(m.evaluate(run.trajectory)))
+            for m in metrics_list
+        )
+        profiler.record(run.domain, run.policy, "metrics", perf_counter_ns() - start)
+    return TrialResult(
+        domain=run.domain,
+        policy=run.policy,
+        seed=run.seed,
+        metrics=scored,
+        run=run if keep_runs else None,
+    )
+
+
+def _run_trial(
+    domain: Domain,
+    policy: Policy,
+    metrics_list: list[Metric],
+    cfg: RunConfig,
+    seed: int,
+    keep_runs: bool = True,
+    prefix: Prefix | None = None,
+    profiler: Profiler | None = None,
+) -> TrialResult:
+    run = simulate(domain, policy, cfg, seed=seed, prefix=prefix, profiler=profiler)
+    return _score(run, metrics_list, keep_runs, profiler)
+
+
+# seeds interleaved per decide_many call; bounds how many runs are alive at once
+_MANY_BATCH = 1024
+
+
+def _iter_chunk(
+    domain: Domain,
+    policies: list[Policy],
+    metrics_list: list[Metric],
+    cfg: RunConfig,
+    seeds: list[int],
+    keep_runs: bool = True,
+    profiler: Profiler | None = None,
+) -> Iterator[TrialResult]:
+    if cfg.warmup > 0 and len(policies) > 1:
+        prefixes: list[Prefix | None] = [
+            simulate_prefix(domain, cfg, s, profiler=profiler) for s in seeds
+        ]
+    else:
+        prefixes = [None] * len(seeds)
+    for policy in policies:
+        if hasattr(policy, "decide_many"):
+            for i in range(0, len(seeds), _MANY_BATCH):
+                runs = simulate_many(
+                    domain,
+                    policy,
+                    cfg,
+                    seeds[i : i + _MANY_BATCH],
+                    prefixes=prefixes[i : i + _MANY_BATCH],
+                    profiler=profiler,
+                )
+                for run in runs:
+                    yield _score(run, metrics_list, keep_runs, profiler)
+            continue
+        for seed, prefix in zip(seeds, prefixes):
+            yield _run_trial(
+                domain, policy, metrics_list, cfg, seed, keep_runs, prefix, profiler
+            )
+
+
+def _run_chunk(
+    domain: Domain,
+    policies: list[Policy],
+    metrics_list: list[Metric],
+    cfg: RunConfig,
+    seeds: list[int],
+    keep_runs: bool = True,
+    profile: bool = False,
+) -> tuple[list[TrialResult], Profiler | None]:
+    """
+    Unit of work shipped to a worker process: policies x a slice of seeds,
+    policy-major. With a warm-up, each seed's prefix is simulated once and
+    shared by all policies in the chunk. Worker-side timings come back with
+    the trials when profile is set.
+    """
+    profiler = Profiler() if profile else None
+    trials = list(
+        _iter_chunk(domain, policies, metrics_list, cfg, seeds, keep_runs, profiler)
+    )
+    return trials, profiler
+
+
+def _default_chunksize(n_seeds: int, workers: int) -> int:
+    # A few chunks per worker keeps the pool busy without paying pickling
+    # overhead for every single trial.
+    return max(1, -(-n_seeds // (workers * 4)))
+
+
+def _serial_chunksize(
+    policies: list[Policy], n_seeds: int, cfg: RunConfig, cached: bool = False
+) -> int:
+    # one seed per unit keeps serial warm-up sharing lazy, unless a
+    # decide_many policy wants many seeds per call
+    if cfg.warmup > 0 and any(hasattr(p, "decide_many") for p in policies):
+        return _MANY_BATCH
+    if cfg.warmup > 0:
+        return 1
+    if cached:
+        # cached cells are looked up a unit at a time
+        return max(1, min(n_seeds, _MANY_BATCH))
+    return max(1, n_seeds)
+
+
+_Unit = tuple[list[Policy], list[int]]
+
+
+def _plan(
+    n_policies: int, seeds: list[int], cfg: RunConfig, chunksize: int
+) -> list[tuple[list[int], list[int]]]:
+    """
+    Splits a full policies x seeds grid into work units of (policy
+    indices, seeds). With a warm-up, units span all policies so each
+    seed's prefix is shared.
+    """
+    if cfg.warmup > 0:
+        rows = list(range(n_policies))
+        return [(rows, seeds[i : i + chunksize]) for i in range(0, len(seeds), chunksize)]
+    return [
+        ([row], seeds[i : i + chunksize])
+        for row in range(n_policies)
+        for i in range(0, len(seeds), chunksize)
+    ]
+
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+def _bounded(
+    items: Iterable[_T],
+    submit: Callable[[Executor, _T], Future[Any]],
+    collect: Callable[[Future[Any]], _R],
+    *,
+    workers: int | None,
+    executor: Executor | None,
+) -> Iterator[_R]:
+    """
+    Submits items to executor (else a process pool of workers) and yields
+    collect of each future in submission order, keeping at most two per
+    worker in flight.
+    """
+    # with an external executor we cannot see its size; assume one per core
+    n_workers = workers or os.cpu_count() or 1
+
+    def drain(ex: Executor) -> Iterator[_R]:
+        pending: deque[Future[Any]] = deque()
+        for item in items:
+            pending.append(submit(ex, item))
+            if len(pending) >= 2 * n_workers:
+                yield collect(pending.popleft())
+        while pending:
+            yield collect(pending.popleft())
+
+    if executor is not None:
+        yield from drain(executor)
+        return
+    with ProcessPoolExecutor(max_workers=n_workers) as pool:
+        yield from drain(pool)
+
+
+def _execute(
+    units: list[_Unit],
+    *,
+    domain: Domain,
+    metrics_list: list[Metric],
+    cfg: RunConfig,
+    workers: int | None,
+    executor: Executor | None,
+    keep_runs: bool,
+    profiler: Profiler | None = None,
+) -> Iterator[TrialResult]:
+    """
+    Runs units in order, serially or on a pool, yielding trials in unit order.
+    Parallel execution keeps only a bounded number of units in flight.
+    """
+    if executor is None and (workers is None or workers <= 1):
+        for unit_policies, unit_seeds in units:
+            yield from _iter_chunk(
+                domain, unit_policies, metrics_list, cfg, unit_seeds, keep_runs, profiler
+            )
+        return
+
+    def submit(ex: Executor, unit: _Unit) -> Future[tuple[list[TrialResult], Profiler | None]]:
+        unit_policies, unit_seeds = unit
+        return ex.submit(
+            _run_chunk,
+            domain,
+            unit_policies,
+            metrics_list,
+            cfg,
+            unit_seeds,
+            keep_runs,
+            profiler is not None,
+        )
+
+    def collect(fut: Future[tuple[list[TrialResult], Profiler | None]]) -> list[TrialResult]:
+        trials, worker_profile = fut.result()
+        if profiler is not None and worker_profile is not None:
+            profiler.merge(worker_profile)
+        return trials
+
+    for trials in _bounded(units, submit, collect, workers=workers, executor=executor):
+        yield from trials
+
+
+def _lookup(
+    cache: TrialCache,
+    key: str,
+    domain: Domain,
+    policy: Policy,
+    seed: int,
+    metrics_list: list[Metric],
+    keep_runs: bool,
+) -> TrialResult | None:
+    """
+    A cached cell as a trial, re-scoring the cached run when a metric is
+    not in the entry yet; None on a miss.
+    """
+    entry = cache.get(key)
+    names = [m.name for m in metrics_list]
+    if entry is not None and any(n not in entry.metrics for n in names):
+        if entry.run is None:
+            entry = None
+        else:
+            values = dict(entry.metrics)
+            for m in metrics_list:
+                if m.name not in values:
+                    values[m.name] = float(m.evaluate(entry.run.trajectory))
+            entry = CachedTrial(metrics=values, run=entry.run)
+            cache.put(key, entry)
+    if entry is None:
+        cache.misses += 1
+        return None
+    cache.hits += 1
+    return TrialResult(
+        domain=domain.name,
+        policy=policy.name,
+        seed=seed,
+        metrics=tuple(MetricResult(metric=n, value=entry.metrics[n]) for n in names),
+        run=entry.run if keep_runs else None,
+    )
+
+
+def _iter_cached(
+    cache: TrialCache,
+    units: list[_Unit],
+    *,
+    domain: Domain,
+    metrics_list: list[Metric],
+    cfg: RunConfig,
+    workers: int | None,
+    executor: Executor | None,
+    keep_runs: bool,
+    profiler: Profiler | None = None,
+) -> Iterator[TrialResult]:
+    """
+    Serves grid cells from the cache and simulates only the missing ones,
+    yielding trials in unit order as _execute would.
+
+    Units are looked up a window at a time (one unit when serial, a few
+    per worker when parallel), so only a window's trials are held at
+    once. Within a unit, policies missing the same seeds are simulated
+    together and still share those seeds' warm-up.
+    """
+    serial = executor is None and (workers is None or workers <= 1)
+    n_workers = workers or os.cpu_count() or 1
+    window = 1 if serial else 4 * n_workers
+
+    def windows(ex: Executor | None) -> Iterator[TrialResult]:
+        for w in range(0, len(units), window):
+            cells: list[tuple[str, tuple[int, int], int, TrialResult | None]] = []
+            todo: list[tuple[list[tuple[int, int]], list[int]]] = []
+            for u, (unit_policies, unit_seeds) in enumerate(units[w : w + window]):
+                missed: dict[tuple[int, ...], list[tuple[int, int]]] = {}
+                for pi, policy in enumerate(unit_policies):
+                    lost = []
+                    for seed in unit_seeds:
+                        key = trial_key(domain, policy, seed, cfg)
+                        tr = _lookup(cache, key, domain, policy, seed, metrics_list, keep_runs)
+                        cells.append((key, (u, pi), seed, tr))
+                        if tr is None:
+                            lost.append(seed)
+                    if lost:
+                        missed.setdefault(tuple(lost), []).append((u, pi))
+                todo.extend((slots, list(lost)) for lost, slots in missed.items())
+
+            fresh = {}
+            if todo:
+                ran = _execute(
+                    [([units[w + u][0][pi] for u, pi in slots], seeds) for slots, seeds in todo],
+                    domain=domain,
+                    metrics_list=metrics_list,
+                    cfg=cfg,
+                    workers=None if ex is None else n_workers,
+                    executor=ex,
+                    keep_runs=keep_runs or cache.store_runs,
+                    profiler=profiler,
+                )
+                order = [(slot, seed) for slots, seeds in todo for slot in slots for seed in seeds]
+                fresh = dict(zip(order, ran))
+
+            for key, slot, seed, tr in cells:
+                if tr is None:
+                    tr = fresh.pop((slot, seed))
+                    cache.put(
+                        key,
+                        CachedTrial(metrics={mr.metric: mr.value for mr in tr.metrics}, run=tr.run),
+                    )
+                    if not keep_runs and tr.run is not None:
+                        tr = replace(tr, run=None)
+                yield tr
+            cache.evict()
+
+    if serial or executor is not None:
+        yield from windows(executor)
+        return
+    with ProcessPoolExecutor(max_workers=n_workers) as pool:
+        yield from windows(pool)
+
+
+def _iter_indexed(
+    *,
+    domain: Domain,
+    policies_list: list[Policy],
+    metrics_list: list[Metric],
+    seeds_list: list[int],
+    cfg: RunConfig,
+    workers: int | None,
+    executor: Executor | None,
+    chunksize: int | None,
+    keep_runs: bool,
+    cache: TrialCache | None,
+    profiler: Profiler | None,
+    store: TrajectoryStore | None,
+) -> Iterator[tuple[int, TrialResult]]:
+    """
+    iter_experiment's trials, each with the index of its policy in
+    policies_list (names need not be unique).
+    """
+    serial = executor is None and (workers is None or workers <= 1)
+    if chunksize is None:
+        if serial:
+            chunksize = _serial_chunksize(policies_list, len(seeds_list), cfg, cache is not None)
+        else:
+            chunksize = _default_chunksize(len(seeds_list), workers or os.cpu_count() or 1)
+
+    # the store needs every run, even when the caller keeps none
+    source_keeps_runs = keep_runs or store is not None
+    plan = _plan(len(policies_list), seeds_list, cfg, chunksize)
+    units: list[_Unit] = [([policies_list[i] for i in rows], seeds) for rows, seeds in plan]
+    run_kwargs = dict(
+        domain=domain,
+        metrics_list=metrics_list,
+        cfg=cfg,
+        workers=workers,
+        executor=executor,
+        keep_runs=source_keeps_runs,
+        profiler=profiler,
+    )
+    if cache is not None:
+        trials = _iter_cached(cache, units, **run_kwargs)
+    else:
+        trials = _execute(units, **run_kwargs)
+    # units yield their trials policy-major
+    rows = (i for unit_rows, seeds in plan for i in unit_rows for _ in seeds)
+
+    # trials first, so the source runs to completion (the cache evicts last)
+    if store is None:
+        for tr, i in zip(trials, rows):
+            yield i, tr
+        return
+    for tr, i in zip(trials, rows):
+        # runs served from a cache that does not keep them cannot be stored
+        view = store.append(tr.run) if tr.run is not None else None
+        yield i, replace(tr, run=view if keep_runs else None)
+
+
+def iter_experiment(
+    *,
+    domain: Domain,
+    policies: Iterable[Policy],
+    metrics: Iterable[Metric],
+    seeds: Iterable[int],
+    cfg: RunConfig,
+    workers: int | None = None,
+    executor: Executor | None = None,
+    chunksize: int | None = None,
+    keep_runs: bool = True,
+    cache: TrialCache | None = None,
+    profiler: Profiler | None = None,
+    store: TrajectoryStore | None = None,
+) -> Iterator[TrialResult]:
+    """
+    Lazy form of run_experiment: yields trials as they finish, in
+    policy-major, seed-minor order. With cfg.warmup > 0 work is grouped by
+    seed chunk so the warm-up is shared, and trials come one chunk of
+    seeds at a time instead (policy-major within each chunk);
+    run_experiment restores the full policy-major order.
+
+    keep_runs=False drops each trajectory right after scoring (in the worker,
+    when parallel) so callers can aggregate in constant memory.
+
+    store: append every run to this TrajectoryStore as trials arrive; the
+    yielded trials then carry lazy StoredRun views instead of in-memory
+    trajectories.
+    """
+    for _, tr in _iter_indexed(
+        domain=domain,
+        policies_list=list(policies),
+        metrics_list=list(metrics),
+        seeds_list=list(seeds),
+        cfg=cfg,
+        workers=workers,
+        executor=executor,
+        chunksize=chunksize,
+        keep_runs=keep_runs,
+        cache=cache,
+        profiler=profiler,
+        store=store,
+    ):
+        yield tr
 
 
 def run_experiment(
@@ -32,29 +489,55 @@ def run_experiment(
     metrics: Iterable[Metric],
     seeds: Iterable[int],
     cfg: RunConfig,
+    workers: int | None = None,
+    executor: Executor | None = None,
+    chunksize: int | None = None,
+    cache: TrialCache | None = None,
+    profiler: Profiler | None = None,
+    store: TrajectoryStore | None = None,
 ) -> list[TrialResult]:
     """
     Run many seeds across many policies.
     Returns per-(policy, seed) results so you can compute distributions later.
-    """
-    metrics_list = list(metrics)
-    results: list[TrialResult] = []
 
-    for policy in policies:
-        for seed in seeds:
-            run = simulate(domain, policy, cfg, seed=seed)
-            scored = tuple(
-                MetricResult(metric=m.name, value=float(m.evaluate(run.trajectory)))
-                for m in metrics_list
-            )
-            results.append(
-                TrialResult(
-                    domain=run.domain,
-                    policy=run.policy,
-                    seed=seed,
-                    metrics=scored,
-                    run=run,
-                )
-            )
+    workers: if > 1, spread the (policy, seed) grid over a process pool.
+    executor: run chunks on this executor instead (it is not shut down).
+    chunksize: seeds per work unit; defaults to a few chunks per worker.
+    cache: serve previously computed (policy, seed) cells from disk and
+    simulate only the missing ones (see engine.cache.TrialCache).
+    profiler: collect per-phase timings, including worker processes and
+    metric scoring (see engine.profile.Profiler).
+    store: write every trajectory to disk as it is produced (see
+    engine.store.TrajectoryStore); trials then hold lazy views of them.
 
-    return results
+    Parallel runs return exactly the serial results, in the same
+    policy-major, seed-minor order. Domain, policies and metrics must be
+    picklable.
+
+    With cfg.warmup > 0 each seed's warm-up is simulated once and shared by
+    all policies; results are identical to re-simulating it per policy.
+
+    Policies with decide_many (MultiSeedPolicy) decide for all seeds of a
+    work unit in one call per timestep (see simulate_many); chunksize sets
+    how many seeds that is.
+    """
+    indexed = list(
+        _iter_indexed(
+            domain=domain,
+            policies_list=list(policies),
+            metrics_list=list(metrics),
+            seeds_list=list(seeds),
+            cfg=cfg,
+            workers=workers,
+            executor=executor,
+            chunksize=chunksize,
+            keep_runs=True,
+            cache=cache,
+            profiler=profiler,
+            store=store,
+        )
+    )
+    if cfg.warmup > 0:
+        # stable sort on the policy index restores policy-major, seed-minor order
+        indexed.sort(key=lambda pair: pair[0])
+    return [tr for _, tr in indexed]
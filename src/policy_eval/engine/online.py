@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import math
+from typing import Iterable
+
+import numpy as np
+
+from policy_eval.engine.compare import DistSummary, _quantile
+from policy_eval.engine.experiment import TrialResult
+
+
+@dataclass
+class QuantileSketch:
+    """
+    Mergeable quantile sketch (KLL-style compactor hierarchy).
+
+    Level i holds items of weight 2**i. When a level exceeds k items it is
+    sorted and every other item is promoted to the next level. Compaction
+    offsets alternate deterministically, so the sketch is reproducible.
+    Exact while fewer than k values have been added.
+    """
+    k: int = 256
+    levels: list[list[float]] = field(default_factory=lambda: [[]])
+    _flips: list[int] = field(default_factory=lambda: [0])
+
+    def add(self, x: float) -> None:
+        self.levels[0].append(float(x))
+        if len(self.levels[0]) > self.k:
+            self._compress()
+
+    def extend(self, values: Iterable[float]) -> None:
+        self.levels[0].extend(float(x) for x in values)
+        self._compress()
+
+    def merge(self, other: QuantileSketch) -> None:
+        for i, items in enumerate(other.levels):
+            if i >= len(self.levels):
+                self.levels.append([])
+                self._flips.append(0)
+            self.levels[i].extend(items)
+        self._compress()
+
+    def _compress(self) -> None:
+        i = 0
+        while i < len(self.levels):
+            level = self.levels[i]
+            if len(level) > self.k:
+                level.sort()
+                # an odd leftover stays at this level so no weight is lost
+                keep = [level.pop()] if len(level) % 2 else []
+                offset = self._flips[i]
+                self._flips[i] ^= 1
+                if i + 1 == len(self.levels):
+                    self.levels.append([])
+                    self._flips.append(0)
+                self.levels[i + 1].extend(level[offset::2])
+                self.levels[i] = keep
+            i += 1
+
+    @property
+    def exact(self) -> bool:
+        return len(self.levels) == 1
+
+    def quantile(self, q: float) -> float:
+        """
+        Linear-interpolation quantile, matching compare._quantile when exact.
+        """
+        if self.exact:
+            return _quantile(sorted(self.levels[0]), q)
+
+        weighted = sorted(
+            (x, 1 << i) for i, items in enumerate(self.levels) for x in items
+        )
+        if not weighted:
+            raise ValueError("Cannot compute quantile of empty sketch")
+        total = sum(w for _, w in weighted)
+        pos = (total - 1) * q
+        lo = int(pos)
+        frac = pos - lo
+
+        def at(rank: int) -> float:
+            seen = 0
+            for x, w in weighted:
+                seen += w
+                if rank < seen:
+                    return x
+            return weighted[-1][0]
+
+        return at(lo) * (1 - frac) + at(min(lo + 1, total - 1)) * frac
+
+
+@dataclass
+class OnlineDist:
+    """
+    Constant-memory accumulator for one (policy, metric) distribution.
+
+    Welford for mean/std, exact min/max, QuantileSketch for p10/p50/p90.
+    Accumulators are mergeable, e.g. across workers or batches of seeds.
+    """
+    n: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    min: float = math.inf
+    max: float = -math.inf
+    sketch: QuantileSketch = field(default_factory=QuantileSketch)
+
+    def add(self, x: float) -> None:
+        x = float(x)
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (x - self.mean)
+        self.min = min(self.min, x)
+        self.max = max(self.max, x)
+        self.sketch.add(x)
+
+    @classmethod
+    def from_values(cls, values: np.ndarray) -> OnlineDist:
+        """
+        Accumulator over a whole array at once (moments in NumPy).
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        acc = cls()
+        if values.size == 0:
+            return acc
+        acc.n = int(values.size)
+        acc.mean = float(values.mean())
+        acc.m2 = float(((values - acc.mean) ** 2).sum())
+        acc.min = float(values.min())
+        acc.max = float(values.max())
+        acc.sketch.extend(values.tolist())
+        return acc
+
+    def merge(self, other: OnlineDist) -> None:
+        if other.n == 0:
+            return
+        n = self.n + other.n
+        delta = other.mean - self.mean
+        self.mean += delta * other.n / n
+        self.m2 += other.m2 + delta * delta * self.n * other.n / n
+        self.n = n
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.sketch.merge(other.sketch)
+
+    def summary(self) -> DistSummary:
+        if self.n == 0:
+            raise ValueError("Cannot summarize an empty accumulator")
+        return DistSummary(
+            n=self.n,
+            mean=self.mean,
+            std=(self.m2 / self.n) ** 0.5,
+            min=self.min,
+            p10=self.sketch.quantile(0.10),
+            p50=self.sketch.quantile(0.50),
+            p90=self.sketch.quantile(0.90),
+            max=self.max,
+        )
+
+
+def accumulate(
+    trials: Iterable[TrialResult],
+    into: dict[tuple[str, str], OnlineDist] | None = None,
+) -> dict[tuple[str, str], OnlineDist]:
+    """
+    Feeds metric values into {(policy_name, metric_name) -> OnlineDist}.
+    Trials are consumed one at a time and not retained.
+    """
+    accs = {} if into is None else into
+    for tr in trials:
+        for mr in tr.metrics:
+            key = (tr.policy, mr.metric)
+            acc = accs.get(key)
+            if acc is None:
+                acc = accs[key] = OnlineDist()
+            acc.add(mr.value)
+    return accs
+
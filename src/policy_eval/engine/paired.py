@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import math
+from statistics import NormalDist
+from typing import Literal
+
+import numpy as np
+
+from policy_eval.engine.columnar import MetricTable
+from policy_eval.engine.compare import Direction
+
+
+@dataclass(frozen=True)
+class PairedDiff:
+    """
+    Per-seed difference a - b on one metric.
+    win_rate: share of seeds where a did better than b (ties count half).
+    """
+    a: str
+    b: str
+    metric: str
+    n: int
+    mean: float
+    std: float
+    ci_low: float
+    ci_high: float
+    win_rate: float
+
+
+@dataclass(frozen=True)
+class PairedMatrix:
+    """
+    All pairwise differences for one metric; entry [i, j] is policy i
+    minus policy j.
+    """
+    policies: tuple[str, ...]
+    metric: str
+    direction: Direction
+    n: int
+    mean: np.ndarray
+    std: np.ndarray
+    ci_low: np.ndarray
+    ci_high: np.ndarray
+    win_rate: np.ndarray
+
+    def pair(self, a: str, b: str) -> PairedDiff:
+        i, j = self.policies.index(a), self.policies.index(b)
+        return PairedDiff(
+            a=a,
+            b=b,
+            metric=self.metric,
+            n=self.n,
+            mean=float(self.mean[i, j]),
+            std=float(self.std[i, j]),
+            ci_low=float(self.ci_low[i, j]),
+            ci_high=float(self.ci_high[i, j]),
+            win_rate=float(self.win_rate[i, j]),
+        )
+
+    def dominance(self, tol: float = 0.0) -> np.ndarray:
+        """
+        Boolean [i, j]: i is better than j with confidence (the whole
+        interval is on i's side, beyond tol).
+        """
+        if self.direction == "higher_better":
+            return self.ci_low > tol
+        return self.ci_high < -tol
+
+
+def _t_cdf_central(t: float, df: int) -> float:
+    """
+    P(|T| < t) for t >= 0 and integer df, from the finite series in
+    Abramowitz & Stegun 26.7.3/26.7.4 (exact up to rounding).
+    """
+    theta = math.atan(t / math.sqrt(df))
+    c2 = math.cos(theta) ** 2
+    if df % 2 == 0:
+        term = total = 1.0
+        for k in range(1, df // 2):
+            term *= c2 * (2 * k - 1) / (2 * k)
+            total += term
+        return math.sin(theta) * total
+    if df == 1:
+        return 2 * theta / math.pi
+    term = total = 1.0
+    for k in range(1, (df - 1) // 2):
+        term *= c2 * (2 * k) / (2 * k + 1)
+        total += term
+    return 2 / math.pi * (theta + math.sin(theta) * math.cos(theta) * total)
+
+
+def _t_quantile(p: float, df: int) -> float:
+    """
+    Student-t quantile. For df <= 30 the exact CDF is inverted by
+    bisection; above that the Cornish-Fisher expansion around the normal
+    is accurate to ~1e-6. NumPy has no t distribution and the package has
+    no SciPy dependency.
+    """
+    if df <= 0:
+        return float("inf")
+    if p < 0.5:
+        return -_t_quantile(1 - p, df)
+    if df <= 30:
+        target = 2 * p - 1
+        lo, hi = 0.0, 1.0
+        while _t_cdf_central(hi, df) < target:
+            lo, hi = hi, 2 * hi
+        for _ in range(100):
+            mid = (lo + hi) / 2
+            if _t_cdf_central(mid, df) < target:
+                lo = mid
+            else:
+                hi = mid
+            if hi - lo <= 1e-12 * hi:
+                break
+        return (lo + hi) / 2
+    z = NormalDist().inv_cdf(p)
+    z2 = z * z
+    g1 = (z2 + 1) * z / 4
+    g2 = ((5 * z2 + 16) * z2 + 3) * z / 96
+    g3 = (((3 * z2 + 19) * z2 + 17) * z2 - 15) * z / 384
+    g4 = ((((79 * z2 + 776) * z2 + 1482) * z2 - 1920) * z2 - 945) * z / 92160
+    return z + g1 / df + g2 / df**2 + g3 / df**3 + g4 / df**4
+
+
+def _win_rate(x: np.ndarray, direction: Direction, block: int = 64) -> np.ndarray:
+    p, n = x.shape
+    out = np.empty((p, p))
+    sign = 1.0 if direction == "higher_better" else -1.0
+    # row blocks bound the [block, P, S] temporary
+    for start in range(0, p, block):
+        d = sign * (x[start : start + block, None, :] - x[None, :, :])
+        out[start : start + block] = ((d > 0).sum(-1) + 0.5 * (d == 0).sum(-1)) / n
+    return out
+
+
+def paired_differences(
+    table: MetricTable,
+    metric: str,
+    *,
+    direction: Direction,
+    confidence: float = 0.95,
+    method: Literal["t", "bootstrap"] = "t",
+    n_boot: int = 2000,
+    seed: int = 0,
+) -> PairedMatrix:
+    """
+    Paired comparison of every policy pair on the seeds they share.
+
+    Policies saw identical randomness per seed, so per-seed differences
+    cancel the common noise; their interval is usually far tighter than
+    comparing marginal summaries. Everything is computed from the
+    [policy, seed] matrix at once: means and covariances give the
+    difference mean/std without materializing [P, P, S].
+    """
+    x = table.values[:, table.metric_index[metric]].astype(np.float64)
+    p, n = x.shape
+    if n < 2:
+        raise ValueError("Paired differences need at least two seeds")
+
+    means = x.mean(axis=1)
+    cov = np.atleast_2d(np.cov(x))
+    var_diff = np.diag(cov)[:, None] + np.diag(cov)[None, :] - 2 * cov
+    std = np.sqrt(np.clip(var_diff, 0.0, None))
+    mean = means[:, None] - means[None, :]
+
+    alpha = 1 - confidence
+    if method == "t":
+        half = _t_quantile(1 - alpha / 2, n - 1) * std / np.sqrt(n)
+        low, high = mean - half, mean + half
+    elif method == "bootstrap":
+        # resampling seeds = multinomial weights; the resampled mean of a
+        # difference is the difference of resampled means
+        rng = np.random.default_rng(seed)
+        weights = rng.multinomial(n, np.full(n, 1.0 / n), size=n_boot) / n
+        boot = x @ weights.T  # [P, n_boot]
+        low, high = np.empty((p, p)), np.empty((p, p))
+        for start in range(0, p, 64):
+            diffs = boot[start : start + 64, None, :] - boot[None, :, :]
+            low[start : start + 64], high[start : start + 64] = np.quantile(
+                diffs, [alpha / 2, 1 - alpha / 2], axis=-1
+            )
+    else:
+        raise ValueError(f"Unknown method {method!r}")
+
+    return PairedMatrix(
+        policies=table.policies,
+        metric=metric,
+        direction=direction,
+        n=n,
+        mean=mean,
+        std=std,
+        ci_low=low,
+        ci_high=high,
+        win_rate=_win_rate(x, direction),
+    )
+
+
+def paired_dominance_report(
+    table: MetricTable,
+    *,
+    metric: str,
+    direction: Direction,
+    confidence: float = 0.95,
+    tol: float = 0.0,
+) -> list[tuple[str, str]]:
+    """
+    Paired counterpart of compare.pairwise_dominance_report: returns
+    (winner_policy, loser_policy) pairs whose paired interval excludes tol.
+    """
+    pm = paired_differences(table, metric, direction=direction, confidence=confidence)
+    wins = pm.dominance(tol)
+    np.fill_diagonal(wins, False)
+    return [(pm.policies[i], pm.policies[j]) for i, j in zip(*np.nonzero(wins))]
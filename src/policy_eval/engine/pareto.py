@@ -3,6 +3,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Literal
 
+import numpy as np
+
 from policy_eval.engine.compare import DistSummary
 
 
@@ -22,16 +24,101 @@ def _value(s: DistSummary, criterion: Criterion) -> float:
     return float(getattr(s, criterion))
 
 
-def _better_or_equal(a: float, b: float, direction: Direction, tol: float) -> bool:
-    if direction == "higher_better":
-        return a >= b - tol
-    return a <= b + tol
+def _value_matrix(
+    summaries: dict[tuple[str, str], DistSummary],
+    metrics: list[MetricSpec],
+) -> tuple[list[str], np.ndarray, np.ndarray]:
+    """
+    [policy, metric] criterion values, sign-flipped so higher is always
+    better, and the per-metric tol. Policies are sorted by name.
+    """
+    policies = sorted({p for (p, _) in summaries.keys()})
+    values = np.array(
+        [[_value(summaries[(p, ms.name)], ms.criterion) for ms in metrics] for p in policies],
+        dtype=np.float64,
+    ).reshape(len(policies), len(metrics))
+    sign = np.array([1.0 if ms.direction == "higher_better" else -1.0 for ms in metrics])
+    tol = np.array([ms.tol for ms in metrics], dtype=np.float64)
+    return policies, values * sign, tol
 
 
-def _strictly_better(a: float, b: float, direction: Direction, tol: float) -> bool:
-    if direction == "higher_better":
-        return a > b + tol
-    return a < b - tol
+def _dominated_brute(x: np.ndarray, tol: np.ndarray, block: int = 256) -> np.ndarray:
+    """
+    Rows of x dominated by some other row: >= on all metrics within tol and
+    strictly better beyond tol on one. With tol > 0 the relation is not
+    transitive, so every pair is checked, in row blocks.
+    """
+    p, m = x.shape
+    out = np.zeros(p, dtype=bool)
+    for start in range(0, p, block):
+        rows = x[start : start + block]
+        # one metric at a time keeps temporaries at [block, P]
+        ge = np.ones((rows.shape[0], p), dtype=bool)
+        gt = np.zeros((rows.shape[0], p), dtype=bool)
+        for k in range(m):
+            col = x[:, k]
+            ge &= col[None, :] >= rows[:, k, None] - tol[k]
+            gt |= col[None, :] > rows[:, k, None] + tol[k]
+        beats = ge & gt
+        idx = np.arange(rows.shape[0])
+        beats[idx, start + idx] = False
+        out[start : start + block] = beats.any(axis=1)
+    return out
+
+
+def _front_sweep(x: np.ndarray) -> np.ndarray:
+    # x: unique rows, sorted lexicographically descending. A row is dominated
+    # iff an earlier row is >= on the second metric.
+    best_before = np.maximum.accumulate(np.concatenate(([-np.inf], x[:-1, 1])))
+    return x[:, 1] > best_before
+
+
+def _front_kung(x: np.ndarray, base: int = 64) -> np.ndarray:
+    """
+    Kung et al.'s divide and conquer. x holds unique rows sorted
+    lexicographically descending, so a row can only be dominated by an
+    earlier one and plain >= on every metric implies dominance.
+    Returns the indices of non-dominated rows.
+    """
+    n = x.shape[0]
+    if n <= base:
+        ge = (x[:, None, :] >= x[None, :, :]).all(axis=-1)
+        earlier = np.tri(n, k=-1, dtype=bool).T  # [j, i]: j before i
+        return np.flatnonzero(~(ge & earlier).any(axis=0))
+    half = n // 2
+    top = _front_kung(x[:half], base)
+    bottom = half + _front_kung(x[half:], base)
+    t = x[top]
+    keep = np.ones(len(bottom), dtype=bool)
+    for start in range(0, len(bottom), base):
+        b = x[bottom[start : start + base]]
+        keep[start : start + base] = ~(t[None, :, :] >= b[:, None, :]).all(axis=-1).any(axis=1)
+    return np.concatenate((top, bottom[keep]))
+
+
+def _front_mask(x: np.ndarray, tol: np.ndarray) -> np.ndarray:
+    """
+    Boolean mask of non-dominated rows of a higher-is-better matrix.
+    """
+    p, m = x.shape
+    if p == 0 or m == 0:
+        return np.ones(p, dtype=bool)
+    if np.any(tol != 0):
+        return ~_dominated_brute(x, tol)
+
+    # identical rows never dominate each other and share their fate
+    uniq, inverse = np.unique(x, axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    uniq = uniq[::-1]  # lexicographically descending
+    if m == 1:
+        keep = np.zeros(len(uniq), dtype=bool)
+        keep[0] = True
+    elif m == 2:
+        keep = _front_sweep(uniq)
+    else:
+        keep = np.zeros(len(uniq), dtype=bool)
+        keep[_front_kung(uniq)] = True
+    return keep[::-1][inverse]
 
 
 def pareto_front(
@@ -41,34 +128,29 @@ def pareto_front(
     """
     summaries: {(policy, metric_name) -> DistSummary}
     returns: list of policy names that are Pareto-optimal across the given metrics.
+
+    With zero tol everywhere this is a sort-based skyline (a sweep for two
+    metrics, Kung's divide and conquer for more); any tol falls back to a
+    blocked all-pairs check.
     """
-    policies = sorted({p for (p, _) in summaries.keys()})
+    policies, x, tol = _value_matrix(summaries, metrics)
+    mask = _front_mask(x, tol)
+    return [p for p, keep in zip(policies, mask) if keep]
+
 
-    def dominates(pa: str, pb: str) -> bool:
-        # pa dominates pb if pa is >= on all metrics and strictly better on at least one
-        any_strict = False
-        for ms in metrics:
-            sa = summaries[(pa, ms.name)]
-            sb = summaries[(pb, ms.name)]
-            va = _value(sa, ms.criterion)
-            vb = _value(sb, ms.criterion)
-
-            if not _better_or_equal(va, vb, ms.direction, ms.tol):
-                return False
-            if _strictly_better(va, vb, ms.direction, ms.tol):
-                any_strict = True
-        return any_strict
-
-    front = []
-    for p in policies:
-        dominated = False
-        for q in policies:
-            if p == q:
-                continue
-            if dominates(q, p):
-                dominated = True
-                break
-        if not dominated:
-            front.append(p)
-
-    return front
+def pareto_ranks(
+    summaries: dict[tuple[str, str], DistSummary],
+    metrics: list[MetricSpec],
+) -> list[list[str]]:
+    """
+    Non-dominated sorting: layer 0 is the Pareto front, layer k the front
+    of what remains once layers 0..k-1 are removed.
+    """
+    policies, x, tol = _value_matrix(summaries, metrics)
+    remaining = np.arange(len(policies))
+    layers: list[list[str]] = []
+    while remaining.size:
+        mask = _front_mask(x[remaining], tol)
+        layers.append([policies[i] for i in remaining[mask]])
+        remaining = remaining[~mask]
+    return layers
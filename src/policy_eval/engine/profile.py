@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import inspect
+from time import perf_counter_ns
+from typing import Any
+
+import numpy as np
+
+from policy_eval.core.rng import RNG
+
+
+PHASES = (
+    "initial_state",
+    "policy_context",
+    "decide",
+    "observe",
+    "act",
+    "fork",
+    "transition",
+    "record",
+    "finalize",
+    "metrics",
+)
+
+
+@dataclass
+class PhaseStats:
+    """
+    Call count, total/max time and a log2 histogram of call durations.
+    hist[i] counts calls that took [2**(i-1), 2**i) nanoseconds.
+    """
+    count: int = 0
+    total_ns: int = 0
+    max_ns: int = 0
+    hist: list[int] = field(default_factory=lambda: [0] * 64)
+
+    def add(self, ns: int) -> None:
+        self.count += 1
+        self.total_ns += ns
+        if ns > self.max_ns:
+            self.max_ns = ns
+        self.hist[min(ns.bit_length(), 63)] += 1
+
+    def merge(self, other: PhaseStats) -> None:
+        self.count += other.count
+        self.total_ns += other.total_ns
+        self.max_ns = max(self.max_ns, other.max_ns)
+        self.hist = [a + b for a, b in zip(self.hist, other.hist)]
+
+    @property
+    def mean_ns(self) -> float:
+        return self.total_ns / self.count if self.count else 0.0
+
+    def quantile_ns(self, q: float) -> int:
+        """
+        Upper bound of the histogram bucket holding the q-quantile.
+        """
+        target = q * self.count
+        seen = 0
+        for i, c in enumerate(self.hist):
+            seen += c
+            if c and seen >= target:
+                return 1 << i
+        return self.max_ns
+
+
+@dataclass
+class Profiler:
+    """
+    Per-(domain, policy, phase) timings collected by simulate and
+    run_experiment when passed profiler=...
+
+    Profiling wraps the domain, policy, actors and RNG in timing proxies;
+    runs without a profiler take the unwrapped path and pay nothing.
+    """
+    stats: dict[tuple[str, str, str], PhaseStats] = field(default_factory=dict)
+
+    def record(self, domain: str, policy: str, phase: str, ns: int) -> None:
+        key = (domain, policy, phase)
+        st = self.stats.get(key)
+        if st is None:
+            st = self.stats[key] = PhaseStats()
+        st.add(ns)
+
+    def merge(self, other: Profiler) -> None:
+        for key, st in other.stats.items():
+            mine = self.stats.get(key)
+            if mine is None:
+                mine = self.stats[key] = PhaseStats()
+            mine.merge(st)
+
+    def totals(self) -> dict[str, float]:
+        """
+        Seconds per phase, summed over domains and policies.
+        """
+        out: dict[str, float] = {}
+        for (_, _, phase), st in self.stats.items():
+            out[phase] = out.get(phase, 0.0) + st.total_ns / 1e9
+        return out
+
+    def report(self) -> str:
+        lines = [
+            f"{'domain':<14}{'policy':<16}{'phase':<16}{'calls':>10}"
+            f"{'total_s':>10}{'mean_us':>10}{'p90_us':>10}{'max_us':>10}"
+        ]
+        order = {p: i for i, p in enumerate(PHASES)}
+        for (d, p, phase), st in sorted(
+            self.stats.items(), key=lambda kv: (kv[0][0], kv[0][1], order.get(kv[0][2], 99))
+        ):
+            lines.append(
+                f"{d:<14}{p:<16}{phase:<16}{st.count:>10}{st.total_ns / 1e9:>10.4f}"
+                f"{st.mean_ns / 1e3:>10.2f}{st.quantile_ns(0.9) / 1e3:>10.2f}{st.max_ns / 1e3:>10.2f}"
+            )
+        return "\n".join(lines)
+
+
+class _Timed:
+    """
+    Base for timing proxies: unknown attributes pass through unchanged.
+    """
+
+    def __init__(self, inner: Any, profiler: Profiler, domain: str, policy: str) -> None:
+        self._inner = inner
+        self._profiler = profiler
+        self._domain = domain
+        self._policy = policy
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._inner, name)
+
+    def _time(self, phase: str, fn: Any, *args: Any, **kwargs: Any) -> Any:
+        start = perf_counter_ns()
+        out = fn(*args, **kwargs)
+        if inspect.isawaitable(out):
+            # async decide/act (engine.aio): the call ends when its result arrives
+            return self._awaited(phase, start, out)
+        self._profiler.record(self._domain, self._policy, phase, perf_counter_ns() - start)
+        return out
+
+    async def _awaited(self, phase: str, start: int, out: Any) -> Any:
+        value = await out
+        self._profiler.record(self._domain, self._policy, phase, perf_counter_ns() - start)
+        return value
+
+    def _wrap(self, cls: type[_Timed], inner: Any) -> Any:
+        return cls(inner, self._profiler, self._domain, self._policy)
+
+
+class TimedActor(_Timed):
+    def act(self, obs: Any, rng: Any) -> Any:
+        return self._time("act", self._inner.act, obs, rng)
+
+
+class TimedPopulation(_Timed):
+    def act_batch(self, obs: Any, draws: np.ndarray) -> Any:
+        return self._time("act", self._inner.act_batch, obs, draws)
+
+
+class TimedPolicy(_Timed):
+    def decide(self, ctx: Any) -> Any:
+        return self._time("decide", self._inner.decide, ctx)
+
+
+class TimedRNG(_Timed):
+    def fork(self, *keys: object) -> np.random.Generator:
+        return self._time("fork", self._inner.fork, *keys)
+
+    def uniforms(self, stream_keys: np.ndarray, t: int, k: int) -> np.ndarray:
+        return self._time("fork", self._inner.uniforms, stream_keys, t, k)
+
+
+class TimedDomain(_Timed):
+    def initial_state(self, rng: Any) -> Any:
+        return self._time("initial_state", self._inner.initial_state, rng)
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._inner, name)
+        if name == "population":
+            # only present when the wrapped domain has one (simulate checks hasattr)
+            return lambda state: self._wrap(TimedPopulation, attr(state))
+        return attr
+
+    def actors(self, state: Any) -> list[Any]:
+        return [self._wrap(TimedActor, a) for a in self._inner.actors(state)]
+
+    def policy_context(self, state: Any, t: int) -> Any:
+        return self._time("policy_context", self._inner.policy_context, state, t)
+
+    def observe(self, state: Any, actor: Any, t: int) -> Any:
+        inner_actor = actor._inner if isinstance(actor, TimedActor) else actor
+        return self._time("observe", self._inner.observe, state, inner_actor, t)
+
+    def observe_population(self, state: Any, population: Any, t: int) -> Any:
+        inner = population._inner if isinstance(population, TimedPopulation) else population
+        return self._time("observe", self._inner.observe_population, state, inner, t)
+
+    def transition(self, **kwargs: Any) -> Any:
+        return self._time("transition", self._inner.transition, **kwargs)
+
+    def record(self, state: Any, t: int) -> Any:
+        return self._time("record", self._inner.record, state, t)
+
+    def record_row(self, state: Any, t: int) -> Any:
+        return self._time("record", self._inner.record_row, state, t)
+
+    def finalize(self, events: Any, final_state: Any) -> Any:
+        return self._time("finalize", self._inner.finalize, events, final_state)
+
+
+def instrument(
+    domain: Any, policy: Any, base: RNG, profiler: Profiler, policy_name: str
+) -> tuple[TimedDomain, TimedPolicy | None, TimedRNG]:
+    """
+    Wraps one run's collaborators in timing proxies.
+    """
+    timed_policy = None
+    if policy is not None:
+        timed_policy = TimedPolicy(policy, profiler, domain.name, policy_name)
+    return (
+        TimedDomain(domain, profiler, domain.name, policy_name),
+        timed_policy,
+        TimedRNG(base, profiler, domain.name, policy_name),
+    )
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import Iterable
+
+from policy_eval.abstractions.metric import Metric
+from policy_eval.engine.evaluate import EvaluationResult, _summarize
+from policy_eval.engine.experiment import MetricResult, TrialResult
+from policy_eval.engine.pareto import MetricSpec, pareto_front
+from policy_eval.engine.simulator import RunResult
+from policy_eval.engine.store import StoredRun
+
+
+def _as_trial(item: TrialResult | RunResult | StoredRun) -> TrialResult:
+    if isinstance(item, TrialResult):
+        return item
+    return TrialResult(
+        domain=item.domain, policy=item.policy, seed=item.seed, metrics=(), run=item
+    )
+
+
+def rescore(
+    source: EvaluationResult | Iterable[TrialResult | RunResult | StoredRun],
+    metrics: Iterable[Metric],
+    *,
+    pareto_metrics: list[MetricSpec] | None = None,
+) -> EvaluationResult:
+    """
+    Applies metrics to already-produced trajectories; the domain is never
+    touched.
+
+    source: an EvaluationResult, trials, or bare runs (e.g. TrialCache.runs()
+    or TrajectoryStore.runs()).
+    Metric values already on the trials are kept; a metric with the same
+    name is re-scored. Summaries and the Pareto front are recomputed over
+    all metrics.
+    """
+    metrics_list = list(metrics)
+    items = source.trials if isinstance(source, EvaluationResult) else source
+
+    trials: list[TrialResult] = []
+    for item in items:
+        tr = _as_trial(item)
+        if tr.run is None:
+            raise ValueError(
+                f"Trial ({tr.policy}, seed={tr.seed}) has no trajectory to rescore"
+            )
+        values = {mr.metric: mr.value for mr in tr.metrics}
+        for m in metrics_list:
+            values[m.name] = float(m.evaluate(tr.run.trajectory))
+        scored = tuple(MetricResult(metric=k, value=v) for k, v in values.items())
+        trials.append(replace(tr, metrics=scored))
+
+    table, summaries = _summarize(trials)
+
+    pareto_set = None
+    if pareto_metrics is not None:
+        pareto_set = pareto_front(summaries, pareto_metrics)
+
+    return EvaluationResult(
+        trials=trials, summaries=summaries, pareto=pareto_set, table=table
+    )
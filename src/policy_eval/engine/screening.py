@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass, replace
+import math
+import os
+from typing import Iterable
+
+from policy_eval.abstractions.domain import Domain
+from policy_eval.abstractions.metric import Metric
+from policy_eval.abstractions.policy import Policy
+from policy_eval.core.types import RunConfig
+from policy_eval.engine.compare import DistSummary
+from policy_eval.engine.evaluate import EvaluationResult, EvaluationSpec, _summarize
+from policy_eval.engine.experiment import TrialResult, _bounded, _default_chunksize, _score
+from policy_eval.engine.pareto import MetricSpec, pareto_front, pareto_ranks
+from policy_eval.engine.simulator import Prefix, simulate_prefix, simulate_resumable
+
+
+@dataclass(frozen=True)
+class Rung:
+    """
+    One fidelity level: the entering policies on `seeds` at `horizon`.
+
+    ranking: entering policies, best first. promoted: those that went on
+    to the next rung (empty for the last one). steps: timesteps simulated
+    here; resumed runs only pay for their extension.
+    """
+    horizon: int
+    seeds: tuple[int, ...]
+    result: EvaluationResult
+    ranking: tuple[str, ...]
+    promoted: tuple[str, ...]
+    steps: int
+
+
+@dataclass(frozen=True)
+class ScreeningResult:
+    rungs: tuple[Rung, ...]
+    full_steps: int  # timesteps a full-fidelity evaluation of every policy would take
+
+    @property
+    def final(self) -> EvaluationResult:
+        """
+        The survivors at full horizon on all seeds.
+        """
+        return self.rungs[-1].result
+
+    @property
+    def ranking(self) -> tuple[str, ...]:
+        return self.rungs[-1].ranking
+
+    @property
+    def steps(self) -> int:
+        return sum(r.steps for r in self.rungs)
+
+
+def _rank(
+    summaries: dict[tuple[str, str], DistSummary], names: list[str], rank_by: list[MetricSpec]
+) -> list[str]:
+    """
+    Best first: by Pareto layer over rank_by, then by the first spec's
+    criterion; ties keep the entering order.
+    """
+    first = rank_by[0]
+    sign = -1.0 if first.direction == "higher_better" else 1.0
+    order = {n: i for i, n in enumerate(names)}
+
+    def key(name: str) -> tuple[float, int]:
+        return sign * float(getattr(summaries[(name, first.name)], first.criterion)), order[name]
+
+    if len(rank_by) == 1:
+        return sorted(names, key=key)
+    layers = pareto_ranks(summaries, rank_by)
+    return [n for layer in layers for n in sorted(layer, key=key)]
+
+
+def _schedule(
+    n_rungs: int, horizon: int, n_seeds: int, min_horizon: int, min_seeds: int
+) -> list[tuple[int, int]]:
+    """
+    (horizon, seed count) per rung, geometric from the minimums up to the
+    full fidelity.
+    """
+    out: list[tuple[int, int]] = []
+    prev_h, prev_s = 1, 1
+    for r in range(n_rungs):
+        frac = r / (n_rungs - 1) if n_rungs > 1 else 1.0
+        h = round(min_horizon * (horizon / min_horizon) ** frac)
+        s = round(min_seeds * (n_seeds / min_seeds) ** frac)
+        prev_h, prev_s = min(horizon, max(h, prev_h)), min(n_seeds, max(s, prev_s))
+        out.append((prev_h, prev_s))
+    return out
+
+
+_Unit = tuple[Policy, list[int], list[Prefix | None]]
+
+
+def _run_unit(
+    domain: Domain,
+    policy: Policy,
+    metrics_list: list[Metric],
+    cfg: RunConfig,
+    seeds: list[int],
+    prefixes: list[Prefix | None],
+    keep_snapshots: bool,
+) -> list[tuple[TrialResult, Prefix | None]]:
+    out = []
+    for seed, prefix in zip(seeds, prefixes):
+        run, snapshot = simulate_resumable(domain, policy, cfg, seed, prefix=prefix)
+        out.append((_score(run, metrics_list, False, None), snapshot if keep_snapshots else None))
+    return out
+
+
+def _run_rung(
+    units: list[_Unit],
+    *,
+    domain: Domain,
+    metrics_list: list[Metric],
+    cfg: RunConfig,
+    keep_snapshots: bool,
+    workers: int | None,
+    executor: Executor | None,
+) -> list[tuple[TrialResult, Prefix | None]]:
+    if executor is None and (workers is None or workers <= 1):
+        return [
+            out
+            for policy, seeds, prefixes in units
+            for out in _run_unit(domain, policy, metrics_list, cfg, seeds, prefixes, keep_snapshots)
+        ]
+
+    def submit(ex: Executor, unit: _Unit) -> Future[list[tuple[TrialResult, Prefix | None]]]:
+        policy, seeds, prefixes = unit
+        return ex.submit(
+            _run_unit, domain, policy, metrics_list, cfg, seeds, prefixes, keep_snapshots
+        )
+
+    return [
+        out
+        for outs in _bounded(units, submit, Future.result, workers=workers, executor=executor)
+        for out in outs
+    ]
+
+
+def successive_halving(
+    *,
+    domain: Domain,
+    policies: Iterable[Policy],
+    metrics: Iterable[Metric],
+    seeds: Iterable[int],
+    cfg: RunConfig,
+    rank_by: list[MetricSpec],
+    eta: int = 3,
+    rungs: int | None = None,
+    min_horizon: int | None = None,
+    min_seeds: int | None = None,
+    workers: int | None = None,
+    executor: Executor | None = None,
+) -> ScreeningResult:
+    """
+    Multi-fidelity screening: every policy runs at a short horizon on a
+    few seeds, the best 1/eta (by rank_by: one MetricSpec, or Pareto rank
+    over several) move to a longer horizon and more seeds, and so on until
+    the last rung evaluates the survivors at cfg.horizon on all seeds.
+
+    Promoted runs continue from their end-of-rung snapshot rather than
+    restarting (streams are keyed on t, so the result equals a fresh
+    run); only newly added seeds start from scratch. The last rung's
+    result therefore equals evaluate() on the survivors.
+
+    rungs: default 1 + floor(log_eta(len(policies))). min_horizon and
+    min_seeds set the first rung (default: the full fidelity divided by
+    eta ** (rungs - 1), past the warm-up); later rungs grow geometrically.
+    """
+    policies_list = list(policies)
+    metrics_list = list(metrics)
+    seeds_list = list(seeds)
+    if eta < 2:
+        raise ValueError("eta must be at least 2")
+    if not rank_by:
+        raise ValueError("rank_by needs at least one MetricSpec")
+    if rungs is None:
+        rungs = 1
+        while eta**rungs <= len(policies_list):
+            rungs += 1
+    span = eta ** (rungs - 1)
+    if min_horizon is None:
+        min_horizon = max(min(cfg.warmup + 1, cfg.horizon), cfg.horizon // span, 1)
+    if min_seeds is None:
+        min_seeds = max(1, len(seeds_list) // span)
+    schedule = _schedule(rungs, cfg.horizon, len(seeds_list), min_horizon, min_seeds)
+
+    entering = policies_list
+    snapshots: dict[tuple[str, int], Prefix] = {}
+    out: list[Rung] = []
+    for r, (horizon, n_seeds) in enumerate(schedule):
+        last = r == len(schedule) - 1
+        rung_cfg = replace(cfg, horizon=horizon)
+        rung_seeds = seeds_list[:n_seeds]
+
+        # fresh seeds share their policy-independent warm-up, as in run_experiment
+        warm: dict[int, Prefix] = {}
+        if cfg.warmup > 0 and len(entering) > 1:
+            for s in rung_seeds:
+                if not any((p.name, s) in snapshots for p in entering):
+                    warm[s] = simulate_prefix(domain, rung_cfg, s)
+
+        chunk = len(rung_seeds)
+        if executor is not None or (workers is not None and workers > 1):
+            chunk = _default_chunksize(len(rung_seeds), workers or os.cpu_count() or 1)
+        units: list[_Unit] = []
+        steps = sum(p.t for p in warm.values())
+        for policy in entering:
+            prefixes = [snapshots.get((policy.name, s), warm.get(s)) for s in rung_seeds]
+            steps += sum(horizon - (p.t if p is not None else 0) for p in prefixes)
+            for c in range(0, len(rung_seeds), chunk):
+                units.append((policy, rung_seeds[c : c + chunk], prefixes[c : c + chunk]))
+
+        ran = _run_rung(
+            units,
+            domain=domain,
+            metrics_list=metrics_list,
+            cfg=rung_cfg,
+            keep_snapshots=not last,
+            workers=workers,
+            executor=executor,
+        )
+        trials = [trial for trial, _ in ran]
+        table, summaries = _summarize(trials)
+        ranking = _rank(summaries, [p.name for p in entering], rank_by)
+        promoted = () if last else tuple(ranking[: math.ceil(len(entering) / eta)])
+        out.append(
+            Rung(
+                horizon=horizon,
+                seeds=tuple(rung_seeds),
+                result=EvaluationResult(
+                    trials=trials,
+                    summaries=summaries,
+                    pareto=pareto_front(summaries, rank_by),
+                    table=table,
+                    spec=EvaluationSpec(
+                        domain=domain,
+                        policies=tuple(entering),
+                        metrics=tuple(metrics_list),
+                        seeds=tuple(rung_seeds),
+                        cfg=rung_cfg,
+                        pareto_metrics=tuple(rank_by),
+                    ),
+                ),
+                ranking=tuple(ranking),
+                promoted=promoted,
+                steps=steps,
+            )
+        )
+
+        keep = set(promoted)
+        snapshots = {
+            (trial.policy, trial.seed): snap
+            for trial, snap in ran
+            if snap is not None and trial.policy in keep
+        }
+        entering = [p for p in entering if p.name in keep]
+
+    full_steps = len(policies_list) * len(seeds_list) * cfg.horizon
+    return ScreeningResult(rungs=tuple(out), full_steps=full_steps)
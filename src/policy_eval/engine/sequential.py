@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from itertools import islice
+from statistics import NormalDist
+from typing import Callable, Iterable
+
+import numpy as np
+
+from policy_eval.abstractions.domain import Domain
+from policy_eval.abstractions.metric import Metric
+from policy_eval.abstractions.policy import Policy
+from policy_eval.core.types import RunConfig
+from policy_eval.engine.evaluate import EvaluationResult, _summarize
+from policy_eval.engine.columnar import MetricTable
+from policy_eval.engine.experiment import TrialResult, run_experiment
+from policy_eval.engine.online import OnlineDist, accumulate
+from policy_eval.engine.paired import paired_differences
+from policy_eval.engine.pareto import MetricSpec, pareto_front
+
+
+_PairTest = Callable[[str, str, MetricSpec], bool]
+
+
+@dataclass(frozen=True)
+class Interval:
+    mean: float
+    half_width: float
+
+    @property
+    def low(self) -> float:
+        return self.mean - self.half_width
+
+    @property
+    def high(self) -> float:
+        return self.mean + self.half_width
+
+
+@dataclass(frozen=True)
+class SequentialResult:
+    result: EvaluationResult
+    seeds_used: int
+    stopped: str  # "settled", "budget" or "exhausted"
+    dropped: dict[str, int]  # policy -> seeds it had run when dropped
+
+
+def _interval(acc: OnlineDist, z: float) -> Interval:
+    if acc.n < 2:
+        return Interval(mean=acc.mean, half_width=float("inf"))
+    var = acc.m2 / (acc.n - 1)
+    return Interval(mean=acc.mean, half_width=z * (var / acc.n) ** 0.5)
+
+
+def _better(a: Interval, b: Interval, ms: MetricSpec) -> bool:
+    """
+    a's interval lies entirely on the better side of b's (beyond tol).
+    """
+    if ms.direction == "higher_better":
+        return a.low > b.high + ms.tol
+    return a.high < b.low - ms.tol
+
+
+def _settled(a: Interval, b: Interval, ms: MetricSpec, precision: float | None) -> bool:
+    if _better(a, b, ms) or _better(b, a, ms):
+        return True
+    return precision is not None and max(a.half_width, b.half_width) <= precision
+
+
+def _marginal_tests(
+    accs: dict[tuple[str, str], OnlineDist],
+    names: list[str],
+    criteria: list[MetricSpec],
+    z: float,
+    precision: float | None,
+) -> tuple[_PairTest, _PairTest]:
+    ivs = {(p, ms.name): _interval(accs[(p, ms.name)], z) for p in names for ms in criteria}
+
+    def better(a: str, b: str, ms: MetricSpec) -> bool:
+        return _better(ivs[(a, ms.name)], ivs[(b, ms.name)], ms)
+
+    def settled(a: str, b: str, ms: MetricSpec) -> bool:
+        return _settled(ivs[(a, ms.name)], ivs[(b, ms.name)], ms, precision)
+
+    return better, settled
+
+
+class _Columns:
+    """
+    [policy, metric, seed] values of the active policies. Each batch is
+    appended in place (capacity doubles as seeds are added), so the
+    table is not rebuilt from all trials every batch.
+    """
+
+    def __init__(self) -> None:
+        self.policies: tuple[str, ...] = ()
+        self.metrics: tuple[str, ...] = ()
+        self.seeds: list[int] = []
+        self._values = np.empty((0, 0, 0))
+
+    def append(self, batch: MetricTable) -> None:
+        if not self.seeds:
+            self.policies, self.metrics = batch.policies, batch.metrics
+            self._values = np.empty((len(batch.policies), len(batch.metrics), 0))
+        n, k = len(self.seeds), len(batch.seeds)
+        if n + k > self._values.shape[2]:
+            grown = np.empty(self._values.shape[:2] + (max(2 * (n + k), 16),))
+            grown[:, :, :n] = self._values[:, :, :n]
+            self._values = grown
+        self._values[:, :, n : n + k] = batch.values
+        self.seeds.extend(batch.seeds)
+
+    def keep(self, names: list[str]) -> None:
+        if self.seeds and tuple(names) != self.policies:
+            idx = {p: i for i, p in enumerate(self.policies)}
+            self._values = self._values[[idx[p] for p in names]]
+            self.policies = tuple(names)
+
+    def table(self) -> MetricTable:
+        return MetricTable(
+            policies=self.policies,
+            metrics=self.metrics,
+            seeds=tuple(self.seeds),
+            values=self._values[:, :, : len(self.seeds)],
+        )
+
+
+def _paired_tests(
+    columns: _Columns,
+    criteria: list[MetricSpec],
+    confidence: float,
+    precision: float | None,
+) -> tuple[_PairTest, _PairTest]:
+    table = columns.table()
+    idx = table.policy_index
+    mats = {
+        ms.name: paired_differences(
+            table, ms.name, direction=ms.direction, confidence=confidence
+        )
+        for ms in criteria
+    }
+    wins = {ms.name: mats[ms.name].dominance(ms.tol) for ms in criteria}
+
+    def better(a: str, b: str, ms: MetricSpec) -> bool:
+        return bool(wins[ms.name][idx[a], idx[b]])
+
+    def settled(a: str, b: str, ms: MetricSpec) -> bool:
+        if better(a, b, ms) or better(b, a, ms):
+            return True
+        pm = mats[ms.name]
+        i, j = idx[a], idx[b]
+        return precision is not None and (pm.ci_high[i, j] - pm.ci_low[i, j]) / 2 <= precision
+
+    return better, settled
+
+
+def evaluate_sequential(
+    *,
+    domain: Domain,
+    policies: Iterable[Policy],
+    metrics: Iterable[Metric],
+    seeds: Iterable[int],
+    cfg: RunConfig,
+    criteria: list[MetricSpec],
+    batch_size: int = 100,
+    max_seeds: int | None = None,
+    confidence: float = 0.95,
+    target_precision: float | None = None,
+    drop_dominated: bool = True,
+    paired: bool = False,
+    workers: int | None = None,
+    executor: Executor | None = None,
+) -> SequentialResult:
+    """
+    Adds seeds in batches until the comparison is statistically settled.
+
+    After every batch, each criteria metric gets a normal-approximation
+    confidence interval on its mean per policy. Sampling stops once every
+    pair of still-active policies is settled on every criterion: their
+    intervals separate, or (with target_precision) both half-widths are
+    within it. It also stops after max_seeds or when seeds run out.
+
+    drop_dominated: a policy whose interval is beaten by one other policy
+    on every criterion is not run on later batches.
+
+    paired: judge each pair on its per-seed differences instead (see
+    engine.paired). Policies share randomness per seed, so paired
+    intervals are much tighter and settle with fewer seeds; target_precision
+    then bounds the half-width of the difference.
+
+    The returned result holds every trial run; its summaries and Pareto
+    front (over criteria) use all of them.
+
+    Only the "mean" criterion can be tested this way; other criteria
+    raise ValueError.
+    """
+    untestable = sorted({ms.criterion for ms in criteria} - {"mean"})
+    if untestable:
+        raise ValueError(f"Sequential tests compare means; cannot test criteria {untestable}")
+    policies_list = list(policies)
+    metrics_list = list(metrics)
+    seed_iter = iter(seeds)
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+
+    active = list(policies_list)
+    accs: dict[tuple[str, str], OnlineDist] = {}
+    # active policies have all been run on every seed so far
+    columns = _Columns()
+    trials: list[TrialResult] = []
+    dropped: dict[str, int] = {}
+    used = 0
+    stopped = "exhausted"
+
+    while True:
+        take = batch_size if max_seeds is None else min(batch_size, max_seeds - used)
+        batch = list(islice(seed_iter, take))
+        if not batch:
+            stopped = "budget" if max_seeds is not None and used >= max_seeds else "exhausted"
+            break
+
+        new = run_experiment(
+            domain=domain,
+            policies=active,
+            metrics=metrics_list,
+            seeds=batch,
+            cfg=cfg,
+            workers=workers,
+            executor=executor,
+        )
+        trials.extend(new)
+        accumulate(new, into=accs)
+        used += len(batch)
+
+        names = [p.name for p in active]
+        if paired:
+            columns.keep(names)
+            columns.append(MetricTable.from_trials(new))
+            better, settled = _paired_tests(columns, criteria, confidence, target_precision)
+        else:
+            better, settled = _marginal_tests(accs, names, criteria, z, target_precision)
+
+        if drop_dominated:
+            keep = []
+            for p in active:
+                beaten = any(
+                    q is not p and all(better(q.name, p.name, ms) for ms in criteria)
+                    for q in active
+                )
+                if beaten:
+                    dropped[p.name] = used
+                else:
+                    keep.append(p)
+            active = keep
+
+        if all(
+            settled(a.name, b.name, ms)
+            for i, a in enumerate(active)
+            for b in active[i + 1 :]
+            for ms in criteria
+        ):
+            stopped = "settled"
+            break
+
+    table, summaries = _summarize(trials)
+    return SequentialResult(
+        result=EvaluationResult(
+            trials=trials,
+            summaries=summaries,
+            pareto=pareto_front(summaries, criteria) if summaries else None,
+            table=table,
+        ),
+        seeds_used=used,
+        stopped=stopped,
+        dropped=dropped,
+    )
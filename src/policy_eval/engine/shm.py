@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+import os
+from typing import Iterable
+
+import numpy as np
+
+from policy_eval.abstractions.domain import Domain
+from policy_eval.abstractions.metric import Metric
+from policy_eval.abstractions.policy import Policy
+from policy_eval.core.types import RunConfig
+from policy_eval.engine.columnar import MetricTable
+from policy_eval.engine.experiment import (
+    _bounded,
+    _default_chunksize,
+    _iter_chunk,
+    _serial_chunksize,
+)
+from policy_eval.engine.profile import Profiler
+
+
+@dataclass(frozen=True)
+class TableHandle:
+    """
+    What a worker needs to find the shared [policy, metric, seed] array.
+    """
+    name: str
+    shape: tuple[int, int, int]
+
+
+def fill_scores(
+    values: np.ndarray,
+    domain: Domain,
+    policies: list[Policy],
+    rows: list[int],
+    metrics_list: list[Metric],
+    cfg: RunConfig,
+    seeds: list[int],
+    col: int,
+    profiler: Profiler | None,
+) -> None:
+    """
+    Runs policies x seeds and writes the scores of policies[i] into
+    values[rows[i], :, col : col + len(seeds)]. Shared by the
+    shared-memory and distributed backends.
+    """
+    trials = _iter_chunk(domain, policies, metrics_list, cfg, seeds, False, profiler)
+    for row in rows:
+        for s in range(col, col + len(seeds)):
+            values[row, :, s] = [mr.value for mr in next(trials).metrics]
+
+
+def _fill_shared(
+    handle: TableHandle,
+    domain: Domain,
+    policies: list[Policy],
+    rows: list[int],
+    metrics_list: list[Metric],
+    cfg: RunConfig,
+    seeds: list[int],
+    col: int,
+    profile: bool,
+) -> Profiler | None:
+    """
+    Worker side: runs a unit and writes its scores in place. Only the
+    optional profile travels back.
+    """
+    profiler = Profiler() if profile else None
+    block = shared_memory.SharedMemory(name=handle.name)
+    try:
+        values = np.ndarray(handle.shape, dtype=np.float64, buffer=block.buf)
+        fill_scores(values, domain, policies, rows, metrics_list, cfg, seeds, col, profiler)
+        del values
+    finally:
+        block.close()
+    return profiler
+
+
+_Unit = tuple[list[Policy], list[int], list[int], int]
+
+
+def table_units(
+    policies: list[Policy], seeds: list[int], cfg: RunConfig, chunksize: int
+) -> list[_Unit]:
+    """
+    Work units of a [policy, metric, seed] table: (policies, their rows,
+    seeds, first seed column). Same grouping as run_experiment, so a
+    warm-up is shared within a unit.
+    """
+    starts = range(0, len(seeds), chunksize)
+    if cfg.warmup > 0:
+        rows = list(range(len(policies)))
+        return [(policies, rows, seeds[c : c + chunksize], c) for c in starts]
+    return [
+        ([policy], [row], seeds[c : c + chunksize], c)
+        for row, policy in enumerate(policies)
+        for c in starts
+    ]
+
+
+def run_metric_table(
+    *,
+    domain: Domain,
+    policies: Iterable[Policy],
+    metrics: Iterable[Metric],
+    seeds: Iterable[int],
+    cfg: RunConfig,
+    workers: int | None = None,
+    executor: Executor | None = None,
+    chunksize: int | None = None,
+    profiler: Profiler | None = None,
+) -> MetricTable:
+    """
+    Runs the grid and returns only its scores, as a MetricTable.
+
+    Parallel workers write straight into a shared-memory [policy, metric,
+    seed] block; trajectories are dropped in the worker and no trial
+    objects are pickled back. Values equal run_experiment's.
+    """
+    policies_list = list(policies)
+    metrics_list = list(metrics)
+    seeds_list = list(seeds)
+    shape = (len(policies_list), len(metrics_list), len(seeds_list))
+
+    def table(values: np.ndarray) -> MetricTable:
+        return MetricTable(
+            policies=tuple(p.name for p in policies_list),
+            metrics=tuple(m.name for m in metrics_list),
+            seeds=tuple(seeds_list),
+            values=values,
+        )
+
+    if executor is None and (workers is None or workers <= 1):
+        if chunksize is None:
+            chunksize = _serial_chunksize(policies_list, len(seeds_list), cfg)
+        values = np.empty(shape, dtype=np.float64)
+        for unit_policies, rows, unit_seeds, col in table_units(
+            policies_list, seeds_list, cfg, chunksize
+        ):
+            fill_scores(
+                values, domain, unit_policies, rows, metrics_list, cfg, unit_seeds, col, profiler
+            )
+        return table(values)
+
+    n_workers = workers or os.cpu_count() or 1
+    if chunksize is None:
+        chunksize = _default_chunksize(len(seeds_list), n_workers)
+
+    block = shared_memory.SharedMemory(create=True, size=max(1, 8 * int(np.prod(shape))))
+    try:
+        handle = TableHandle(name=block.name, shape=shape)
+
+        def collect(fut: Future[Profiler | None]) -> None:
+            worker_profile = fut.result()
+            if profiler is not None and worker_profile is not None:
+                profiler.merge(worker_profile)
+
+        def submit(ex: Executor, unit: _Unit) -> Future[Profiler | None]:
+            unit_policies, rows, unit_seeds, col = unit
+            return ex.submit(
+                _fill_shared,
+                handle,
+                domain,
+                unit_policies,
+                rows,
+                metrics_list,
+                cfg,
+                unit_seeds,
+                col,
+                profiler is not None,
+            )
+
+        units = table_units(policies_list, seeds_list, cfg, chunksize)
+        for _ in _bounded(units, submit, collect, workers=n_workers, executor=executor):
+            pass
+
+        # one copy out, so the table outlives the shared block
+        values = np.ndarray(shape, dtype=np.float64, buffer=block.buf).copy()
+    finally:
+        block.close()
+        block.unlink()
+    return table(values)
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+import copy
 from dataclasses import dataclass
-from typing import Any
+from time import perf_counter_ns
+from typing import Any, Generator, Iterable, Sequence
 
-from policy_eval.abstractions.domain import Domain
+import numpy as np
+
+from policy_eval.abstractions.domain import BatchDomain, Domain
 from policy_eval.abstractions.actor import Actor, Observation
-from policy_eval.abstractions.policy import Policy
+from policy_eval.abstractions.policy import Policy, PolicyContext
 from policy_eval.core.rng import RNG
-from policy_eval.core.types import RunConfig, Trajectory
+from policy_eval.core.types import ColumnarTrajectory, Event, RunConfig, Trajectory
+from policy_eval.engine.checkpoint import Checkpoint, RunCheckpoint
+from policy_eval.engine.profile import Profiler, instrument
 
 
 @dataclass(frozen=True)
@@ -18,26 +24,151 @@ class RunResult:
     domain: str
     policy: str
     seed: int
-    trajectory: Trajectory
+    trajectory: Trajectory | ColumnarTrajectory
 
 
-def simulate(domain: Domain, policy: Policy, cfg: RunConfig, seed: int) -> RunResult:
-    base = RNG(seed)
+class _PopulationKeys:
+    """
+    Per-run cache of actor stream keys, so ids are hashed once per run.
+    """
 
-    state: Any = domain.initial_state(base.fork("init"))
-    events = []
+    def __init__(self, base: RNG) -> None:
+        self.base = base
+        self.by_id: dict[str, int] = {}
+        self.last_ids: Any = None
+        self.last_keys: np.ndarray | None = None
 
-    for t in range(cfg.horizon):
+    def keys(self, ids: Any) -> np.ndarray:
+        if ids is self.last_ids and self.last_keys is not None:
+            return self.last_keys
+        by_id = self.by_id
+        for actor_id in ids:
+            if actor_id not in by_id:
+                by_id[actor_id] = self.base.key("actor", actor_id)
+        keys = np.fromiter((by_id[i] for i in ids), dtype=np.uint64, count=len(ids))
+        self.last_ids, self.last_keys = ids, keys
+        return keys
+
+
+def _population_actions(
+    domain: Any, state: Any, t: int, base: RNG, cache: _PopulationKeys
+) -> Any:
+    population = domain.population(state)
+    obs = domain.observe_population(state, population, t)
+    draws = base.uniforms(cache.keys(population.ids), t, population.draws_per_actor)
+    return population.act_batch(obs, draws)
+
+
+@dataclass(frozen=True)
+class Prefix:
+    """
+    Snapshot of a run at step t: after its policy-independent warm-up
+    (simulate_prefix, shared by every policy simulated on the same seed),
+    or at the end of a shorter run of one policy (simulate_resumable).
+    """
+    seed: int
+    t: int
+    state: Any
+    events: tuple[Event, ...] | np.ndarray  # structured rows for columnar domains
+
+
+def _row_dtype(event_dtype: Any) -> np.dtype:
+    return np.dtype([("t", np.int64), *np.dtype(event_dtype).descr])
+
+
+class _ColumnBuffer:
+    """
+    Preallocated rows for a ColumnarDomain; filled by record_row each step.
+    """
+
+    def __init__(self, event_dtype: Any, capacity: int) -> None:
+        self.data = np.zeros(capacity, dtype=_row_dtype(event_dtype))
+        self.n = 0
+
+    def append(self, row: Any) -> None:
+        self.data[self.n] = (self.n, *row) if isinstance(row, tuple) else (self.n, row)
+        self.n += 1
+
+    def rows(self) -> np.ndarray:
+        return self.data[: self.n]
+
+
+def _recorder(domain: Domain, cfg: RunConfig, recorded: Any = ()) -> list[Event] | _ColumnBuffer:
+    event_dtype = getattr(domain, "event_dtype", None)
+    if event_dtype is None:
+        return list(recorded)
+    buf = _ColumnBuffer(event_dtype, cfg.horizon)
+    if len(recorded):
+        buf.data[: len(recorded)] = recorded
+        buf.n = len(recorded)
+    return buf
+
+
+def _recorded(events: list[Event] | _ColumnBuffer) -> tuple[Event, ...] | np.ndarray:
+    if isinstance(events, _ColumnBuffer):
+        return events.rows().copy()
+    return tuple(events)
+
+
+def _finalize(domain: Domain, events: list[Event] | _ColumnBuffer, state: Any) -> Any:
+    if isinstance(events, _ColumnBuffer):
+        return ColumnarTrajectory(data=events.rows(), final_state=state)
+    return domain.finalize(events, state)
+
+
+class _Await:
+    """
+    Yielded by _steps(awaitable=True) after the actor calls of a step:
+    actions is the list of act results (or one act_batch result), any of
+    which may be awaitable. The driver sends the resolved actions back.
+    """
+
+    __slots__ = ("actions", "batch")
+
+    def __init__(self, actions: Any, batch: bool) -> None:
+        self.actions = actions
+        self.batch = batch
+
+
+_Request = PolicyContext | _Await
+_StepGen = Generator[_Request, Any, Any]
+
+
+def _steps(
+    domain: Domain,
+    base: RNG,
+    state: Any,
+    events: list[Event] | _ColumnBuffer,
+    start: int,
+    stop: int,
+    consult: bool,
+    awaitable: bool = False,
+) -> _StepGen:
+    """
+    Simulate steps [start, stop), appending to events. When consult is set,
+    yields each step's PolicyContext and expects the policy action to be
+    sent back; otherwise the action is None. With awaitable set, also
+    yields each step's actor results as an _Await before the transition
+    (see engine.aio). Returns the final state.
+    """
+    population_keys = _PopulationKeys(base) if hasattr(domain, "population") else None
+    record = domain.record_row if isinstance(events, _ColumnBuffer) else domain.record
+
+    for t in range(start, stop):
         # Policy (no rng needed right now)
-        ctx = domain.policy_context(state, t)
-        policy_action = policy.decide(ctx)
+        policy_action = (yield domain.policy_context(state, t)) if consult else None
 
         # Actors get their own deterministic streams
-        actor_actions = []
-        for actor in domain.actors(state):
-            obs = domain.observe(state, actor, t)
-            actor_rng = base.fork("actor", actor.id, t)
-            actor_actions.append(actor.act(obs, actor_rng))
+        if population_keys is None:
+            actor_actions = []
+            for actor in domain.actors(state):
+                obs = domain.observe(state, actor, t)
+                actor_rng = base.fork("actor", actor.id, t)
+                actor_actions.append(actor.act(obs, actor_rng))
+        else:
+            actor_actions = _population_actions(domain, state, t, base, population_keys)
+        if awaitable:
+            actor_actions = yield _Await(actor_actions, population_keys is not None)
 
         # Domain transition gets its own stream
         trans_rng = base.fork("transition", t)
@@ -49,7 +180,361 @@ def simulate(domain: Domain, policy: Policy, cfg: RunConfig, seed: int) -> RunRe
             t=t,
         )
 
-        events.append(domain.record(state, t))
+        events.append(record(state, t))
+
+    return state
+
+
+def _drive(steps: _StepGen, policy: Policy | None) -> Any:
+    """
+    Runs a step generator to completion with policy.decide; returns its value.
+    """
+    try:
+        ctx = next(steps)
+        while True:
+            ctx = steps.send(policy.decide(ctx))  # type: ignore[union-attr]
+    except StopIteration as done:
+        return done.value
+
+
+def _advance(
+    domain: Domain,
+    policy: Policy | None,
+    base: RNG,
+    state: Any,
+    events: list[Event] | _ColumnBuffer,
+    start: int,
+    stop: int,
+) -> Any:
+    """
+    Simulate steps [start, stop), appending to events; returns the new state.
+    With policy=None the policy is not consulted and its action is None.
+    """
+    return _drive(_steps(domain, base, state, events, start, stop, policy is not None), policy)
+
+
+def _copy_state(domain: Domain, state: Any) -> Any:
+    copy_state = getattr(domain, "copy_state", None)
+    return copy_state(state) if copy_state is not None else copy.deepcopy(state)
+
+
+def _begin_steps(
+    domain: Domain,
+    cfg: RunConfig,
+    base: RNG,
+    seed: int,
+    prefix: Prefix | None,
+    awaitable: bool = False,
+) -> Generator[_Request, Any, tuple[Any, list[Event] | _ColumnBuffer, int]]:
+    """
+    State, event buffer and step of a run once its warm-up is done:
+    simulated here, or copied from a prefix (and finished if the prefix
+    ends before the warm-up does).
+    """
+    warmup = min(cfg.warmup, cfg.horizon)
+    if prefix is None:
+        state: Any = domain.initial_state(base.fork("init"))
+        events = _recorder(domain, cfg)
+        state = yield from _steps(domain, base, state, events, 0, warmup, False, awaitable)
+        return state, events, warmup
+    if prefix.seed != seed:
+        raise ValueError(f"Prefix was simulated for seed {prefix.seed}, not {seed}")
+    state = _copy_state(domain, prefix.state)
+    events = _recorder(domain, cfg, prefix.events)
+    if prefix.t < warmup:
+        # a snapshot taken before the warm-up ended (e.g. a short screening run)
+        state = yield from _steps(domain, base, state, events, prefix.t, warmup, False, awaitable)
+        return state, events, warmup
+    return state, events, prefix.t
+
 
-    traj = domain.finalize(events, state)
+def _begin(
+    domain: Domain, cfg: RunConfig, base: RNG, seed: int, prefix: Prefix | None
+) -> tuple[Any, list[Event] | _ColumnBuffer, int]:
+    return _drive(_begin_steps(domain, cfg, base, seed, prefix), None)
+
+
+def _run_steps(
+    domain: Domain,
+    cfg: RunConfig,
+    base: RNG,
+    seed: int,
+    prefix: Prefix | None,
+    run_checkpoint: RunCheckpoint | None,
+    awaitable: bool = False,
+) -> Generator[_Request, Any, tuple[Any, list[Event] | _ColumnBuffer]]:
+    """
+    A whole run as one step generator, for simulate and simulate_async.
+    With a checkpoint the run resumes from its latest snapshot and goes
+    to cfg.horizon in chunks of run_checkpoint.every steps, saving after
+    each. Returns the final state and events.
+    """
+    if run_checkpoint is None:
+        state, events, t = yield from _begin_steps(domain, cfg, base, seed, prefix, awaitable)
+        state = yield from _steps(domain, base, state, events, t, cfg.horizon, True, awaitable)
+        return state, events
+
+    warmup = min(cfg.warmup, cfg.horizon)
+    snapshot = run_checkpoint.load(domain)
+    if snapshot is not None:
+        state, t = snapshot.state, snapshot.t
+        events = _recorder(domain, cfg, snapshot.events)
+    elif prefix is not None:
+        state, events, t = yield from _begin_steps(domain, cfg, base, seed, prefix, awaitable)
+    else:
+        state, events, t = domain.initial_state(base.fork("init")), _recorder(domain, cfg), 0
+
+    while t < cfg.horizon:
+        # chunks end at the warm-up boundary, so each has a single mode
+        stop = min(t + run_checkpoint.every, cfg.horizon)
+        if t < warmup:
+            stop = min(stop, warmup)
+        state = yield from _steps(domain, base, state, events, t, stop, t >= warmup, awaitable)
+        t = stop
+        if t < cfg.horizon:
+            rows = events.rows() if isinstance(events, _ColumnBuffer) else events
+            run_checkpoint.save(domain, t, state, rows)
+    return state, events
+
+
+def simulate_prefix(
+    domain: Domain,
+    cfg: RunConfig,
+    seed: int,
+    *,
+    profiler: Profiler | None = None,
+) -> Prefix:
+    """
+    Simulate the first cfg.warmup steps, which do not depend on the policy.
+    Profiled warm-up time is attributed to the policy name "(warmup)".
+    """
+    base: Any = RNG(seed, scheme=cfg.rng_scheme, plan=cfg.sampling)
+    if profiler is not None:
+        domain, _, base = instrument(domain, None, base, profiler, "(warmup)")
+    state, events, warmup = _begin(domain, cfg, base, seed, None)
+    return Prefix(seed=seed, t=warmup, state=state, events=_recorded(events))
+
+
+def _prepare(
+    domain: Domain,
+    policy: Policy,
+    cfg: RunConfig,
+    seed: int,
+    profiler: Profiler | None,
+    checkpoint: Checkpoint | None,
+) -> tuple[Any, Any, Any, RunCheckpoint | None]:
+    """
+    Domain, policy and base RNG of a run (behind timing proxies when
+    profiled), and its checkpoint files if any.
+    """
+    run_checkpoint = None
+    if checkpoint is not None:
+        # keyed on the bare domain and policy, before any timing proxies
+        event_dtype = getattr(domain, "event_dtype", None)
+        row_dtype = None if event_dtype is None else _row_dtype(event_dtype)
+        run_checkpoint = RunCheckpoint(checkpoint, domain, policy, seed, cfg, row_dtype)
+
+    base: Any = RNG(seed, scheme=cfg.rng_scheme, plan=cfg.sampling)
+    if profiler is not None:
+        domain, policy, base = instrument(domain, policy, base, profiler, policy.name)
+    return domain, policy, base, run_checkpoint
+
+
+def _result(
+    domain: Domain,
+    policy: Policy,
+    seed: int,
+    state: Any,
+    events: list[Event] | _ColumnBuffer,
+    run_checkpoint: RunCheckpoint | None,
+) -> RunResult:
+    traj = _finalize(domain, events, state)
+    if run_checkpoint is not None:
+        run_checkpoint.finish()
     return RunResult(domain=domain.name, policy=policy.name, seed=seed, trajectory=traj)
+
+
+def simulate(
+    domain: Domain,
+    policy: Policy,
+    cfg: RunConfig,
+    seed: int,
+    *,
+    prefix: Prefix | None = None,
+    profiler: Profiler | None = None,
+    checkpoint: Checkpoint | None = None,
+) -> RunResult:
+    """
+    During the first cfg.warmup steps the policy is not consulted and
+    transition receives policy_action=None.
+
+    prefix: continue from a shared warm-up snapshot (see simulate_prefix)
+    instead of re-simulating it. Streams are keyed on t, so the result is
+    identical to a full run. The snapshot state is copied first, with
+    domain.copy_state if the domain provides one, else copy.deepcopy.
+
+    Domains with an event_dtype (ColumnarDomain) are recorded into a
+    preallocated structured array and yield a ColumnarTrajectory.
+
+    profiler: time every phase (see engine.profile). The run goes through
+    timing proxies; without a profiler nothing is wrapped.
+
+    checkpoint: snapshot the run every checkpoint.every steps (see
+    engine.checkpoint). If a snapshot of this (domain, policy, seed, cfg)
+    exists, the run resumes from it; the result is identical to an
+    uninterrupted run.
+    """
+    domain, policy, base, run_checkpoint = _prepare(domain, policy, cfg, seed, profiler, checkpoint)
+    state, events = _drive(_run_steps(domain, cfg, base, seed, prefix, run_checkpoint), policy)
+    return _result(domain, policy, seed, state, events, run_checkpoint)
+
+
+def simulate_resumable(
+    domain: Domain,
+    policy: Policy,
+    cfg: RunConfig,
+    seed: int,
+    *,
+    prefix: Prefix | None = None,
+) -> tuple[RunResult, Prefix]:
+    """
+    As simulate, and also returns the snapshot at cfg.horizon. Passing it
+    as prefix to simulate the same policy with a longer horizon continues
+    the run instead of restarting it, with the same result as a fresh run.
+    """
+    base: Any = RNG(seed, scheme=cfg.rng_scheme, plan=cfg.sampling)
+    state, events, warmup = _begin(domain, cfg, base, seed, prefix)
+    state = _advance(domain, policy, base, state, events, warmup, cfg.horizon)
+    # own copy, so callers or metrics mutating final_state cannot alter a resume
+    snapshot = Prefix(
+        seed=seed, t=cfg.horizon, state=_copy_state(domain, state), events=_recorded(events)
+    )
+    traj = _finalize(domain, events, state)
+    run = RunResult(domain=domain.name, policy=policy.name, seed=seed, trajectory=traj)
+    return run, snapshot
+
+
+def simulate_many(
+    domain: Domain,
+    policy: Policy,
+    cfg: RunConfig,
+    seeds: Iterable[int],
+    *,
+    prefixes: Sequence[Prefix | None] | None = None,
+    profiler: Profiler | None = None,
+) -> list[RunResult]:
+    """
+    Simulate one policy on several seeds, interleaved step by step so that
+    each timestep's contexts from all seeds go to the policy together:
+    one decide_many(ctxs) call (see MultiSeedPolicy), or one decide per
+    context when the policy has no decide_many.
+
+    Each run keeps its own streams, so results equal simulate seed for seed.
+    prefixes: optional warm-up snapshot per seed, as for simulate.
+    """
+    seeds_list = list(seeds)
+    if prefixes is None:
+        prefixes = [None] * len(seeds_list)
+    decide_many = getattr(policy, "decide_many", None)
+    if decide_many is None:
+
+        def decide_many(ctxs: list[PolicyContext]) -> list[Any]:
+            return [policy.decide(c) for c in ctxs]
+
+    domains: list[Any] = []
+    buffers: list[list[Event] | _ColumnBuffer] = []
+    finals: list[Any] = [None] * len(seeds_list)
+    live: list[tuple[int, Generator[PolicyContext, Any, Any], PolicyContext]] = []
+    for i, (seed, prefix) in enumerate(zip(seeds_list, prefixes)):
+        run_domain: Any = domain
+        base: Any = RNG(seed, scheme=cfg.rng_scheme, plan=cfg.sampling)
+        if profiler is not None:
+            run_domain, _, base = instrument(domain, None, base, profiler, policy.name)
+        state, events, warmup = _begin(run_domain, cfg, base, seed, prefix)
+        steps = _steps(run_domain, base, state, events, warmup, cfg.horizon, True)
+        domains.append(run_domain)
+        buffers.append(events)
+        try:
+            live.append((i, steps, next(steps)))
+        except StopIteration as done:
+            finals[i] = done.value
+
+    while live:
+        if profiler is None:
+            actions = decide_many([ctx for _, _, ctx in live])
+        else:
+            start = perf_counter_ns()
+            actions = decide_many([ctx for _, _, ctx in live])
+            profiler.record(domain.name, policy.name, "decide", perf_counter_ns() - start)
+        if len(actions) != len(live):
+            raise ValueError(
+                f"{policy.name}.decide_many returned {len(actions)} actions for {len(live)} contexts"
+            )
+        still: list[tuple[int, Generator[PolicyContext, Any, Any], PolicyContext]] = []
+        for (i, steps, _), action in zip(live, actions):
+            try:
+                still.append((i, steps, steps.send(action)))
+            except StopIteration as done:
+                finals[i] = done.value
+        live = still
+
+    return [
+        RunResult(
+            domain=domain.name,
+            policy=policy.name,
+            seed=seed,
+            trajectory=_finalize(run_domain, events, final),
+        )
+        for seed, run_domain, events, final in zip(seeds_list, domains, buffers, finals)
+    ]
+
+
+def _decide_batch(policy: Policy, ctx: PolicyContext, n: int) -> Any:
+    decide_batch = getattr(policy, "decide_batch", None)
+    if decide_batch is not None:
+        return decide_batch(ctx)
+    # fall back to one decide per seed on rows of the batched view
+    view = ctx.system_view
+    return [policy.decide(PolicyContext(t=ctx.t, system_view=view[i])) for i in range(n)]
+
+
+def simulate_batch(
+    domain: BatchDomain,
+    policy: Policy,
+    cfg: RunConfig,
+    seeds: Iterable[int],
+) -> list[RunResult]:
+    """
+    Advance a batch of seeds in lockstep through a BatchDomain.
+
+    Per-seed streams are the ones simulate uses (fork("init"),
+    fork("transition", t)), so a BatchDomain that mirrors a Domain
+    reproduces its results seed for seed.
+    """
+    seeds_list = list(seeds)
+    bases = [RNG(seed, scheme=cfg.rng_scheme, plan=cfg.sampling) for seed in seeds_list]
+
+    state: Any = domain.initial_state([b.fork("init") for b in bases])
+    records = []
+
+    for t in range(cfg.horizon):
+        if t < cfg.warmup:
+            policy_actions = [None] * len(seeds_list)
+        else:
+            ctx = domain.policy_context(state, t)
+            policy_actions = _decide_batch(policy, ctx, len(seeds_list))
+
+        state = domain.transition(
+            state=state,
+            policy_actions=policy_actions,
+            rngs=[b.fork("transition", t) for b in bases],
+            t=t,
+        )
+
+        records.append(domain.record(state, t))
+
+    trajs = domain.finalize(records, state)
+    return [
+        RunResult(domain=domain.name, policy=policy.name, seed=seed, trajectory=traj)
+        for seed, traj in zip(seeds_list, trajs)
+    ]
@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import json
+import os
+from pathlib import Path
+import pickle
+from typing import Any, BinaryIO, Iterator
+
+import numpy as np
+
+from policy_eval.core.types import ColumnarTrajectory, Trajectory
+from policy_eval.engine.simulator import RunResult
+
+
+_ALIGN = 64  # row blocks start on cache-line boundaries
+
+
+@dataclass(frozen=True)
+class StoreEntry:
+    """
+    Where one run lives. Columnar rows are raw bytes of `dtype` at
+    [offset, offset + nbytes); the final state is pickled right after them.
+    Other trajectories are one pickle at [offset, offset + nbytes).
+    """
+    domain: str
+    policy: str
+    seed: int
+    segment: int
+    offset: int
+    nbytes: int
+    dtype: Any = None  # numpy descr for columnar runs, else None
+    state_offset: int = 0
+    state_nbytes: int = 0
+
+
+@dataclass(frozen=True, eq=False)
+class StoredRun:
+    """
+    Lazy RunResult view over a TrajectoryStore entry: the trajectory is
+    read (columnar rows as a memmap) on each access and not kept, so
+    holding many views holds none of their data.
+    """
+    domain: str
+    policy: str
+    seed: int
+    store: TrajectoryStore = field(repr=False)
+    entry: StoreEntry = field(repr=False)
+
+    @property
+    def trajectory(self) -> Trajectory | ColumnarTrajectory:
+        return self.store._load(self.entry)
+
+    def load(self) -> RunResult:
+        return RunResult(
+            domain=self.domain, policy=self.policy, seed=self.seed, trajectory=self.trajectory
+        )
+
+
+def _trim_torn_tail(path: Path) -> None:
+    """
+    Cuts an unterminated last line (from an interrupted writer) off path,
+    so the next appended line starts on its own.
+    """
+    with open(path, "r+b") as f:
+        end = f.seek(0, os.SEEK_END)
+        pos = end
+        while pos > 0:
+            start = max(0, pos - 4096)
+            f.seek(start)
+            block = f.read(pos - start)
+            newline = block.rfind(b"\n")
+            if newline >= 0:
+                pos = start + newline + 1
+                break
+            pos = start
+        if pos < end:
+            f.truncate(pos)
+            f.flush()
+            os.fsync(f.fileno())
+
+
+def _dtype(descr: list[Any]) -> np.dtype:
+    # JSON turns the descr's tuples into lists
+    def tuples(fields: list[Any]) -> list[tuple[Any, ...]]:
+        out = []
+        for name, fmt, *shape in fields:
+            if isinstance(fmt, list):
+                fmt = tuples(fmt)  # nested struct
+            out.append((name, fmt, *(tuple(s) for s in shape)))
+        return out
+
+    return np.lib.format.descr_to_dtype(tuples(descr))
+
+
+@dataclass
+class TrajectoryStore:
+    """
+    Append-only on-disk store of runs, indexed by (domain, policy, seed).
+
+    Runs are written to segment files (seg-NNNNNN.bin, rolled at
+    segment_bytes) and indexed in index.jsonl, one line per run, written
+    after its bytes. Each opened store appends to a fresh segment, so
+    existing segments are never rewritten; re-appending a (domain, policy,
+    seed) supersedes the earlier entry. Both files are fsynced before an
+    entry is published, so a crash never leaves an index line pointing at
+    missing bytes. Reads go through read-only memmaps.
+
+    One writer at a time; any number of readers may open the directory.
+    """
+    directory: Path
+    segment_bytes: int = 256 * 2**20
+    _index: dict[tuple[str, str, int], StoreEntry] = field(default_factory=dict, init=False, repr=False)
+    _maps: dict[int, np.memmap] = field(default_factory=dict, init=False, repr=False)
+    _segment: int = field(default=-1, init=False, repr=False)
+    _data: BinaryIO | None = field(default=None, init=False, repr=False)
+    _log: Any = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.directory = Path(self.directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        index = self.directory / "index.jsonl"
+        if index.exists():
+            with open(index, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = StoreEntry(**json.loads(line))
+                    except (json.JSONDecodeError, TypeError):
+                        continue  # torn last line from an interrupted writer
+                    self._index[(entry.domain, entry.policy, entry.seed)] = entry
+
+    def _path(self, segment: int) -> Path:
+        return self.directory / f"seg-{segment:06d}.bin"
+
+    def _writer(self, incoming: int) -> BinaryIO:
+        used = 0 if self._data is None else self._data.tell()
+        if self._data is None or (used and used + incoming > self.segment_bytes):
+            if self._data is not None:
+                self._data.close()
+            segment = max(self._segment, len(list(self.directory.glob("seg-*.bin"))) - 1) + 1
+            self._segment = segment
+            self._data = open(self._path(segment), "xb")
+            if self._log is None:
+                index = self.directory / "index.jsonl"
+                if index.exists():
+                    _trim_torn_tail(index)
+                self._log = open(index, "a", encoding="utf-8")
+        return self._data
+
+    def append(self, run: RunResult) -> StoredRun:
+        """
+        Writes run and returns its lazy view.
+        """
+        traj = run.trajectory
+        if isinstance(traj, ColumnarTrajectory):
+            rows = np.ascontiguousarray(traj.data)
+            state = pickle.dumps(traj.final_state, protocol=pickle.HIGHEST_PROTOCOL)
+            f = self._writer(rows.nbytes + len(state) + _ALIGN)
+            f.write(b"\0" * (-f.tell() % _ALIGN))
+            offset = f.tell()
+            f.write(rows.tobytes())
+            state_offset = f.tell()
+            f.write(state)
+            entry = StoreEntry(
+                domain=run.domain,
+                policy=run.policy,
+                seed=run.seed,
+                segment=self._segment,
+                offset=offset,
+                nbytes=rows.nbytes,
+                dtype=np.lib.format.dtype_to_descr(rows.dtype),
+                state_offset=state_offset,
+                state_nbytes=len(state),
+            )
+        else:
+            blob = pickle.dumps(traj, protocol=pickle.HIGHEST_PROTOCOL)
+            f = self._writer(len(blob))
+            offset = f.tell()
+            f.write(blob)
+            entry = StoreEntry(
+                domain=run.domain,
+                policy=run.policy,
+                seed=run.seed,
+                segment=self._segment,
+                offset=offset,
+                nbytes=len(blob),
+            )
+        # data first, then the index line that makes it visible
+        f.flush()
+        os.fsync(f.fileno())
+        self._log.write(json.dumps(entry.__dict__) + "\n")
+        self._log.flush()
+        os.fsync(self._log.fileno())
+        self._index[(run.domain, run.policy, run.seed)] = entry
+        return self._view(entry)
+
+    def _view(self, entry: StoreEntry) -> StoredRun:
+        return StoredRun(
+            domain=entry.domain, policy=entry.policy, seed=entry.seed, store=self, entry=entry
+        )
+
+    def _bytes(self, segment: int, start: int, stop: int) -> np.ndarray:
+        mm = self._maps.get(segment)
+        if mm is None or len(mm) < stop:
+            # (re)map: the segment may have grown since it was last mapped
+            mm = np.memmap(self._path(segment), dtype=np.uint8, mode="r")
+            self._maps[segment] = mm
+        return mm[start:stop]
+
+    def _load(self, entry: StoreEntry) -> Trajectory | ColumnarTrajectory:
+        end = entry.offset + entry.nbytes
+        if entry.dtype is None:
+            return pickle.loads(self._bytes(entry.segment, entry.offset, end))
+        rows = self._bytes(entry.segment, entry.offset, end).view(_dtype(entry.dtype))
+        state_end = entry.state_offset + entry.state_nbytes
+        state = pickle.loads(self._bytes(entry.segment, entry.state_offset, state_end))
+        return ColumnarTrajectory(data=rows, final_state=state)
+
+    def get(self, domain: str, policy: str, seed: int) -> StoredRun | None:
+        entry = self._index.get((domain, policy, seed))
+        return None if entry is None else self._view(entry)
+
+    def __contains__(self, key: tuple[str, str, int]) -> bool:
+        return key in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def keys(self) -> list[tuple[str, str, int]]:
+        return list(self._index)
+
+    def runs(self) -> Iterator[StoredRun]:
+        """
+        The latest run per (domain, policy, seed), in first-appended order.
+        """
+        for entry in self._index.values():
+            yield self._view(entry)
+
+    def close(self) -> None:
+        for handle in (self._data, self._log):
+            if handle is not None:
+                handle.close()
+        self._data = self._log = None
+        self._maps.clear()
+
+    def __enter__(self) -> TrajectoryStore:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def __getstate__(self) -> dict[str, Any]:
+        # reopen from disk on unpickle; file handles and maps do not travel
+        return {"directory": self.directory, "segment_bytes": self.segment_bytes}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__init__(**state)  # type: ignore[misc]
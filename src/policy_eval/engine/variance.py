@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Mapping
+
+import numpy as np
+
+from policy_eval.core.rng import SeedPlan
+from policy_eval.engine.columnar import MetricTable
+from policy_eval.engine.paired import _t_quantile
+
+
+@dataclass(frozen=True)
+class Estimate:
+    """
+    Mean of one (policy, metric) with a standard error that accounts for
+    the seed plan and control variates.
+
+    ess: independent seeds that would give the same standard error; n
+    without a plan or controls, more when they help. beta: control-variate
+    coefficients, one per control (empty without controls).
+    """
+    n: int
+    mean: float
+    stderr: float
+    ci_low: float
+    ci_high: float
+    ess: float
+    beta: tuple[float, ...] = ()
+
+
+def _grouped_variance(z: np.ndarray, groups: np.ndarray) -> tuple[float, int]:
+    """
+    Variance of z.mean() with groups as independent replicates (the
+    cluster estimator; equals var(z) / n for singleton groups), and the
+    number of groups.
+    """
+    _, inverse = np.unique(groups, return_inverse=True)
+    g = int(inverse.max()) + 1
+    if g < 2:
+        return float("nan"), g
+    totals = np.bincount(inverse, weights=z, minlength=g)
+    sizes = np.bincount(inverse, minlength=g)
+    dev = totals - sizes * z.mean()
+    return float(g / (g - 1) * np.dot(dev, dev) / z.size**2), g
+
+
+def estimate(
+    values: np.ndarray,
+    groups: np.ndarray | None = None,
+    *,
+    controls: np.ndarray | None = None,
+    control_means: np.ndarray | None = None,
+    confidence: float = 0.95,
+) -> Estimate:
+    """
+    values: one metric over n seeds. groups: replicate id per seed (see
+    SeedPlan.group); None means independent seeds.
+    controls: (n, k) control-variate values with known means
+    control_means. The mean becomes mean(y - beta . (c - mu)), with beta
+    fit by least squares.
+    """
+    y = np.asarray(values, dtype=np.float64)
+    n = y.size
+    if groups is None:
+        groups = np.arange(n)
+    beta = np.zeros(0)
+    z = y
+    if controls is not None:
+        c = np.asarray(controls, dtype=np.float64).reshape(n, -1)
+        mu = np.asarray(control_means, dtype=np.float64).reshape(-1)
+        centered = c - c.mean(axis=0)
+        beta = np.linalg.lstsq(centered, y - y.mean(), rcond=None)[0]
+        z = y - (c - mu) @ beta
+
+    var_mean, g = _grouped_variance(z, np.asarray(groups))
+    stderr = float(np.sqrt(var_mean))
+    mean = float(z.mean())
+    half = _t_quantile(0.5 + confidence / 2, g - 1) * stderr
+    plain = float(y.var(ddof=1)) if n > 1 else float("nan")
+    if var_mean > 0:
+        ess = plain / var_mean
+    else:
+        ess = float("inf") if plain > 0 else float(n)
+    return Estimate(
+        n=n,
+        mean=mean,
+        stderr=stderr,
+        ci_low=mean - half,
+        ci_high=mean + half,
+        ess=float(ess),
+        beta=tuple(float(b) for b in beta),
+    )
+
+
+def variance_report(
+    table: MetricTable,
+    plan: SeedPlan | None = None,
+    *,
+    controls: Mapping[str, float] | None = None,
+    confidence: float = 0.95,
+) -> dict[tuple[str, str], Estimate]:
+    """
+    Returns {(policy_name, metric_name) -> Estimate} for every cell.
+
+    plan: how the table's seeds were laid out (cfg.sampling); pairs and
+    blocks are treated as replicates. controls: {metric name -> known
+    expectation}; those metrics correct every other metric of the same
+    policy and are reported uncorrected themselves.
+    """
+    groups = np.array([plan.group(s) if plan is not None else s for s in table.seeds])
+    controls = dict(controls or {})
+    missing = set(controls) - set(table.metrics)
+    if missing:
+        raise ValueError(f"Control metrics not in the table: {sorted(missing)}")
+    cols = [table.metric_index[m] for m in controls]
+    means = np.array(list(controls.values()), dtype=np.float64)
+
+    out: dict[tuple[str, str], Estimate] = {}
+    for i, policy in enumerate(table.policies):
+        c = table.values[i, cols].T if cols else None
+        for j, metric in enumerate(table.metrics):
+            adjust = c is not None and metric not in controls
+            out[(policy, metric)] = estimate(
+                table.values[i, j],
+                groups,
+                controls=c if adjust else None,
+                control_means=means if adjust else None,
+                confidence=confidence,
+            )
+    return out
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+from policy_eval.abstractions.actor import Observation
+from policy_eval.abstractions.policy import PolicyContext
+from policy_eval.core.types import Event, RunConfig, Trajectory
+from policy_eval.engine.simulator import simulate
+
+
+class Crowd:
+    """
+    Each actor joins (1) with probability equal to the observed incentive.
+    """
+    draws_per_actor = 1
+
+    def __init__(self, ids: tuple[str, ...]) -> None:
+        self.ids = ids
+
+    def act_batch(self, obs: Observation, draws: np.ndarray) -> np.ndarray:
+        return (draws[:, 0] < obs.data).astype(np.int64)
+
+
+class CrowdDomain:
+    name = "crowd"
+
+    def __init__(self, n: int, reverse: bool = False) -> None:
+        ids = tuple(f"a{i}" for i in range(n))
+        self.crowd = Crowd(ids[::-1] if reverse else ids)
+
+    def initial_state(self, rng: Any) -> dict[str, int]:
+        return {}
+
+    def actors(self, state):
+        return []
+
+    def population(self, state) -> Crowd:
+        return self.crowd
+
+    def policy_context(self, state, t: int) -> PolicyContext:
+        return PolicyContext(t=t, system_view=len(state))
+
+    def observe(self, state, actor, t: int):
+        raise RuntimeError("population domain")
+
+    def observe_population(self, state, population: Crowd, t: int) -> Observation:
+        return Observation(t=t, data=np.full(len(population.ids), 0.3))
+
+    def transition(self, state, policy_action, actor_actions, rng: Any, t: int) -> dict[str, int]:
+        joined = {i: int(a) for i, a in zip(self.crowd.ids, actor_actions)}
+        return {i: state.get(i, 0) + joined[i] for i in joined}
+
+    def record(self, state, t: int) -> Event:
+        return Event(t=t, payload=sum(state.values()))
+
+    def finalize(self, events, final_state) -> Trajectory:
+        return Trajectory(events=tuple(events), final_state=final_state)
+
+
+class Idle:
+    name = "idle"
+
+    def decide(self, ctx: PolicyContext) -> None:
+        return None
+
+
+def test_population_draws_follow_actor_ids_not_positions():
+    cfg = RunConfig(horizon=10)
+    forward = simulate(CrowdDomain(500), Idle(), cfg, seed=9)
+    backward = simulate(CrowdDomain(500, reverse=True), Idle(), cfg, seed=9)
+
+    assert forward.trajectory.final_state == backward.trajectory.final_state
+    assert forward.trajectory.events == backward.trajectory.events
+
+
+def test_population_draws_are_seeded():
+    cfg = RunConfig(horizon=10)
+    a = simulate(CrowdDomain(500), Idle(), cfg, seed=1)
+    b = simulate(CrowdDomain(500), Idle(), cfg, seed=1)
+    c = simulate(CrowdDomain(500), Idle(), cfg, seed=2)
+
+    assert a.trajectory == b.trajectory
+    assert a.trajectory.final_state != c.trajectory.final_state
+    # about 30% of 500 actors join per step
+    assert abs(a.trajectory.events[-1].payload / (500 * 10) - 0.3) < 0.03
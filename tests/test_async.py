@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import asyncio
+import random
+from typing import Any
+
+from policy_eval.abstractions.actor import Observation
+from policy_eval.abstractions.policy import PolicyContext
+from policy_eval.core.types import Event, RunConfig, Trajectory
+from policy_eval.engine.checkpoint import Checkpoint
+from policy_eval.engine.aio import run_experiment_async, simulate_async
+from policy_eval.engine.experiment import run_experiment
+from policy_eval.engine.profile import Profiler
+from policy_eval.engine.simulator import simulate, simulate_prefix
+
+
+class InFlight:
+    def __init__(self) -> None:
+        self.now = 0
+        self.peak = 0
+
+    async def hold(self) -> None:
+        self.now += 1
+        self.peak = max(self.peak, self.now)
+        # jittered latency so calls finish out of order
+        await asyncio.sleep(random.random() * 1e-3)
+        self.now -= 1
+
+
+class Walker:
+    def __init__(self, actor_id: str, gauge: InFlight | None) -> None:
+        self.id = actor_id
+        self.gauge = gauge
+
+    def _step(self, obs: Observation, rng: Any) -> float:
+        return float(rng.normal()) + obs.data
+
+    def act(self, obs: Observation, rng: Any) -> Any:
+        if self.gauge is None:
+            return self._step(obs, rng)
+
+        async def remote() -> float:
+            await self.gauge.hold()
+            return self._step(obs, rng)
+
+        return remote()
+
+
+class WalkDomain:
+    name = "walk"
+
+    def __init__(self, n: int, gauge: InFlight | None = None) -> None:
+        self.walkers = [Walker(f"w{i}", gauge) for i in range(n)]
+
+    def initial_state(self, rng: Any) -> float:
+        return float(rng.normal())
+
+    def actors(self, state: float):
+        return self.walkers
+
+    def policy_context(self, state: float, t: int) -> PolicyContext:
+        return PolicyContext(t=t, system_view=state)
+
+    def observe(self, state: float, actor, t: int) -> Observation:
+        return Observation(t=t, data=state / 10)
+
+    def transition(self, state, policy_action, actor_actions, rng: Any, t: int) -> float:
+        return state + sum(actor_actions) + (policy_action or 0.0) + float(rng.normal())
+
+    def record(self, state: float, t: int) -> Event:
+        return Event(t=t, payload=state)
+
+    def finalize(self, events, final_state) -> Trajectory:
+        return Trajectory(events=tuple(events), final_state=final_state)
+
+
+class Nudge:
+    def __init__(self, k: float, gauge: InFlight | None = None) -> None:
+        self.k = k
+        self.gauge = gauge
+        self.name = f"nudge_{k}"
+
+    def decide(self, ctx: PolicyContext) -> Any:
+        if self.gauge is None:
+            return -self.k * ctx.system_view
+
+        async def remote() -> float:
+            await self.gauge.hold()
+            return -self.k * ctx.system_view
+
+        return remote()
+
+
+class FinalValue:
+    name = "final"
+
+    def evaluate(self, traj: Trajectory) -> float:
+        return float(traj.final_state)
+
+
+def test_simulate_async_matches_simulate_regardless_of_completion_order():
+    cfg = RunConfig(horizon=8)
+    gauge = InFlight()
+    expected = simulate(WalkDomain(20), Nudge(0.5), cfg, seed=4)
+    got = asyncio.run(simulate_async(WalkDomain(20, gauge), Nudge(0.5, gauge), cfg, seed=4))
+
+    assert got == expected
+    assert gauge.peak == 20  # every actor call of a step was in flight at once
+
+
+def test_run_experiment_async_matches_sync_with_bounded_concurrency():
+    cfg = RunConfig(horizon=5, warmup=2)
+    policies = [Nudge(0.0), Nudge(0.5), Nudge(1.0)]
+    expected = run_experiment(
+        domain=WalkDomain(3),
+        policies=policies,
+        metrics=[FinalValue()],
+        seeds=range(12),
+        cfg=cfg,
+    )
+
+    gauge = InFlight()
+    got = asyncio.run(
+        run_experiment_async(
+            domain=WalkDomain(3),
+            policies=[Nudge(p.k, gauge) for p in policies],
+            metrics=[FinalValue()],
+            seeds=range(12),
+            cfg=cfg,
+            concurrency=4,
+        )
+    )
+
+    assert got == expected
+    # 4 seeds x 3 policies, one decide per trial at a time
+    assert 1 < gauge.peak <= 12
+
+
+def test_short_prefix_finishes_warmup_like_simulate():
+    domain = WalkDomain(2)
+    short = simulate_prefix(domain, RunConfig(horizon=3, warmup=5), seed=7)
+    cfg = RunConfig(horizon=10, warmup=5)
+    expected = simulate(domain, Nudge(1.0), cfg, seed=7)
+    assert simulate(domain, Nudge(1.0), cfg, seed=7, prefix=short) == expected
+    assert asyncio.run(simulate_async(domain, Nudge(1.0), cfg, seed=7, prefix=short)) == expected
+
+
+def test_profiled_async_run_times_awaited_calls():
+    cfg = RunConfig(horizon=4, warmup=1)
+    prof = Profiler()
+    gauge = InFlight()
+    expected = simulate(WalkDomain(3), Nudge(0.5), cfg, seed=2)
+    got = asyncio.run(
+        simulate_async(WalkDomain(3, gauge), Nudge(0.5, gauge), cfg, seed=2, profiler=prof)
+    )
+
+    assert got == expected
+    stats = {phase: st for (_, _, phase), st in prof.stats.items()}
+    assert stats["decide"].count == 3 and stats["act"].count == 12
+    assert stats["act"].max_ns > 0 and stats["transition"].count == 4
+
+
+def test_async_checkpoint_resumes_like_simulate(tmp_path):
+    cfg = RunConfig(horizon=9, warmup=2)
+    expected = simulate(WalkDomain(2), Nudge(0.5), cfg, seed=3)
+    ckpt = Checkpoint(tmp_path, every=4, keep=True)
+    first = simulate(WalkDomain(2), Nudge(0.5), cfg, seed=3, checkpoint=ckpt)
+    resumed = asyncio.run(
+        simulate_async(WalkDomain(2, InFlight()), Nudge(0.5), cfg, seed=3, checkpoint=ckpt)
+    )
+    assert first == resumed == expected
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+from policy_eval.abstractions.policy import PolicyContext
+from policy_eval.core.types import Event, RunConfig, Trajectory
+from policy_eval.engine.simulator import simulate, simulate_batch
+
+
+class WalkDomain:
+    name = "walk"
+
+    def initial_state(self, rng: Any) -> float:
+        return float(rng.uniform())
+
+    def actors(self, state: float):
+        return []
+
+    def policy_context(self, state: float, t: int) -> PolicyContext:
+        return PolicyContext(t=t, system_view=state)
+
+    def observe(self, state: float, actor, t: int):
+        raise RuntimeError("no actors")
+
+    def transition(self, state: float, policy_action: float, actor_actions, rng: Any, t: int) -> float:
+        return state + policy_action + float(rng.normal())
+
+    def record(self, state: float, t: int) -> Event:
+        return Event(t=t, payload=state)
+
+    def finalize(self, events, final_state) -> Trajectory:
+        return Trajectory(events=tuple(events), final_state=final_state)
+
+
+class BatchWalkDomain:
+    """
+    WalkDomain with state held as one array over seeds.
+    """
+    name = "walk"
+
+    def initial_state(self, rngs: list[Any]) -> np.ndarray:
+        return np.array([r.uniform() for r in rngs])
+
+    def policy_context(self, state: np.ndarray, t: int) -> PolicyContext:
+        return PolicyContext(t=t, system_view=state)
+
+    def transition(self, state: np.ndarray, policy_actions, rngs: list[Any], t: int) -> np.ndarray:
+        noise = np.array([r.normal() for r in rngs])
+        return state + np.asarray(policy_actions, dtype=float) + noise
+
+    def record(self, state: np.ndarray, t: int) -> np.ndarray:
+        return state
+
+    def finalize(self, records: list[np.ndarray], final_state: np.ndarray) -> list[Trajectory]:
+        table = np.stack(records)  # [t, seed]
+        return [
+            Trajectory(
+                events=tuple(Event(t=t, payload=float(table[t, i])) for t in range(len(records))),
+                final_state=float(final_state[i]),
+            )
+            for i in range(table.shape[1])
+        ]
+
+
+class Damp:
+    name = "damp"
+
+    def decide(self, ctx: PolicyContext) -> float:
+        return -0.5 * ctx.system_view
+
+
+class VectorDamp(Damp):
+    def decide_batch(self, ctx: PolicyContext) -> np.ndarray:
+        return -0.5 * ctx.system_view
+
+
+def test_batch_matches_per_seed_simulation():
+    cfg = RunConfig(horizon=8)
+    seeds = [3, 1, 4, 1, 5]
+
+    expected = [simulate(WalkDomain(), Damp(), cfg, seed=s) for s in seeds]
+    vectorized = simulate_batch(BatchWalkDomain(), VectorDamp(), cfg, seeds)
+    fallback = simulate_batch(BatchWalkDomain(), Damp(), cfg, seeds)
+
+    assert vectorized == expected
+    assert fallback == expected
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import numpy as np
+import pytest
+
+from policy_eval.abstractions.actor import Observation
+from policy_eval.abstractions.policy import PolicyContext
+from policy_eval.core.types import Event, RunConfig, Trajectory
+from policy_eval.engine.checkpoint import Checkpoint
+from policy_eval.engine.simulator import simulate, simulate_prefix
+
+
+class Preempted(Exception):
+    pass
+
+
+class Walker:
+    id = "w"
+
+    def act(self, obs: Observation, rng: Any) -> float:
+        return float(rng.normal())
+
+
+class DriftDomain:
+    """
+    crash_at: raise once when transition reaches this step, like a
+    preempted job.
+    """
+    name = "drift"
+
+    def __init__(self, crash_at: int | None = None) -> None:
+        self.crash_at = crash_at
+
+    def initial_state(self, rng: Any) -> dict[str, Any]:
+        return {"x": float(rng.uniform()), "log": []}
+
+    def actors(self, state):
+        return [Walker()]
+
+    def policy_context(self, state, t: int) -> PolicyContext:
+        return PolicyContext(t=t, system_view=state["x"])
+
+    def observe(self, state, actor, t: int) -> Observation:
+        return Observation(t=t, data=state["x"])
+
+    def transition(self, state, policy_action, actor_actions, rng: Any, t: int):
+        if t == self.crash_at:
+            self.crash_at = None
+            raise Preempted(t)
+        state["log"].append(policy_action)
+        state["x"] += (policy_action or 0.0) + actor_actions[0] + float(rng.normal())
+        return state
+
+    def record(self, state, t: int) -> Event:
+        return Event(t=t, payload=state["x"])
+
+    def finalize(self, events, final_state) -> Trajectory:
+        return Trajectory(events=tuple(events), final_state=final_state)
+
+
+class ColumnarDriftDomain(DriftDomain):
+    event_dtype = np.dtype([("x", np.float64)])
+
+    def record_row(self, state, t: int) -> float:
+        return state["x"]
+
+
+class JsonDriftDomain(DriftDomain):
+    def __init__(self, crash_at: int | None = None) -> None:
+        super().__init__(crash_at)
+        self.restored = 0
+
+    def serialize_state(self, state) -> bytes:
+        return json.dumps(state).encode("utf-8")
+
+    def restore_state(self, blob: bytes):
+        self.restored += 1
+        return json.loads(blob)
+
+
+class Nudge:
+    name = "nudge"
+
+    def decide(self, ctx: PolicyContext) -> float:
+        return 0.5
+
+
+def _interrupted(domain, cfg, ckpt, seed=0):
+    with pytest.raises(Preempted):
+        simulate(domain, Nudge(), cfg, seed, checkpoint=ckpt)
+    return simulate(domain, Nudge(), cfg, seed, checkpoint=ckpt)
+
+
+@pytest.mark.parametrize("every", [1, 4, 7, 100])
+def test_resume_matches_uninterrupted_run(tmp_path, every):
+    cfg = RunConfig(horizon=30, warmup=5)
+    full = simulate(DriftDomain(), Nudge(), cfg, seed=3)
+    ckpt = Checkpoint(tmp_path, every=every)
+
+    resumed = _interrupted(DriftDomain(crash_at=17), cfg, ckpt, seed=3)
+    assert resumed.trajectory == full.trajectory
+
+
+def test_resume_skips_completed_steps(tmp_path):
+    cfg = RunConfig(horizon=20)
+    domain = DriftDomain(crash_at=13)
+    with pytest.raises(Preempted):
+        simulate(domain, Nudge(), cfg, 0, checkpoint=Checkpoint(tmp_path, every=5))
+
+    calls = []
+    original = domain.transition
+
+    def counted(state, policy_action, actor_actions, rng, t):
+        calls.append(t)
+        return original(state, policy_action, actor_actions, rng, t)
+
+    domain.transition = counted
+    simulate(domain, Nudge(), cfg, 0, checkpoint=Checkpoint(tmp_path, every=5))
+    assert calls == list(range(10, 20))
+
+
+def test_columnar_resume(tmp_path):
+    cfg = RunConfig(horizon=25, warmup=3)
+    full = simulate(ColumnarDriftDomain(), Nudge(), cfg, seed=1)
+    resumed = _interrupted(ColumnarDriftDomain(crash_at=19), cfg, Checkpoint(tmp_path, every=6), 1)
+    np.testing.assert_array_equal(resumed.trajectory.data, full.trajectory.data)
+    assert resumed.trajectory.final_state == full.trajectory.final_state
+
+
+def test_domain_serialize_hooks_are_used(tmp_path):
+    cfg = RunConfig(horizon=20)
+    full = simulate(JsonDriftDomain(), Nudge(), cfg, seed=2)
+    domain = JsonDriftDomain(crash_at=11)
+    resumed = _interrupted(domain, cfg, Checkpoint(tmp_path, every=4), 2)
+    assert domain.restored == 1
+    assert resumed.trajectory == full.trajectory
+
+
+def test_resume_after_shared_prefix(tmp_path):
+    cfg = RunConfig(horizon=20, warmup=8)
+    full = simulate(DriftDomain(), Nudge(), cfg, seed=4)
+    prefix = simulate_prefix(DriftDomain(), cfg, seed=4)
+    domain = DriftDomain(crash_at=15)
+    ckpt = Checkpoint(tmp_path, every=3)
+    with pytest.raises(Preempted):
+        simulate(domain, Nudge(), cfg, 4, prefix=prefix, checkpoint=ckpt)
+    resumed = simulate(domain, Nudge(), cfg, 4, prefix=prefix, checkpoint=ckpt)
+    assert resumed.trajectory == full.trajectory
+
+
+def test_files_removed_unless_kept(tmp_path):
+    cfg = RunConfig(horizon=12)
+    simulate(DriftDomain(), Nudge(), cfg, 0, checkpoint=Checkpoint(tmp_path / "a", every=5))
+    assert list((tmp_path / "a").iterdir()) == []
+
+    simulate(DriftDomain(), Nudge(), cfg, 0, checkpoint=Checkpoint(tmp_path / "b", every=5, keep=True))
+    assert sorted(p.suffix for p in (tmp_path / "b").iterdir()) == [".ckpt", ".events"]
+
+
+@pytest.mark.parametrize("damage", ["missing", "truncated"])
+def test_snapshot_without_its_event_log_starts_over(tmp_path, damage):
+    cfg = RunConfig(horizon=12)
+    full = simulate(DriftDomain(), Nudge(), cfg, seed=0)
+    ckpt = Checkpoint(tmp_path, every=5, keep=True)
+    simulate(DriftDomain(), Nudge(), cfg, 0, checkpoint=ckpt)
+    (log,) = tmp_path.glob("*.events")
+    if damage == "missing":
+        log.unlink()
+    else:
+        log.write_bytes(log.read_bytes()[:3])
+    assert simulate(DriftDomain(), Nudge(), cfg, 0, checkpoint=ckpt) == full
+
+
+def test_every_must_be_positive(tmp_path):
+    with pytest.raises(ValueError):
+        Checkpoint(tmp_path, every=0)
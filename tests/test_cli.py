@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+import subprocess
+import sys
+from typing import Any
+
+import pytest
+
+import policy_eval
+from policy_eval.abstractions.policy import PolicyContext
+from policy_eval.cli import SpecError, load_spec, main, parse_spec, run_spec
+from policy_eval.core.rng import SeedPlan
+from policy_eval.core.types import Event, RunConfig, Trajectory
+from policy_eval.engine.evaluate import EvaluationResult, evaluate
+from policy_eval.engine.pareto import MetricSpec
+
+
+class DriftDomain:
+    name = "drift"
+
+    def __init__(self, scale: float = 1.0) -> None:
+        self.scale = scale
+
+    def initial_state(self, rng: Any) -> float:
+        return float(rng.normal())
+
+    def actors(self, state: float):
+        return []
+
+    def policy_context(self, state: float, t: int) -> PolicyContext:
+        return PolicyContext(t=t, system_view=state)
+
+    def observe(self, state: float, actor, t: int):
+        raise RuntimeError("no actors")
+
+    def transition(self, state: float, policy_action, actor_actions, rng: Any, t: int) -> float:
+        return state + (policy_action or 0.0) + self.scale * float(rng.normal())
+
+    def record(self, state: float, t: int) -> Event:
+        return Event(t=t, payload=state)
+
+    def finalize(self, events, final_state) -> Trajectory:
+        return Trajectory(events=tuple(events), final_state=final_state)
+
+
+class Push:
+    def __init__(self, step: float, label: str = "push") -> None:
+        self.step = step
+        self.name = f"{label}_{step}"
+
+    def decide(self, ctx: PolicyContext) -> float:
+        return self.step
+
+
+class FinalValue:
+    name = "final"
+
+    def evaluate(self, traj: Trajectory) -> float:
+        return float(traj.final_state)
+
+
+SPEC = """
+[domain]
+factory = "test_cli:DriftDomain"
+args = {{ scale = 0.5 }}
+
+[[policies]]
+factory = "test_cli:Push"
+args = {{ label = "p" }}
+grid = {{ step = [0.0, 0.25, 0.5] }}
+
+[[metrics]]
+factory = "test_cli:FinalValue"
+
+[seeds]
+start = 0
+stop = 40
+
+[run]
+horizon = 6
+warmup = 1
+
+[[pareto]]
+name = "final"
+direction = "higher_better"
+
+[backend]
+{backend}
+"""
+
+
+def _expected() -> EvaluationResult:
+    return evaluate(
+        domain=DriftDomain(scale=0.5),
+        policies=[Push(s, label="p") for s in (0.0, 0.25, 0.5)],
+        metrics=[FinalValue()],
+        seeds=range(40),
+        cfg=RunConfig(horizon=6, warmup=1),
+        pareto_metrics=[MetricSpec(name="final", direction="higher_better")],
+    )
+
+
+@pytest.mark.parametrize(
+    "backend",
+    [
+        'kind = "serial"',
+        'kind = "process"\nworkers = 2\nstreaming = true',
+        'kind = "process"\nworkers = 2\nshared_table = true',
+        'kind = "distributed"\nlocal_workers = 2\nlease_seeds = 8',
+    ],
+)
+def test_run_spec_matches_evaluate(tmp_path, capsys, backend):
+    spec = tmp_path / "exp.toml"
+    spec.write_text(SPEC.format(backend=backend))
+
+    out, summary = tmp_path / "res.pkl", tmp_path / "s.json"
+    code = main(["run", str(spec), "--out", str(out), "--json", str(summary)])
+
+    expected = _expected()
+    saved = EvaluationResult.load(out)
+    assert code == 0
+    assert saved.summaries.keys() == expected.summaries.keys()
+    for key, s in expected.summaries.items():
+        # streamed means and stds are accumulated online
+        assert saved.summaries[key].mean == pytest.approx(s.mean)
+        assert saved.summaries[key].std == pytest.approx(s.std)
+        assert saved.summaries[key].p50 == s.p50
+    assert saved.pareto == expected.pareto == ["p_0.5"]
+    assert "pareto front: p_0.5" in capsys.readouterr().out
+    dumped = json.loads(summary.read_text())
+    assert {(r["policy"], r["metric"]) for r in dumped["summaries"]} == set(expected.summaries)
+
+
+def test_malformed_spec_exits_with_usage_error(tmp_path, capsys):
+    spec = tmp_path / "bad.toml"
+    spec.write_text('[domain]\nfactory = "test_cli:DriftDomain"\n')
+    assert main(["run", str(spec)]) == 2
+    assert "Missing [policies]" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize(
+    "old, new, message",
+    [
+        ("horizon = 6\n", "horizn = 6\n", "[run]: unknown keys ['horizn']"),
+        ("warmup = 1\n", 'sampling = { mode = "lhs" }\n', "[run.sampling]: Unknown sampling"),
+        ('direction = "higher_better"\n', "", "[[pareto]]: missing keys ['direction']"),
+        ("test_cli:Push", "test_cli:Pull", "Cannot import 'test_cli:Pull'"),
+        ("test_cli:FinalValue", "no_such_module:FinalValue", "Cannot import"),
+        ("args = { scale = 0.5 }", "grid = { scale = [0.5, 1.0] }", "cannot have a grid"),
+        ("stop = 40", "stop = = 40", "invalid TOML"),
+        ("stop = 40", 'stop = "ten"', "[seeds]:"),
+        ('kind = "serial"', 'kind = "serial"\nworker = 8', "[backend]: unknown keys ['worker']"),
+    ],
+)
+def test_malformed_spec_values_exit_with_usage_error(tmp_path, capsys, old, new, message):
+    spec = tmp_path / "bad.toml"
+    spec.write_text(SPEC.format(backend='kind = "serial"').replace(old, new))
+    assert main(["run", str(spec)]) == 2
+    assert message in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("raw", [None, 3, ["domain"]])
+def test_spec_that_is_not_a_table_is_a_spec_error(raw):
+    with pytest.raises(SpecError, match="must be a table of sections"):
+        parse_spec(raw)
+
+
+def test_workers_flag_with_serial_backend_exits_with_usage_error(tmp_path, capsys):
+    spec = tmp_path / "exp.toml"
+    spec.write_text(SPEC.format(backend='kind = "serial"'))
+    assert main(["run", str(spec), "--workers", "2"]) == 2
+    assert "--workers needs" in capsys.readouterr().err
+
+
+def test_invalid_yaml_exits_with_usage_error(tmp_path, capsys):
+    pytest.importorskip("yaml")
+    spec = tmp_path / "bad.yaml"
+    spec.write_text("domain: [unclosed\n")
+    assert main(["run", str(spec)]) == 2
+    assert "invalid YAML" in capsys.readouterr().err
+
+
+def test_import_and_help_do_not_load_numpy():
+    src = str(Path(policy_eval.__file__).parent.parent)
+    probe = (
+        "import sys\n"
+        "import policy_eval\n"
+        "from policy_eval.cli import main\n"
+        "try:\n"
+        "    main(['run', '--help'])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "print('numpy' in sys.modules, file=sys.stderr)\n"
+    )
+    env = {**os.environ, "PYTHONPATH": src}
+    out = subprocess.run([sys.executable, "-c", probe], env=env, capture_output=True, text=True)
+    assert out.returncode == 0
+    assert out.stderr.strip() == "False"
+
+
+def test_run_sampling_table_builds_seed_plan(tmp_path):
+    spec = tmp_path / "exp.toml"
+    text = SPEC.format(backend='kind = "serial"').replace(
+        "warmup = 1\n", 'warmup = 1\nsampling = { mode = "antithetic" }\n'
+    )
+    spec.write_text(text)
+    result = run_spec(load_spec(spec))
+    assert result.spec.cfg.sampling == SeedPlan("antithetic")
+    assert result.estimates()[("p_0.5", "final")].n == 40
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from policy_eval.engine.columnar import MetricTable
+from policy_eval.engine.compare import _quantile, summarize_distributions
+from policy_eval.engine.experiment import MetricResult, TrialResult
+
+
+def _trial(policy: str, seed: int, **metrics: float) -> TrialResult:
+    return TrialResult(
+        domain="d",
+        policy=policy,
+        seed=seed,
+        metrics=tuple(MetricResult(metric=k, value=v) for k, v in metrics.items()),
+        run=None,
+    )
+
+
+def _grid() -> list[TrialResult]:
+    rng = np.random.default_rng(1)
+    return [
+        _trial(p, s, eff=float(rng.normal()), fair=float(rng.uniform()))
+        for p in ("A", "B", "C")
+        for s in range(11)
+    ]
+
+
+def test_table_layout():
+    table = MetricTable.from_trials(_grid())
+
+    assert table.values.shape == (3, 2, 11)
+    assert table.policies == ("A", "B", "C")
+    assert table.metrics == ("eff", "fair")
+    assert table.seeds == tuple(range(11))
+    tr = _grid()[11 + 4]  # policy B, seed 4
+    assert table.values[table.policy_index["B"], table.metric_index["fair"], 4] == tr.metrics[1].value
+
+
+def test_vectorized_summaries_match_reference():
+    trials = _grid()
+    summaries = MetricTable.from_trials(trials).summarize()
+    assert summaries.keys() == summarize_distributions(trials).keys()
+
+    for (p, m), s in summaries.items():
+        vals = sorted(mr.value for tr in trials if tr.policy == p for mr in tr.metrics if mr.metric == m)
+        mean = sum(vals) / len(vals)
+        assert s.n == len(vals)
+        assert s.mean == pytest.approx(mean)
+        assert s.std == pytest.approx((sum((x - mean) ** 2 for x in vals) / len(vals)) ** 0.5)
+        assert (s.min, s.max) == (vals[0], vals[-1])
+        assert s.p10 == pytest.approx(_quantile(vals, 0.10))
+        assert s.p50 == pytest.approx(_quantile(vals, 0.50))
+        assert s.p90 == pytest.approx(_quantile(vals, 0.90))
+
+
+def test_ragged_trials_fall_back():
+    trials = _grid()[:-1]  # policy C is missing one seed
+    with pytest.raises(ValueError):
+        MetricTable.from_trials(trials)
+
+    summaries = summarize_distributions(trials)
+    assert summaries[("A", "eff")].n == 11
+    assert summaries[("C", "eff")].n == 10
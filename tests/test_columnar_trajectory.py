@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+import pytest
+
+from policy_eval.abstractions.policy import PolicyContext
+from policy_eval.core.types import ColumnarTrajectory, Event, RunConfig, Trajectory
+from policy_eval.engine.simulator import simulate, simulate_prefix
+
+
+class QueueDomain:
+    name = "queue"
+
+    def initial_state(self, rng: Any) -> tuple[float, int]:
+        return (0.0, 0)
+
+    def actors(self, state):
+        return []
+
+    def policy_context(self, state, t: int) -> PolicyContext:
+        return PolicyContext(t=t, system_view=state)
+
+    def observe(self, state, actor, t: int):
+        raise RuntimeError("no actors")
+
+    def transition(self, state, policy_action, actor_actions, rng: Any, t: int):
+        load, served = state
+        arrivals = float(rng.exponential())
+        done = min(load + arrivals, policy_action or 0)
+        return (load + arrivals - done, served + int(done > 0))
+
+    def record(self, state, t: int) -> Event:
+        return Event(t=t, payload={"load": state[0], "served": state[1]})
+
+    def finalize(self, events, final_state) -> Trajectory:
+        return Trajectory(events=tuple(events), final_state=final_state)
+
+
+class ColumnarQueueDomain(QueueDomain):
+    event_dtype = [("load", "f8"), ("served", "i8")]
+
+    def record_row(self, state, t: int) -> tuple[float, int]:
+        return state
+
+
+class Serve:
+    name = "serve"
+
+    def decide(self, ctx: PolicyContext) -> float:
+        return 0.8
+
+
+class MeanLoad:
+    name = "mean_load"
+
+    def evaluate(self, traj: ColumnarTrajectory) -> float:
+        return float(traj.columns["load"].mean())
+
+
+def test_columnar_matches_event_domain():
+    cfg = RunConfig(horizon=50)
+    ref = simulate(QueueDomain(), Serve(), cfg, seed=4).trajectory
+    col = simulate(ColumnarQueueDomain(), Serve(), cfg, seed=4).trajectory
+
+    assert isinstance(col, ColumnarTrajectory)
+    assert col.data.shape == (50,)
+    assert np.array_equal(col.columns["t"], np.arange(50))
+    assert col.events == ref.events
+    assert col.final_state == ref.final_state
+    assert MeanLoad().evaluate(col) == pytest.approx(
+        np.mean([e.payload["load"] for e in ref.events])
+    )
+
+
+def test_columnar_is_read_only():
+    traj = simulate(ColumnarQueueDomain(), Serve(), RunConfig(horizon=3), seed=0).trajectory
+    with pytest.raises(ValueError):
+        traj.data["load"][0] = 1.0
+
+
+def test_columnar_prefix_continuation():
+    cfg = RunConfig(horizon=20, warmup=7)
+    prefix = simulate_prefix(ColumnarQueueDomain(), cfg, seed=2)
+    shared = simulate(ColumnarQueueDomain(), Serve(), cfg, seed=2, prefix=prefix)
+    full = simulate(ColumnarQueueDomain(), Serve(), cfg, seed=2)
+
+    assert shared.trajectory == full.trajectory
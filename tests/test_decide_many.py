@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+import pytest
+
+from policy_eval.abstractions.policy import PolicyContext
+from policy_eval.core.types import Event, RunConfig, Trajectory
+from policy_eval.engine.experiment import run_experiment
+from policy_eval.engine.profile import Profiler
+from policy_eval.engine.simulator import simulate, simulate_many
+
+
+class Actor:
+    def __init__(self, actor_id: str) -> None:
+        self.id = actor_id
+
+    def act(self, obs: Any, rng: Any) -> float:
+        return float(rng.normal())
+
+
+class DriftDomain:
+    name = "drift"
+
+    def __init__(self) -> None:
+        self.people = [Actor("a"), Actor("b")]
+
+    def initial_state(self, rng: Any) -> float:
+        return float(rng.normal())
+
+    def actors(self, state: float):
+        return self.people
+
+    def policy_context(self, state: float, t: int) -> PolicyContext:
+        return PolicyContext(t=t, system_view=state)
+
+    def observe(self, state: float, actor, t: int) -> float:
+        return state
+
+    def transition(self, state, policy_action, actor_actions, rng: Any, t: int) -> float:
+        return state + sum(actor_actions) + (policy_action or 0.0) + float(rng.normal())
+
+    def record(self, state: float, t: int) -> Event:
+        return Event(t=t, payload=state)
+
+    def finalize(self, events, final_state) -> Trajectory:
+        return Trajectory(events=tuple(events), final_state=final_state)
+
+
+class LinearModel:
+    """
+    Stand-in for a model: decide_many is one vectorized call per timestep.
+    """
+
+    def __init__(self, w: float) -> None:
+        self.w = w
+        self.name = f"linear_{w}"
+        self.batch_sizes: list[int] = []
+
+    def decide(self, ctx: PolicyContext) -> float:
+        return -self.w * ctx.system_view
+
+    def decide_many(self, ctxs: list[PolicyContext]) -> np.ndarray:
+        self.batch_sizes.append(len(ctxs))
+        return -self.w * np.array([c.system_view for c in ctxs])
+
+
+class Plain:
+    def __init__(self, w: float) -> None:
+        self.name = f"linear_{w}"
+        self.w = w
+
+    def decide(self, ctx: PolicyContext) -> float:
+        return -self.w * ctx.system_view
+
+
+class FinalValue:
+    name = "final"
+
+    def evaluate(self, traj: Trajectory) -> float:
+        return float(traj.final_state)
+
+
+def test_simulate_many_matches_simulate_with_one_call_per_step():
+    cfg = RunConfig(horizon=7, warmup=2)
+    model = LinearModel(0.3)
+    runs = simulate_many(DriftDomain(), model, cfg, range(25))
+
+    assert runs == [simulate(DriftDomain(), Plain(0.3), cfg, seed=s) for s in range(25)]
+    assert model.batch_sizes == [25] * 5  # horizon - warmup steps, all seeds per call
+
+
+def test_simulate_many_without_decide_many_and_no_steps():
+    cfg = RunConfig(horizon=3, warmup=3)
+    assert simulate_many(DriftDomain(), Plain(1.0), cfg, [1, 2]) == [
+        simulate(DriftDomain(), Plain(1.0), cfg, seed=s) for s in (1, 2)
+    ]
+
+
+class DropsOne(LinearModel):
+    def decide_many(self, ctxs: list[PolicyContext]) -> np.ndarray:
+        return super().decide_many(ctxs)[:-1]
+
+
+def test_simulate_many_rejects_wrong_number_of_actions():
+    with pytest.raises(ValueError, match="2 actions for 3 contexts"):
+        simulate_many(DriftDomain(), DropsOne(0.3), RunConfig(horizon=4), range(3))
+
+
+def test_run_experiment_batches_decide_many_policies():
+    kwargs = dict(domain=DriftDomain(), metrics=[FinalValue()], seeds=range(40))
+    for cfg in (RunConfig(horizon=6), RunConfig(horizon=6, warmup=2)):
+        models = [LinearModel(0.1), LinearModel(0.5)]
+        profiler = Profiler()
+        got = run_experiment(policies=models, cfg=cfg, profiler=profiler, **kwargs)
+        expected = run_experiment(policies=[Plain(0.1), Plain(0.5)], cfg=cfg, **kwargs)
+
+        assert got == expected
+        assert all(set(m.batch_sizes) == {40} for m in models)
+        assert profiler.stats[("drift", "linear_0.1", "decide")].count == 6 - cfg.warmup
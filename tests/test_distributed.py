@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import json
+import multiprocessing
+import threading
+import time
+from typing import Any
+import urllib.error
+
+import numpy as np
+import pytest
+
+from policy_eval.abstractions.actor import Observation
+from policy_eval.abstractions.policy import PolicyContext
+from policy_eval.core.types import Event, RunConfig, Trajectory
+from policy_eval.engine.distributed import Coordinator, _request, run_worker
+from policy_eval.engine.evaluate import evaluate
+from policy_eval.engine.pareto import MetricSpec
+
+
+class NoisyActor:
+    id = "a"
+
+    def act(self, obs: Observation, rng: Any) -> float:
+        return float(rng.normal())
+
+
+class NoisyDomain:
+    name = "noisy"
+
+    def initial_state(self, rng: Any) -> float:
+        return float(rng.uniform())
+
+    def actors(self, state: float):
+        return [NoisyActor()]
+
+    def policy_context(self, state: float, t: int) -> PolicyContext:
+        return PolicyContext(t=t, system_view=state)
+
+    def observe(self, state: float, actor, t: int) -> Observation:
+        return Observation(t=t, data=state)
+
+    def transition(self, state: float, policy_action, actor_actions, rng: Any, t: int) -> float:
+        return state + (policy_action or 0.0) + actor_actions[0] + float(rng.normal())
+
+    def record(self, state: float, t: int) -> Event:
+        return Event(t=t, payload=state)
+
+    def finalize(self, events, final_state) -> Trajectory:
+        return Trajectory(events=tuple(events), final_state=final_state)
+
+
+class Scale:
+    def __init__(self, k: float) -> None:
+        self.k = k
+        self.name = f"scale_{k}"
+
+    def decide(self, ctx: PolicyContext) -> float:
+        return -self.k * ctx.system_view
+
+
+class FinalValue:
+    name = "final"
+
+    def evaluate(self, traj: Trajectory) -> float:
+        return float(traj.final_state)
+
+
+class Spread:
+    name = "spread"
+
+    def evaluate(self, traj: Trajectory) -> float:
+        values = [e.payload for e in traj.events]
+        return max(values) - min(values)
+
+
+SPECS = [
+    MetricSpec(name="final", direction="higher_better"),
+    MetricSpec(name="spread", direction="lower_better"),
+]
+
+
+def _grid(cfg: RunConfig, seeds: range) -> dict[str, Any]:
+    return dict(
+        domain=NoisyDomain(),
+        policies=[Scale(0.0), Scale(0.5), Scale(1.0)],
+        metrics=[FinalValue(), Spread()],
+        seeds=seeds,
+        cfg=cfg,
+    )
+
+
+def test_local_workers_reassemble_the_serial_result():
+    grid = _grid(RunConfig(horizon=8), range(50))
+    expected = evaluate(pareto_metrics=SPECS, **grid)
+
+    with Coordinator(lease_seeds=7, **grid) as coordinator:
+        workers = [
+            multiprocessing.Process(target=run_worker, args=(coordinator.url,)) for _ in range(3)
+        ]
+        for w in workers:
+            w.start()
+        assert coordinator.wait(timeout=60)
+        for w in workers:
+            w.join(timeout=10)
+        res = coordinator.result(pareto_metrics=SPECS)
+
+    assert all(w.exitcode == 0 for w in workers)
+    assert np.array_equal(res.table.values, expected.table.values)
+    assert res.summaries == expected.summaries
+    assert res.pareto == expected.pareto
+    assert res.spec.seeds == tuple(range(50))
+
+
+def test_straggler_lease_is_reissued_and_late_result_ignored():
+    grid = _grid(RunConfig(horizon=6, warmup=2), range(12))
+    expected = evaluate(**grid)
+
+    with Coordinator(lease_seeds=4, lease_timeout=0.05, token="s3cret", **grid) as coordinator:
+        for wrong in (None, "s3cre", "s3cret!"):
+            with pytest.raises(urllib.error.HTTPError):
+                _request(f"{coordinator.url}/lease", wrong, b"")
+
+        stuck = json.loads(_request(f"{coordinator.url}/lease", "s3cret", b""))
+        assert stuck["rows"] == [0, 1, 2]  # warm-up units span every policy
+
+        done = run_worker(coordinator.url, token="s3cret")
+        assert coordinator.wait(timeout=10)
+        late = np.zeros((3, 2, len(stuck["seeds"]))).tobytes()
+        reply = _request(f"{coordinator.url}/result?lease={stuck['lease']}", "s3cret", late)
+        res = coordinator.result()
+
+    assert done == 3 and coordinator.reissued == 1
+    assert json.loads(reply) == {"accepted": False}
+    assert np.array_equal(res.table.values, expected.table.values)
+
+
+def test_worker_waiting_on_a_closed_coordinator_stops_cleanly():
+    grid = _grid(RunConfig(horizon=4), range(4))
+    done: list[int] = []
+
+    with Coordinator(lease_seeds=4, lease_timeout=4.0, **grid) as coordinator:
+        while json.loads(_request(f"{coordinator.url}/lease", None, b""))["status"] == "lease":
+            pass  # hold every lease, so the worker has to wait
+        worker = threading.Thread(target=lambda: done.append(run_worker(coordinator.url)))
+        worker.start()
+        time.sleep(0.3)  # let it fetch the job and start its 1s wait
+    worker.join(timeout=10)
+
+    assert not worker.is_alive()
+    assert done == [0]
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from policy_eval.abstractions.policy import PolicyContext
+from policy_eval.core.types import Event, RunConfig, Trajectory
+from policy_eval.engine.evaluate import EvaluationResult, evaluate
+from policy_eval.engine.pareto import MetricSpec
+
+
+class DriftDomain:
+    name = "drift"
+
+    def __init__(self) -> None:
+        self.runs = 0
+
+    def initial_state(self, rng: Any) -> float:
+        self.runs += 1
+        return float(rng.normal())
+
+    def actors(self, state: float):
+        return []
+
+    def policy_context(self, state: float, t: int) -> PolicyContext:
+        return PolicyContext(t=t, system_view=state)
+
+    def observe(self, state: float, actor, t: int):
+        raise RuntimeError("no actors")
+
+    def transition(self, state: float, policy_action: float, actor_actions, rng: Any, t: int) -> float:
+        return state + policy_action + float(rng.normal())
+
+    def record(self, state: float, t: int) -> Event:
+        return Event(t=t, payload=state)
+
+    def finalize(self, events, final_state) -> Trajectory:
+        return Trajectory(events=tuple(events), final_state=final_state)
+
+
+class Push:
+    def __init__(self, step: float) -> None:
+        self.step = step
+        self.name = f"push_{step}"
+
+    def decide(self, ctx: PolicyContext) -> float:
+        return self.step
+
+
+class FinalValue:
+    name = "final"
+
+    def evaluate(self, traj: Trajectory) -> float:
+        return float(traj.final_state)
+
+
+class Effort:
+    name = "effort"
+
+    def evaluate(self, traj: Trajectory) -> float:
+        return -abs(float(traj.final_state - traj.events[0].payload))
+
+
+KW = dict(
+    metrics=[FinalValue(), Effort()],
+    cfg=RunConfig(horizon=5),
+    pareto_metrics=[
+        MetricSpec(name="final", direction="higher_better"),
+        MetricSpec(name="effort", direction="higher_better"),
+    ],
+)
+
+
+def _assert_same_summaries(got, expected):
+    assert got.keys() == expected.keys()
+    for key, s in expected.items():
+        o = got[key]
+        assert o.n == s.n and o.min == s.min and o.max == s.max
+        assert o.mean == pytest.approx(s.mean)
+        assert o.std == pytest.approx(s.std)
+        assert (o.p10, o.p50, o.p90) == pytest.approx((s.p10, s.p50, s.p90))
+
+
+def test_extend_simulates_only_new_cells_and_matches_full_run():
+    domain = DriftDomain()
+    base = evaluate(domain=domain, policies=[Push(0.0), Push(0.5)], seeds=range(30), **KW)
+    before = domain.runs
+    grown = base.extend(seeds=range(20, 60), policies=[Push(1.0), Push(0.5)])
+
+    assert domain.runs - before == 2 * 30 + 60  # old policies x new seeds + new policy x all
+    full = evaluate(
+        domain=DriftDomain(), policies=[Push(0.0), Push(0.5), Push(1.0)], seeds=range(60), **KW
+    )
+    assert grown.trials == full.trials
+    assert grown.table.policies == full.table.policies
+    assert grown.table.seeds == full.table.seeds
+    assert (grown.table.values == full.table.values).all()
+    assert grown.pareto == full.pareto
+    _assert_same_summaries(grown.summaries, full.summaries)
+    assert grown.spec.seeds == tuple(range(60))
+
+
+def test_extend_past_sketch_size_keeps_exact_summaries():
+    base = evaluate(domain=DriftDomain(), policies=[Push(0.5)], seeds=range(400), **KW)
+    grown = base.extend(seeds=range(400, 800))
+    full = evaluate(domain=DriftDomain(), policies=[Push(0.5)], seeds=range(800), **KW)
+
+    assert grown.summaries == grown.table.summarize() == full.summaries
+    assert grown.pareto == full.pareto
+
+
+def test_streaming_result_extends_after_save_and_load(tmp_path):
+    policies = [Push(0.0), Push(0.5)]
+    base = evaluate(domain=DriftDomain(), policies=policies, seeds=range(200), streaming=True, **KW)
+    base.save(tmp_path / "res.pkl")
+
+    loaded = EvaluationResult.load(tmp_path / "res.pkl")
+    grown = loaded.extend(seeds=range(200, 600))
+    full = evaluate(domain=DriftDomain(), policies=policies, seeds=range(600), **KW)
+
+    assert grown.trials == [] and grown.table is None
+    for key, s in full.summaries.items():
+        o = grown.summaries[key]
+        assert o.n == 600 and o.min == s.min and o.max == s.max
+        assert o.mean == pytest.approx(s.mean)
+        assert o.std == pytest.approx(s.std)
+        assert o.p50 == pytest.approx(s.p50, abs=0.1 * s.std)  # sketch estimate past k=256
+
+
+def test_merge_rejects_mismatched_runs():
+    a = evaluate(domain=DriftDomain(), policies=[Push(0.0)], seeds=range(5), **KW)
+    b = evaluate(
+        domain=DriftDomain(),
+        policies=[Push(0.0)],
+        seeds=range(5, 9),
+        **{**KW, "cfg": RunConfig(horizon=6)},
+    )
+    with pytest.raises(ValueError, match="different configs"):
+        a.merge(b)
+    with pytest.raises(ValueError, match="extended"):
+        EvaluationResult(trials=[], summaries={}, pareto=None).extend(seeds=[1])
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_merge_rejects_overlapping_cells(streaming):
+    kw = dict(domain=DriftDomain(), policies=[Push(0.0)], streaming=streaming, **KW)
+    a = evaluate(seeds=range(10), **kw)
+    b = evaluate(seeds=range(5, 15), **kw)
+    with pytest.raises(ValueError, match="5 \\(policy, seed\\) cells"):
+        a.merge(b)
+    with pytest.raises(ValueError, match="10 \\(policy, seed\\) cells"):
+        a.merge(a)
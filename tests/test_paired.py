@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+import pytest
+
+from policy_eval.abstractions.policy import PolicyContext
+from policy_eval.core.types import Event, RunConfig, Trajectory
+from policy_eval.engine.compare import pairwise_dominance_report
+from policy_eval.engine.evaluate import evaluate
+from policy_eval.engine.paired import _t_quantile, paired_differences, paired_dominance_report
+from policy_eval.engine.pareto import MetricSpec
+from policy_eval.engine.sequential import evaluate_sequential
+
+
+class WeatherDomain:
+    """
+    Outcome = large shared weather noise + small policy effect.
+    """
+    name = "weather"
+
+    def initial_state(self, rng: Any) -> float:
+        return float(rng.normal(scale=10.0))
+
+    def actors(self, state: float):
+        return []
+
+    def policy_context(self, state: float, t: int) -> PolicyContext:
+        return PolicyContext(t=t, system_view=state)
+
+    def observe(self, state: float, actor, t: int):
+        raise RuntimeError("no actors")
+
+    def transition(self, state: float, policy_action: float, actor_actions, rng: Any, t: int) -> float:
+        return state + policy_action
+
+    def record(self, state: float, t: int) -> Event:
+        return Event(t=t, payload=state)
+
+    def finalize(self, events, final_state) -> Trajectory:
+        return Trajectory(events=tuple(events), final_state=final_state)
+
+
+class Boost:
+    def __init__(self, k: float) -> None:
+        self.k = k
+        self.name = f"boost_{k}"
+
+    def decide(self, ctx: PolicyContext) -> float:
+        return self.k
+
+
+class FinalValue:
+    name = "final"
+
+    def evaluate(self, traj: Trajectory) -> float:
+        return float(traj.final_state)
+
+
+def _res(n_seeds: int):
+    return evaluate(
+        domain=WeatherDomain(),
+        policies=[Boost(0.0), Boost(0.1), Boost(0.2)],
+        metrics=[FinalValue()],
+        seeds=range(n_seeds),
+        cfg=RunConfig(horizon=1),
+    )
+
+
+def test_paired_interval_sees_small_effect_under_common_noise():
+    res = _res(30)
+    pm = paired_differences(res.table, "final", direction="higher_better")
+    d = pm.pair("boost_0.2", "boost_0.0")
+
+    assert d.n == 30
+    assert d.mean == pytest.approx(0.2)
+    assert d.ci_low > 0 and d.win_rate == 1.0
+    assert pm.pair("boost_0.0", "boost_0.2").win_rate == 0.0
+    assert np.allclose(np.diag(pm.win_rate), 0.5)
+
+    # the marginal summaries cannot tell the policies apart with tol=1 (the noise scale)
+    assert pairwise_dominance_report(
+        res.summaries, metric="final", direction="higher_better", tol=1.0
+    ) == []
+    assert set(
+        paired_dominance_report(res.table, metric="final", direction="higher_better")
+    ) == {("boost_0.1", "boost_0.0"), ("boost_0.2", "boost_0.0"), ("boost_0.2", "boost_0.1")}
+
+
+def test_bootstrap_agrees_with_t_interval():
+    table = _res(200).table
+    noisy = table.values.copy()
+    noisy[1, 0] += np.random.default_rng(0).normal(scale=0.5, size=noisy.shape[-1])
+    table = table.__class__(table.policies, table.metrics, table.seeds, noisy)
+
+    t = paired_differences(table, "final", direction="higher_better").pair("boost_0.1", "boost_0.0")
+    b = paired_differences(
+        table, "final", direction="higher_better", method="bootstrap"
+    ).pair("boost_0.1", "boost_0.0")
+    assert b.ci_low == pytest.approx(t.ci_low, abs=0.03)
+    assert b.ci_high == pytest.approx(t.ci_high, abs=0.03)
+
+
+def test_paired_sequential_needs_fewer_seeds():
+    kwargs = dict(
+        domain=WeatherDomain(),
+        policies=[Boost(0.0), Boost(0.5)],
+        metrics=[FinalValue()],
+        seeds=range(100_000),
+        cfg=RunConfig(horizon=1),
+        criteria=[MetricSpec(name="final", direction="higher_better")],
+        batch_size=10,
+        max_seeds=20_000,
+    )
+    paired = evaluate_sequential(paired=True, **kwargs)
+    marginal = evaluate_sequential(**kwargs)
+
+    assert paired.stopped == "settled"
+    assert paired.seeds_used == 10
+    assert paired.seeds_used * 100 < marginal.seeds_used
+
+
+@pytest.mark.parametrize(
+    "df, p, expected",
+    [(1, 0.975, 12.7062), (2, 0.975, 4.3027), (3, 0.995, 5.8409), (7, 0.9, 1.4149),
+     (30, 0.975, 2.0423), (60, 0.975, 2.0003), (4, 0.05, -2.1318)],
+)
+def test_t_quantile_matches_tables(df, p, expected):
+    assert _t_quantile(p, df) == pytest.approx(expected, abs=1e-4)
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from policy_eval.abstractions.actor import Observation
+from policy_eval.abstractions.policy import PolicyContext
+from policy_eval.core.types import Event, RunConfig, Trajectory
+from policy_eval.engine.evaluate import evaluate
+from policy_eval.engine.experiment import run_experiment
+
+
+class NoisyActor:
+    id = "a"
+
+    def act(self, obs: Observation, rng: Any) -> float:
+        return float(rng.normal())
+
+
+class NoisyDomain:
+    name = "noisy"
+
+    def initial_state(self, rng: Any) -> float:
+        return float(rng.uniform())
+
+    def actors(self, state: float):
+        return [NoisyActor()]
+
+    def policy_context(self, state: float, t: int) -> PolicyContext:
+        return PolicyContext(t=t, system_view=state)
+
+    def observe(self, state: float, actor, t: int) -> Observation:
+        return Observation(t=t, data=state)
+
+    def transition(self, state: float, policy_action: float, actor_actions, rng: Any, t: int) -> float:
+        return state + policy_action + actor_actions[0] + float(rng.normal())
+
+    def record(self, state: float, t: int) -> Event:
+        return Event(t=t, payload=state)
+
+    def finalize(self, events, final_state) -> Trajectory:
+        return Trajectory(events=tuple(events), final_state=final_state)
+
+
+class Scale:
+    def __init__(self, k: float) -> None:
+        self.k = k
+        self.name = f"scale_{k}"
+
+    def decide(self, ctx: PolicyContext) -> float:
+        return -self.k * ctx.system_view
+
+
+class FinalValue:
+    name = "final"
+
+    def evaluate(self, traj: Trajectory) -> float:
+        return float(traj.final_state)
+
+
+def _grid(**kwargs):
+    return run_experiment(
+        domain=NoisyDomain(),
+        policies=[Scale(0.0), Scale(0.5), Scale(1.0)],
+        metrics=[FinalValue()],
+        seeds=range(7),
+        cfg=RunConfig(horizon=10),
+        **kwargs,
+    )
+
+
+def test_process_pool_matches_serial_bit_for_bit():
+    serial = _grid()
+    parallel = _grid(workers=2, chunksize=3)
+
+    assert [(t.policy, t.seed) for t in parallel] == [(t.policy, t.seed) for t in serial]
+    assert parallel == serial
+
+
+def test_external_executor_and_generator_seeds():
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        res = evaluate(
+            domain=NoisyDomain(),
+            policies=[Scale(0.0), Scale(1.0)],
+            metrics=[FinalValue()],
+            seeds=(s for s in range(5)),
+            cfg=RunConfig(horizon=5),
+            executor=ex,
+        )
+
+    # a one-shot seed iterable must still cover every policy
+    assert res.summaries[("scale_0.0", "final")].n == 5
+    assert res.summaries[("scale_1.0", "final")].n == 5
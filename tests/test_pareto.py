@@ -1,7 +1,10 @@
 from __future__ import annotations
 
-from policy_eval.engine.compare import DistSummary
-from policy_eval.engine.pareto import MetricSpec, pareto_front
+import numpy as np
+import pytest
+
+from policy_eval.engine.compare import DistSummary, dominance_matrix, pairwise_dominance_report
+from policy_eval.engine.pareto import MetricSpec, pareto_front, pareto_ranks
 
 
 def test_pareto_front_basic():
@@ -27,3 +30,67 @@ def test_pareto_front_basic():
 
     front = pareto_front(summaries, metrics)
     assert set(front) == {"A", "B"}
+
+
+def _summaries(values, names):
+    # values: [policy, metric]; every criterion equals the value
+    return {
+        (f"p{i:03d}", name): DistSummary(n=1, mean=v, std=0, min=v, p10=v, p50=v, p90=v, max=v)
+        for i, row in enumerate(values)
+        for name, v in zip(names, row)
+    }
+
+
+def _reference_front(summaries, metrics):
+    policies = sorted({p for (p, _) in summaries})
+
+    def dominates(a, b):
+        strict = False
+        for ms in metrics:
+            va, vb = summaries[(a, ms.name)].mean, summaries[(b, ms.name)].mean
+            if ms.direction == "lower_better":
+                va, vb = -va, -vb
+            if va < vb - ms.tol:
+                return False
+            strict |= va > vb + ms.tol
+        return strict
+
+    return [p for p in policies if not any(dominates(q, p) for q in policies if q != p)]
+
+
+@pytest.mark.parametrize("n_metrics", [1, 2, 3, 4])
+@pytest.mark.parametrize("tol", [0.0, 1.0])
+def test_pareto_front_matches_pairwise_definition(n_metrics, tol):
+    rng = np.random.default_rng(n_metrics)
+    names = [f"m{k}" for k in range(n_metrics)]
+    # small integer grid: plenty of ties and duplicate rows
+    values = rng.integers(0, 6, size=(300, n_metrics)).astype(float)
+    metrics = [
+        MetricSpec(name=n, direction="lower_better" if k % 2 else "higher_better", tol=tol)
+        for k, n in enumerate(names)
+    ]
+    summaries = _summaries(values, names)
+    assert pareto_front(summaries, metrics) == _reference_front(summaries, metrics)
+
+
+def test_pareto_ranks_peel_successive_fronts():
+    names = ["a", "b"]
+    values = [[3, 1], [1, 3], [2, 2], [2, 1], [1, 2], [1, 1], [1, 1]]
+    summaries = _summaries(values, names)
+    metrics = [MetricSpec(name=n, direction="higher_better") for n in names]
+
+    layers = pareto_ranks(summaries, metrics)
+    assert layers == [["p000", "p001", "p002"], ["p003", "p004"], ["p005", "p006"]]
+    assert layers[0] == pareto_front(summaries, metrics)
+
+
+def test_pairwise_dominance_report_order_and_ties():
+    summaries = _summaries([[1.0], [3.0], [3.0], [2.0]], ["m"])
+    assert pairwise_dominance_report(summaries, metric="m", direction="lower_better") == [
+        ("p000", "p001"), ("p000", "p002"), ("p000", "p003"),
+        ("p001", "p002"), ("p002", "p001"),
+        ("p003", "p001"), ("p003", "p002"),
+    ]
+    policies, wins = dominance_matrix(summaries, metric="m", direction="higher_better", tol=0.5)
+    assert policies == ["p000", "p001", "p002", "p003"]
+    assert wins.sum() == 5 and not wins.diagonal().any()
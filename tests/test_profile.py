@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from typing import Any
+
+from policy_eval.abstractions.actor import Observation
+from policy_eval.abstractions.policy import PolicyContext
+from policy_eval.core.types import Event, RunConfig, Trajectory
+from policy_eval.engine.evaluate import evaluate
+from policy_eval.engine.profile import PhaseStats, Profiler
+from policy_eval.engine.simulator import simulate
+
+
+class Voter:
+    def __init__(self, i: int) -> None:
+        self.id = f"v{i}"
+
+    def act(self, obs: Observation, rng: Any) -> int:
+        return int(rng.integers(0, 2))
+
+
+class VoteDomain:
+    name = "vote"
+
+    def initial_state(self, rng: Any) -> int:
+        return 0
+
+    def actors(self, state: int):
+        return [Voter(0), Voter(1), Voter(2)]
+
+    def policy_context(self, state: int, t: int) -> PolicyContext:
+        return PolicyContext(t=t, system_view=state)
+
+    def observe(self, state: int, actor: Voter, t: int) -> Observation:
+        assert isinstance(actor, Voter)  # domains see their own actors
+        return Observation(t=t, data=state)
+
+    def transition(self, state: int, policy_action: int, actor_actions, rng: Any, t: int) -> int:
+        return state + (policy_action or 0) + sum(actor_actions)
+
+    def record(self, state: int, t: int) -> Event:
+        return Event(t=t, payload=state)
+
+    def finalize(self, events, final_state) -> Trajectory:
+        return Trajectory(events=tuple(events), final_state=final_state)
+
+
+class Bonus:
+    def __init__(self, k: int) -> None:
+        self.k = k
+        self.name = f"bonus_{k}"
+
+    def decide(self, ctx: PolicyContext) -> int:
+        return self.k
+
+
+class Total:
+    name = "total"
+
+    def evaluate(self, traj: Trajectory) -> float:
+        return float(traj.final_state)
+
+
+def test_profiled_run_is_identical_and_counts_phases():
+    cfg = RunConfig(horizon=7)
+    prof = Profiler()
+    plain = simulate(VoteDomain(), Bonus(1), cfg, seed=3)
+    timed = simulate(VoteDomain(), Bonus(1), cfg, seed=3, profiler=prof)
+
+    assert timed == plain
+    counts = {phase: st.count for (_, _, phase), st in prof.stats.items()}
+    assert counts == {
+        "initial_state": 1,
+        "fork": 1 + 7 * 3 + 7,
+        "policy_context": 7,
+        "decide": 7,
+        "observe": 7 * 3,
+        "act": 7 * 3,
+        "transition": 7,
+        "record": 7,
+        "finalize": 1,
+    }
+
+
+def test_evaluate_attaches_profile_including_workers():
+    kwargs = dict(
+        domain=VoteDomain(),
+        policies=[Bonus(0), Bonus(1)],
+        metrics=[Total()],
+        seeds=range(4),
+        cfg=RunConfig(horizon=5, warmup=2),
+    )
+    serial = evaluate(profile=True, **kwargs)
+    parallel = evaluate(profile=True, workers=2, **kwargs)
+
+    assert evaluate(**kwargs).profile is None
+    for res in (serial, parallel):
+        stats = res.profile.stats
+        assert stats[("vote", "bonus_0", "decide")].count == 4 * 3
+        assert stats[("vote", "bonus_1", "metrics")].count == 4
+        assert stats[("vote", "(warmup)", "transition")].count == 4 * 2
+        assert "decide" in res.profile.report()
+    assert serial.summaries == parallel.summaries
+
+
+def test_phase_stats_merge():
+    a, b = PhaseStats(), PhaseStats()
+    for ns in (100, 200, 5000):
+        a.add(ns)
+    b.add(70_000)
+    a.merge(b)
+
+    assert a.count == 4 and a.max_ns == 70_000
+    assert a.total_ns == 75_300
+    assert a.quantile_ns(0.5) == 256
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from policy_eval.abstractions.policy import PolicyContext
+from policy_eval.core.types import Event, RunConfig, Trajectory
+from policy_eval.engine.cache import TrialCache
+from policy_eval.engine.evaluate import evaluate
+from policy_eval.engine.experiment import run_experiment
+from policy_eval.engine.pareto import MetricSpec
+from policy_eval.engine.rescore import rescore
+
+
+class NoisyDomain:
+    name = "noisy"
+
+    def initial_state(self, rng: Any) -> float:
+        return 0.0
+
+    def actors(self, state: float):
+        return []
+
+    def policy_context(self, state: float, t: int) -> PolicyContext:
+        return PolicyContext(t=t, system_view=state)
+
+    def observe(self, state: float, actor, t: int):
+        raise RuntimeError("no actors")
+
+    def transition(self, state: float, policy_action: float, actor_actions, rng: Any, t: int) -> float:
+        return state + policy_action * float(rng.uniform())
+
+    def record(self, state: float, t: int) -> Event:
+        return Event(t=t, payload=state)
+
+    def finalize(self, events, final_state) -> Trajectory:
+        return Trajectory(events=tuple(events), final_state=final_state)
+
+
+class Gain:
+    def __init__(self, k: float) -> None:
+        self.k = k
+        self.name = f"gain_{k}"
+
+    def decide(self, ctx: PolicyContext) -> float:
+        return self.k
+
+
+class FinalValue:
+    name = "final"
+
+    def evaluate(self, traj: Trajectory) -> float:
+        return float(traj.final_state)
+
+
+class Effort:
+    """Cost grows with the final value, so it trades off against it."""
+    name = "effort"
+
+    def evaluate(self, traj: Trajectory) -> float:
+        return sum(float(e.payload) for e in traj.events)
+
+
+KW = dict(
+    domain=NoisyDomain(),
+    policies=[Gain(1.0), Gain(2.0)],
+    seeds=range(6),
+    cfg=RunConfig(horizon=5),
+)
+SPECS = [
+    MetricSpec(name="final", direction="higher_better"),
+    MetricSpec(name="effort", direction="lower_better"),
+]
+
+
+def test_rescore_matches_full_evaluation():
+    base = evaluate(metrics=[FinalValue()], **KW)
+    rescored = rescore(base, [Effort()], pareto_metrics=SPECS)
+    full = evaluate(metrics=[FinalValue(), Effort()], pareto_metrics=SPECS, **KW)
+
+    assert rescored.summaries.keys() == full.summaries.keys()
+    for key, s in full.summaries.items():
+        assert rescored.summaries[key].mean == pytest.approx(s.mean)
+    assert rescored.pareto == full.pareto == ["gain_1.0", "gain_2.0"]
+
+
+def test_rescore_from_cached_runs(tmp_path):
+    cache = TrialCache(tmp_path)
+    run_experiment(metrics=[FinalValue()], cache=cache, **KW)
+
+    res = rescore(cache.runs(), [Effort()])
+    assert res.summaries[("gain_2.0", "effort")].n == 6
+    assert {mr.metric for tr in res.trials for mr in tr.metrics} == {"effort"}
+
+
+def test_rescore_needs_trajectories():
+    trials = run_experiment(metrics=[FinalValue()], **KW)
+    dropped = [tr.__class__(**{**tr.__dict__, "run": None}) for tr in trials]
+    with pytest.raises(ValueError):
+        rescore(dropped, [Effort()])
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import Any
+
+import numpy as np
+import pytest
+
+from policy_eval.abstractions.actor import Observation
+from policy_eval.abstractions.policy import PolicyContext
+from policy_eval.core.types import Event, RunConfig, Trajectory
+from policy_eval.engine.evaluate import evaluate
+from policy_eval.engine.pareto import MetricSpec
+from policy_eval.engine.screening import successive_halving
+from policy_eval.engine.simulator import simulate, simulate_resumable
+
+
+class Customer:
+    id = "c"
+
+    def act(self, obs: Observation, rng: Any) -> float:
+        return float(rng.exponential())
+
+
+class ShopDomain:
+    """
+    Revenue per step is price * demand, demand falling with price; counts
+    transitions so tests can see what was re-simulated.
+    """
+    name = "shop"
+
+    def __init__(self) -> None:
+        self.transitions = 0
+
+    def initial_state(self, rng: Any) -> dict[str, float]:
+        return {"revenue": 0.0, "cost": 0.0, "mood": float(rng.uniform(0.5, 1.5))}
+
+    def actors(self, state):
+        return [Customer()]
+
+    def policy_context(self, state, t: int) -> PolicyContext:
+        return PolicyContext(t=t, system_view=state["mood"])
+
+    def observe(self, state, actor, t: int) -> Observation:
+        return Observation(t=t, data=state["mood"])
+
+    def transition(self, state, policy_action, actor_actions, rng: Any, t: int):
+        self.transitions += 1
+        price = 1.0 if policy_action is None else policy_action
+        demand = max(0.0, state["mood"] * actor_actions[0] * (3.0 - price))
+        state = dict(state)
+        state["revenue"] += price * demand + 0.1 * float(rng.normal())
+        state["cost"] += demand
+        return state
+
+    def record(self, state, t: int) -> Event:
+        return Event(t=t, payload=state["revenue"])
+
+    def finalize(self, events, final_state) -> Trajectory:
+        return Trajectory(events=tuple(events), final_state=final_state)
+
+
+class Price:
+    def __init__(self, p: float) -> None:
+        self.p = p
+        self.name = f"price_{p:.2f}"
+
+    def decide(self, ctx: PolicyContext) -> float:
+        return self.p
+
+
+class Revenue:
+    name = "revenue"
+
+    def evaluate(self, traj: Trajectory) -> float:
+        return traj.final_state["revenue"]
+
+
+class Cost:
+    name = "cost"
+
+    def evaluate(self, traj: Trajectory) -> float:
+        return traj.final_state["cost"]
+
+
+POLICIES = [Price(p) for p in np.linspace(0.0, 3.0, 27)]
+REVENUE = [MetricSpec(name="revenue", direction="higher_better")]
+
+
+def test_screening_keeps_the_best_and_saves_steps():
+    cfg = RunConfig(horizon=27, warmup=2)
+    screen = successive_halving(
+        domain=ShopDomain(), policies=POLICIES, metrics=[Revenue()], seeds=range(27), cfg=cfg,
+        rank_by=REVENUE,
+    )
+    assert [r.horizon for r in screen.rungs] == [3, 6, 13, 27]
+    assert [len(r.ranking) for r in screen.rungs] == [27, 9, 3, 1]
+    assert screen.rungs[-1].seeds == tuple(range(27))
+    assert screen.ranking == ("price_1.50",)
+    assert screen.steps < screen.full_steps / 5
+
+
+def test_final_rung_matches_evaluate_on_survivors():
+    cfg = RunConfig(horizon=20, warmup=3)
+    screen = successive_halving(
+        domain=ShopDomain(), policies=POLICIES, metrics=[Revenue(), Cost()], seeds=range(18),
+        cfg=cfg, rank_by=REVENUE, rungs=3, min_horizon=4, min_seeds=4,
+    )
+    survivors = [p for p in POLICIES if p.name in screen.rungs[-1].ranking]
+    direct = evaluate(
+        domain=ShopDomain(), policies=survivors, metrics=[Revenue(), Cost()], seeds=range(18),
+        cfg=cfg,
+    )
+    assert screen.final.summaries == direct.summaries
+    np.testing.assert_array_equal(screen.final.table.values, direct.table.values)
+
+
+def test_promoted_runs_resume_instead_of_restarting():
+    domain = ShopDomain()
+    screen = successive_halving(
+        domain=domain, policies=POLICIES[:9], metrics=[Revenue()], seeds=range(9),
+        cfg=RunConfig(horizon=18), rank_by=REVENUE,
+    )
+    assert domain.transitions == screen.steps
+    first, second = screen.rungs[0], screen.rungs[1]
+    resumed = len(second.ranking) * len(first.seeds) * (second.horizon - first.horizon)
+    fresh = len(second.ranking) * (len(second.seeds) - len(first.seeds)) * second.horizon
+    assert second.steps == resumed + fresh
+
+
+def test_pareto_rank_promotion():
+    specs = [MetricSpec(name="revenue", direction="higher_better"), MetricSpec(name="cost", direction="lower_better")]
+    screen = successive_halving(
+        domain=ShopDomain(), policies=POLICIES, metrics=[Revenue(), Cost()], seeds=range(9),
+        cfg=RunConfig(horizon=9), rank_by=specs, rungs=2,
+    )
+    first = screen.rungs[0]
+    assert set(first.result.pareto) <= set(first.ranking[: len(first.result.pareto)])
+    assert len(first.promoted) == 9
+
+
+def test_parallel_matches_serial():
+    kwargs = dict(
+        policies=POLICIES[:9], metrics=[Revenue()], seeds=range(12),
+        cfg=RunConfig(horizon=12, warmup=1), rank_by=REVENUE,
+    )
+    serial = successive_halving(domain=ShopDomain(), **kwargs)
+    parallel = successive_halving(domain=ShopDomain(), workers=2, **kwargs)
+    assert [r.ranking for r in parallel.rungs] == [r.ranking for r in serial.rungs]
+    assert parallel.final.summaries == serial.final.summaries
+
+
+def test_rejects_bad_eta():
+    with pytest.raises(ValueError):
+        successive_halving(
+            domain=ShopDomain(), policies=POLICIES, metrics=[Revenue()], seeds=range(3),
+            cfg=RunConfig(horizon=3), rank_by=REVENUE, eta=1,
+        )
+
+
+def test_resume_snapshot_is_independent_of_the_returned_trajectory():
+    domain, cfg = ShopDomain(), RunConfig(horizon=10)
+    run, snapshot = simulate_resumable(domain, Price(1.5), replace(cfg, horizon=4), seed=3)
+    run.trajectory.final_state["revenue"] = -1e9  # a careless caller
+    resumed = simulate(domain, Price(1.5), cfg, seed=3, prefix=snapshot)
+    assert resumed == simulate(domain, Price(1.5), cfg, seed=3)
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from policy_eval.abstractions.policy import PolicyContext
+from policy_eval.core.types import Event, RunConfig, Trajectory
+from policy_eval.engine.pareto import MetricSpec
+from policy_eval.engine.sequential import evaluate_sequential
+
+
+class NoisyDomain:
+    name = "noisy"
+
+    def initial_state(self, rng: Any) -> float:
+        return 0.0
+
+    def actors(self, state: float):
+        return []
+
+    def policy_context(self, state: float, t: int) -> PolicyContext:
+        return PolicyContext(t=t, system_view=state)
+
+    def observe(self, state: float, actor, t: int):
+        raise RuntimeError("no actors")
+
+    def transition(self, state: float, policy_action: float, actor_actions, rng: Any, t: int) -> float:
+        return state + policy_action + float(rng.normal())
+
+    def record(self, state: float, t: int) -> Event:
+        return Event(t=t, payload=state)
+
+    def finalize(self, events, final_state) -> Trajectory:
+        return Trajectory(events=tuple(events), final_state=final_state)
+
+
+class Drift:
+    def __init__(self, k: float) -> None:
+        self.k = k
+        self.name = f"drift_{k}"
+
+    def decide(self, ctx: PolicyContext) -> float:
+        return self.k
+
+
+class FinalValue:
+    name = "final"
+
+    def evaluate(self, traj: Trajectory) -> float:
+        return float(traj.final_state)
+
+
+CRITERIA = [MetricSpec(name="final", direction="higher_better")]
+
+
+def _run(policies, **kwargs):
+    return evaluate_sequential(
+        domain=NoisyDomain(),
+        policies=policies,
+        metrics=[FinalValue()],
+        seeds=range(10_000),
+        cfg=RunConfig(horizon=4),
+        criteria=CRITERIA,
+        batch_size=20,
+        **kwargs,
+    )
+
+
+def test_clear_winner_stops_early_and_drops_losers():
+    res = _run([Drift(0.0), Drift(1.0), Drift(3.0)], max_seeds=2_000)
+
+    assert res.stopped == "settled"
+    assert res.seeds_used < 200
+    assert res.result.pareto == ["drift_3.0"]
+    assert set(res.dropped) == {"drift_0.0", "drift_1.0"}
+    # dropped policies were not run on later batches
+    n = {p: s.n for (p, _), s in res.result.summaries.items()}
+    assert n["drift_3.0"] == res.seeds_used
+    assert n["drift_0.0"] == res.dropped["drift_0.0"]
+
+
+def test_indistinguishable_policies_hit_budget_or_precision():
+    same = [Drift(1.0), Drift(1.0 + 1e-9)]
+    budget = _run(same, max_seeds=100)
+    assert budget.stopped == "budget" and budget.seeds_used == 100
+
+    precise = _run(same, target_precision=0.5)
+    assert precise.stopped == "settled"
+    assert precise.seeds_used < 10_000
+
+
+def test_non_mean_criteria_are_rejected():
+    with pytest.raises(ValueError, match="p90"):
+        evaluate_sequential(
+            domain=NoisyDomain(),
+            policies=[Drift(0.0), Drift(1.0)],
+            metrics=[FinalValue()],
+            seeds=range(100),
+            cfg=RunConfig(horizon=4),
+            criteria=[MetricSpec(name="final", direction="higher_better", criterion="p90")],
+        )
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import numpy as np
+import pytest
+
+from policy_eval.abstractions.actor import Observation
+from policy_eval.abstractions.policy import PolicyContext
+from policy_eval.core.types import Event, RunConfig, Trajectory
+from policy_eval.engine.columnar import MetricTable
+from policy_eval.engine.evaluate import evaluate
+from policy_eval.engine.experiment import run_experiment
+from policy_eval.engine.profile import Profiler
+from policy_eval.engine.shm import run_metric_table
+
+
+class NoisyActor:
+    id = "a"
+
+    def act(self, obs: Observation, rng: Any) -> float:
+        return float(rng.normal())
+
+
+class NoisyDomain:
+    name = "noisy"
+
+    def initial_state(self, rng: Any) -> float:
+        return float(rng.uniform())
+
+    def actors(self, state: float):
+        return [NoisyActor()]
+
+    def policy_context(self, state: float, t: int) -> PolicyContext:
+        return PolicyContext(t=t, system_view=state)
+
+    def observe(self, state: float, actor, t: int) -> Observation:
+        return Observation(t=t, data=state)
+
+    def transition(self, state: float, policy_action, actor_actions, rng: Any, t: int) -> float:
+        return state + (policy_action or 0.0) + actor_actions[0] + float(rng.normal())
+
+    def record(self, state: float, t: int) -> Event:
+        return Event(t=t, payload=state)
+
+    def finalize(self, events, final_state) -> Trajectory:
+        return Trajectory(events=tuple(events), final_state=final_state)
+
+
+class Scale:
+    def __init__(self, k: float) -> None:
+        self.k = k
+        self.name = f"scale_{k}"
+
+    def decide(self, ctx: PolicyContext) -> float:
+        return -self.k * ctx.system_view
+
+
+class FinalValue:
+    name = "final"
+
+    def evaluate(self, traj: Trajectory) -> float:
+        return float(traj.final_state)
+
+
+class Steps:
+    name = "steps"
+
+    def evaluate(self, traj: Trajectory) -> float:
+        return float(len(traj.events))
+
+
+KW = dict(
+    domain=NoisyDomain(),
+    policies=[Scale(0.0), Scale(0.5), Scale(1.0)],
+    metrics=[FinalValue(), Steps()],
+    seeds=range(11),
+)
+
+
+@pytest.mark.parametrize("cfg", [RunConfig(horizon=10), RunConfig(horizon=10, warmup=4)])
+def test_shared_table_matches_run_experiment(cfg):
+    expected = MetricTable.from_trials(run_experiment(cfg=cfg, **KW))
+
+    serial = run_metric_table(cfg=cfg, **KW)
+    pooled = run_metric_table(cfg=cfg, workers=2, chunksize=3, **KW)
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        threaded = run_metric_table(cfg=cfg, executor=ex, chunksize=2, **KW)
+
+    for table in (serial, pooled, threaded):
+        assert table.policies == expected.policies
+        assert table.metrics == expected.metrics
+        assert table.seeds == expected.seeds
+        assert np.array_equal(table.values, expected.values)
+
+
+class CountingDomain(NoisyDomain):
+    def __init__(self) -> None:
+        self.started = 0
+
+    def initial_state(self, rng: Any) -> float:
+        self.started += 1
+        return super().initial_state(rng)
+
+
+class Watcher(Scale):
+    def __init__(self, domain: CountingDomain) -> None:
+        super().__init__(0.5)
+        self.domain = domain
+        self.seen: list[int] = []
+
+    def decide(self, ctx: PolicyContext) -> float:
+        self.seen.append(self.domain.started)
+        return super().decide(ctx)
+
+
+def test_serial_shared_table_warms_up_one_seed_at_a_time():
+    domain = CountingDomain()
+    watcher = Watcher(domain)
+    run_metric_table(
+        domain=domain,
+        policies=[watcher, Scale(1.0)],  # more than one, so prefixes are shared
+        metrics=[FinalValue()],
+        seeds=range(5),
+        cfg=RunConfig(horizon=6, warmup=3),
+    )
+    assert watcher.seen[0] == 1  # not one prefix per seed before the first decision
+    assert domain.started == 5
+
+
+def test_shared_table_with_workers_is_exact_and_keeps_no_trials():
+    cfg = RunConfig(horizon=10)
+    exact = evaluate(cfg=cfg, **KW)
+    res = evaluate(cfg=cfg, workers=2, shared_table=True, profile=True, **KW)
+
+    assert res.trials == []
+    assert res.summaries == exact.summaries
+    assert np.array_equal(res.table.values, exact.table.values)
+    assert isinstance(res.profile, Profiler)
+    assert res.profile.stats[("noisy", "scale_0.5", "metrics")].count == 11
+
+
+def test_streaming_summaries_do_not_depend_on_workers():
+    # past the sketch size, so quantiles are estimates and order would show
+    kw = {**KW, "seeds": range(300), "metrics": [FinalValue()]}
+    cfg = RunConfig(horizon=2)
+    serial = evaluate(cfg=cfg, streaming=True, **kw)
+    pooled = evaluate(cfg=cfg, workers=2, streaming=True, **kw)
+    assert pooled.table is None and pooled.trials == []
+    assert pooled.summaries == serial.summaries
+
+
+def test_shared_table_rejects_streaming():
+    with pytest.raises(ValueError):
+        evaluate(cfg=RunConfig(horizon=2), shared_table=True, streaming=True, **KW)
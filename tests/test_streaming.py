@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+import pytest
+
+from policy_eval.abstractions.policy import PolicyContext
+from policy_eval.core.types import Event, RunConfig, Trajectory
+from policy_eval.engine.evaluate import evaluate
+from policy_eval.engine.online import OnlineDist, QuantileSketch
+from policy_eval.engine.pareto import MetricSpec
+
+
+class DriftDomain:
+    name = "drift"
+
+    def initial_state(self, rng: Any) -> float:
+        return float(rng.normal())
+
+    def actors(self, state: float):
+        return []
+
+    def policy_context(self, state: float, t: int) -> PolicyContext:
+        return PolicyContext(t=t, system_view=state)
+
+    def observe(self, state: float, actor, t: int):
+        raise RuntimeError("no actors")
+
+    def transition(self, state: float, policy_action: float, actor_actions, rng: Any, t: int) -> float:
+        return state + policy_action + float(rng.normal())
+
+    def record(self, state: float, t: int) -> Event:
+        return Event(t=t, payload=state)
+
+    def finalize(self, events, final_state) -> Trajectory:
+        return Trajectory(events=tuple(events), final_state=final_state)
+
+
+class Push:
+    def __init__(self, step: float) -> None:
+        self.step = step
+        self.name = f"push_{step}"
+
+    def decide(self, ctx: PolicyContext) -> float:
+        return self.step
+
+
+class FinalValue:
+    name = "final"
+
+    def evaluate(self, traj: Trajectory) -> float:
+        return float(traj.final_state)
+
+
+def test_streaming_matches_exact_summaries_for_small_runs():
+    kwargs = dict(
+        domain=DriftDomain(),
+        policies=[Push(0.0), Push(0.5)],
+        metrics=[FinalValue()],
+        seeds=range(50),
+        cfg=RunConfig(horizon=5),
+        pareto_metrics=[MetricSpec(name="final", direction="higher_better")],
+    )
+    exact = evaluate(**kwargs)
+    streamed = evaluate(streaming=True, **kwargs)
+
+    assert streamed.trials == []
+    assert streamed.pareto == exact.pareto
+    for key, s in exact.summaries.items():
+        o = streamed.summaries[key]
+        assert o.n == s.n
+        assert o.min == s.min and o.max == s.max
+        assert o.p10 == pytest.approx(s.p10)
+        assert o.p50 == pytest.approx(s.p50)
+        assert o.mean == pytest.approx(s.mean)
+        assert o.std == pytest.approx(s.std)
+
+
+def test_online_dist_merge_and_sketch_accuracy():
+    vals = np.random.default_rng(0).normal(size=20_000)
+    a, b = OnlineDist(), OnlineDist()
+    for x in vals[:7_000]:
+        a.add(x)
+    for x in vals[7_000:]:
+        b.add(x)
+    a.merge(b)
+    s = a.summary()
+
+    assert s.n == len(vals)
+    assert s.mean == pytest.approx(vals.mean())
+    assert s.std == pytest.approx(vals.std())
+    assert s.min == vals.min() and s.max == vals.max()
+    for q, got in [(0.1, s.p10), (0.5, s.p50), (0.9, s.p90)]:
+        assert got == pytest.approx(np.quantile(vals, q), abs=0.05)
+
+
+def test_sketch_is_bounded():
+    sk = QuantileSketch(k=64)
+    for x in range(100_000):
+        sk.add(float(x))
+    assert sum(len(level) for level in sk.levels) < 64 * len(sk.levels) + 1
+    assert sk.quantile(0.5) == pytest.approx(50_000, rel=0.05)
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import pickle
+from typing import Any
+
+import numpy as np
+import pytest
+
+from policy_eval.abstractions.policy import PolicyContext
+from policy_eval.core.types import ColumnarTrajectory, Event, RunConfig, Trajectory
+from policy_eval.engine.evaluate import evaluate
+from policy_eval.engine.experiment import iter_experiment
+from policy_eval.engine.rescore import rescore
+from policy_eval.engine.store import StoredRun, TrajectoryStore
+
+
+class QueueDomain:
+    name = "queue"
+
+    def initial_state(self, rng: Any) -> tuple[float, int]:
+        return (0.0, 0)
+
+    def actors(self, state):
+        return []
+
+    def policy_context(self, state, t: int) -> PolicyContext:
+        return PolicyContext(t=t, system_view=state)
+
+    def observe(self, state, actor, t: int):
+        raise RuntimeError("no actors")
+
+    def transition(self, state, policy_action, actor_actions, rng: Any, t: int):
+        load, served = state
+        arrivals = float(rng.exponential())
+        done = min(load + arrivals, policy_action)
+        return (load + arrivals - done, served + int(done > 0))
+
+    def record(self, state, t: int) -> Event:
+        return Event(t=t, payload={"load": state[0], "served": state[1]})
+
+    def finalize(self, events, final_state) -> Trajectory:
+        return Trajectory(events=tuple(events), final_state=final_state)
+
+
+class ColumnarQueueDomain(QueueDomain):
+    event_dtype = [("load", "f8"), ("served", "i8")]
+
+    def record_row(self, state, t: int) -> tuple[float, int]:
+        return state
+
+
+class Serve:
+    def __init__(self, rate: float) -> None:
+        self.rate = rate
+        self.name = f"serve_{rate}"
+
+    def decide(self, ctx: PolicyContext) -> float:
+        return self.rate
+
+
+class Served:
+    name = "served"
+
+    def evaluate(self, traj) -> float:
+        return float(traj.final_state[1])
+
+
+class PeakLoad:
+    name = "peak_load"
+
+    def evaluate(self, traj) -> float:
+        if isinstance(traj, ColumnarTrajectory):
+            return float(traj.columns["load"].max())
+        return max(e.payload["load"] for e in traj.events)
+
+
+KW = dict(
+    policies=[Serve(0.5), Serve(1.5)],
+    metrics=[Served()],
+    seeds=range(6),
+    cfg=RunConfig(horizon=30),
+)
+
+
+@pytest.mark.parametrize("domain", [QueueDomain(), ColumnarQueueDomain()])
+def test_evaluate_streams_runs_into_store_and_returns_lazy_views(tmp_path, domain):
+    plain = evaluate(domain=domain, **KW)
+    with TrajectoryStore(tmp_path / "runs") as store:
+        stored = evaluate(domain=domain, store=store, **KW)
+
+    assert stored.summaries == plain.summaries
+    for tr, ref in zip(stored.trials, plain.trials):
+        assert isinstance(tr.run, StoredRun)
+        assert "trajectory" not in tr.run.__dict__  # nothing read yet
+        assert tr.run.trajectory == ref.run.trajectory
+        assert tr.run.load() == ref.run
+    if isinstance(domain, ColumnarQueueDomain):
+        assert isinstance(stored.trials[0].run.trajectory.data, np.memmap)
+
+    reopened = TrajectoryStore(tmp_path / "runs")
+    assert len(reopened) == 12
+    assert reopened.get("queue", "serve_1.5", 3).trajectory == plain.trials[9].run.trajectory
+    rescored = rescore(reopened.runs(), [PeakLoad()]).summaries
+    assert rescored == {
+        k: v for k, v in rescore(plain, [PeakLoad()]).summaries.items() if k[1] == "peak_load"
+    }
+    assert pickle.loads(pickle.dumps(reopened.get("queue", "serve_0.5", 0))).trajectory == (
+        plain.trials[0].run.trajectory
+    )
+
+
+def test_store_without_kept_runs_segments_and_supersedes(tmp_path):
+    domain = ColumnarQueueDomain()
+    store = TrajectoryStore(tmp_path, segment_bytes=2048)
+    trials = list(iter_experiment(domain=domain, keep_runs=False, store=store, **KW))
+    store.close()
+
+    assert all(tr.run is None for tr in trials)
+    assert len(list(tmp_path.glob("seg-*.bin"))) > 1
+
+    # a new session appends to a fresh segment and the newest entry wins
+    again = TrajectoryStore(tmp_path)
+    first = again.get("queue", "serve_0.5", 0).trajectory
+    rerun = evaluate(domain=domain, **{**KW, "cfg": RunConfig(horizon=5)})
+    again.append(rerun.trials[0].run)
+    again.close()
+    with open(tmp_path / "index.jsonl", "a") as f:
+        f.write('{"domain": "queue", "policy": "torn')  # interrupted writer
+
+    latest = TrajectoryStore(tmp_path)
+    assert len(latest) == 12
+    assert len(latest.get("queue", "serve_0.5", 0).trajectory.data) == 5
+    assert len(first.data) == 30
+
+
+def test_runs_of_different_domains_do_not_collide(tmp_path):
+    class OtherQueue(QueueDomain):
+        name = "other_queue"
+
+    with TrajectoryStore(tmp_path) as store:
+        evaluate(domain=QueueDomain(), store=store, **KW)
+        evaluate(domain=OtherQueue(), store=store, **{**KW, "cfg": RunConfig(horizon=4)})
+
+    reopened = TrajectoryStore(tmp_path)
+    assert len(reopened) == 24
+    assert len(reopened.get("queue", "serve_0.5", 2).trajectory.events) == 30
+    assert len(reopened.get("other_queue", "serve_0.5", 2).trajectory.events) == 4
+
+
+def test_appends_after_a_torn_index_line_survive_reopening(tmp_path):
+    runs = evaluate(domain=QueueDomain(), **{**KW, "seeds": range(4)}).trials
+    with TrajectoryStore(tmp_path) as store:
+        for tr in runs[:2]:
+            store.append(tr.run)
+    index = tmp_path / "index.jsonl"
+    index.write_bytes(index.read_bytes()[:-20])  # second line torn mid-JSON
+
+    with TrajectoryStore(tmp_path) as store:
+        for tr in runs[2:4]:
+            store.append(tr.run)
+
+    reopened = TrajectoryStore(tmp_path)
+    assert sorted(seed for _, _, seed in reopened.keys()) == [0, 2, 3]
+    assert reopened.get("queue", "serve_0.5", 3).trajectory == runs[3].run.trajectory
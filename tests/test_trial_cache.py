@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from policy_eval.abstractions.policy import PolicyContext
+from policy_eval.core.types import Event, RunConfig, Trajectory
+from policy_eval.engine.cache import TrialCache, trial_key
+from policy_eval.engine.evaluate import evaluate
+from policy_eval.engine.experiment import iter_experiment, run_experiment
+
+
+class CountingDomain:
+    name = "counting"
+
+    def __init__(self) -> None:
+        self.runs = 0
+
+    def initial_state(self, rng: Any) -> float:
+        self.runs += 1
+        return float(rng.uniform())
+
+    def actors(self, state: float):
+        return []
+
+    def policy_context(self, state: float, t: int) -> PolicyContext:
+        return PolicyContext(t=t, system_view=state)
+
+    def observe(self, state: float, actor, t: int):
+        raise RuntimeError("no actors")
+
+    def transition(self, state: float, policy_action: float, actor_actions, rng: Any, t: int) -> float:
+        return state + (policy_action or 0.0) + float(rng.normal())
+
+    def record(self, state: float, t: int) -> Event:
+        return Event(t=t, payload=state)
+
+    def finalize(self, events, final_state) -> Trajectory:
+        return Trajectory(events=tuple(events), final_state=final_state)
+
+
+class Step:
+    def __init__(self, k: float) -> None:
+        self.k = k
+        self.name = f"step_{k}"
+
+    def decide(self, ctx: PolicyContext) -> float:
+        return self.k
+
+
+class FinalValue:
+    name = "final"
+
+    def evaluate(self, traj: Trajectory) -> float:
+        return float(traj.final_state)
+
+
+class PeakValue:
+    name = "peak"
+
+    def evaluate(self, traj: Trajectory) -> float:
+        return max(float(e.payload) for e in traj.events)
+
+
+CFG = RunConfig(horizon=6)
+
+
+def _run(domain, cache, policies, metrics=(FinalValue(),), cfg=CFG):
+    return run_experiment(
+        domain=domain, policies=policies, metrics=metrics, seeds=range(5), cfg=cfg, cache=cache
+    )
+
+
+def test_only_missing_cells_are_simulated(tmp_path):
+    cache = TrialCache(tmp_path)
+    first = _run(CountingDomain(), cache, [Step(0.0), Step(1.0)])
+
+    domain = CountingDomain()
+    again = _run(domain, cache, [Step(0.0), Step(1.0)])
+    assert domain.runs == 0
+    assert again == first
+
+    domain = CountingDomain()
+    extended = _run(domain, cache, [Step(0.0), Step(1.0), Step(2.0)])
+    assert domain.runs == 5  # only the new policy
+    assert extended[:10] == first
+    assert extended == _run(CountingDomain(), None, [Step(0.0), Step(1.0), Step(2.0)])
+
+
+def test_new_metric_is_scored_from_cached_runs(tmp_path):
+    cache = TrialCache(tmp_path)
+    _run(CountingDomain(), cache, [Step(1.0)])
+
+    domain = CountingDomain()
+    res = evaluate(
+        domain=domain,
+        policies=[Step(1.0)],
+        metrics=[FinalValue(), PeakValue()],
+        seeds=range(5),
+        cfg=CFG,
+        cache=cache,
+    )
+    assert domain.runs == 0
+    assert res.summaries[("step_1.0", "peak")].n == 5
+
+
+def test_config_and_version_change_the_key(tmp_path):
+    cache = TrialCache(tmp_path)
+    _run(CountingDomain(), cache, [Step(1.0)])
+
+    domain = CountingDomain()
+    _run(domain, cache, [Step(1.0)], cfg=RunConfig(horizon=6, rng_scheme="v2"))
+    assert domain.runs == 5
+
+    domain = CountingDomain()
+    domain.version = 2  # type: ignore[attr-defined]
+    _run(domain, cache, [Step(1.0)])
+    assert domain.runs == 5
+
+
+def test_lru_eviction_bounds_size(tmp_path):
+    cache = TrialCache(tmp_path)
+    _run(CountingDomain(), cache, [Step(0.0)])
+    per_entry = cache.size_bytes() / 5
+
+    small = TrialCache(tmp_path, max_bytes=int(per_entry * 3.5))
+    _run(CountingDomain(), small, [Step(1.0)])
+    assert small.size_bytes() <= small.max_bytes
+
+
+@dataclass(frozen=True)
+class ExtendedConfig(RunConfig):
+    retries: int = 0
+
+
+def test_new_defaulted_config_fields_keep_keys():
+    domain, policy = CountingDomain(), Step(1.0)
+    key = trial_key(domain, policy, 3, CFG)
+    assert trial_key(domain, policy, 3, ExtendedConfig(horizon=6)) == key
+    assert trial_key(domain, policy, 3, ExtendedConfig(horizon=6, retries=1)) != key
+    assert trial_key(domain, policy, 3, RunConfig(horizon=6, warmup=2)) != key
+
+
+def test_unloadable_entries_are_misses(tmp_path):
+    cache = TrialCache(tmp_path)
+    _run(CountingDomain(), cache, [Step(0.0)])
+    keys = [trial_key(CountingDomain(), Step(0.0), s, CFG) for s in range(5)]
+    # pickles of classes that no longer exist
+    cache._path(keys[0]).write_bytes(b"cgone_module\nThing\n)R.")
+    cache._path(keys[1]).write_bytes(b"cpolicy_eval.engine.cache\nGoneThing\n)R.")
+    cache._path(keys[2]).write_bytes(b"\x80\x05")
+
+    domain = CountingDomain()
+    _run(domain, cache, [Step(0.0)])
+    assert domain.runs == 3
+    assert all(cache.get(k) is not None for k in keys)
+
+
+def test_cached_iteration_is_lazy_and_shares_warmup(tmp_path):
+    cache = TrialCache(tmp_path)
+    domain = CountingDomain()
+    trials = iter_experiment(
+        domain=domain,
+        policies=[Step(0.0), Step(1.0)],
+        metrics=[FinalValue()],
+        seeds=range(5),
+        cfg=RunConfig(horizon=6, warmup=2),
+        cache=cache,
+    )
+    next(trials)
+    assert domain.runs == 1  # one seed's shared warm-up, not the whole grid
+    rest = list(trials)
+    assert domain.runs == 5 and len(rest) == 9
+
+    domain = CountingDomain()
+    got = run_experiment(
+        domain=domain,
+        policies=[Step(0.0), Step(1.0), Step(2.0)],
+        metrics=[FinalValue()],
+        seeds=range(5),
+        cfg=RunConfig(horizon=6, warmup=2),
+        cache=cache,
+    )
+    assert domain.runs == 5  # only the new policy
+    assert got == run_experiment(
+        domain=CountingDomain(),
+        policies=[Step(0.0), Step(1.0), Step(2.0)],
+        metrics=[FinalValue()],
+        seeds=range(5),
+        cfg=RunConfig(horizon=6, warmup=2),
+    )
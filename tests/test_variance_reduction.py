@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+import pytest
+
+from policy_eval.abstractions.policy import PolicyContext
+from policy_eval.core.rng import RNG, SeedPlan
+from policy_eval.core.types import Event, RunConfig, Trajectory
+from policy_eval.engine.evaluate import evaluate
+from policy_eval.engine.simulator import simulate
+from policy_eval.engine.variance import estimate
+
+
+class DemandDomain:
+    """
+    Demand starts at a random level and drifts; served load saturates, so
+    the outcome is monotone in the initial draws.
+    """
+    name = "demand"
+
+    def initial_state(self, rng: Any) -> dict[str, float]:
+        return {"level": float(rng.uniform(0.0, 10.0)), "shock": float(rng.normal()), "served": 0.0}
+
+    def actors(self, state):
+        return []
+
+    def policy_context(self, state, t: int) -> PolicyContext:
+        return PolicyContext(t=t, system_view=state["level"])
+
+    def observe(self, state, actor, t: int):
+        raise AssertionError("no actors")
+
+    def transition(self, state, policy_action, actor_actions, rng: Any, t: int):
+        state = dict(state)
+        state["level"] += 0.1 * state["shock"] + 0.2 * float(rng.normal())
+        state["served"] += min(state["level"], policy_action or 0.0)
+        return state
+
+    def record(self, state, t: int) -> Event:
+        return Event(t=t, payload=state["served"])
+
+    def finalize(self, events, final_state) -> Trajectory:
+        return Trajectory(events=tuple(events), final_state=final_state)
+
+
+class Capacity:
+    def __init__(self, c: float) -> None:
+        self.c = c
+        self.name = f"cap_{c}"
+
+    def decide(self, ctx: PolicyContext) -> float:
+        return self.c
+
+
+class Served:
+    name = "served"
+
+    def evaluate(self, traj: Trajectory) -> float:
+        return traj.final_state["served"]
+
+
+class InitialLevel:
+    """
+    Control variate: the initial level is uniform on [0, 10], mean 5.
+    """
+    name = "initial_level"
+
+    def evaluate(self, traj: Trajectory) -> float:
+        return traj.final_state["start"]
+
+
+class StartDomain(DemandDomain):
+    def initial_state(self, rng: Any) -> dict[str, float]:
+        state = super().initial_state(rng)
+        state["start"] = state["level"]
+        return state
+
+
+def _run(plan: SeedPlan | None, n: int, controls: dict[str, float] | None = None):
+    cfg = RunConfig(horizon=8, sampling=plan)
+    result = evaluate(
+        domain=StartDomain(),
+        policies=[Capacity(6.0)],
+        metrics=[Served(), InitialLevel()],
+        seeds=range(n),
+        cfg=cfg,
+    )
+    return result.estimates(controls=controls)[("cap_6.0", "served")]
+
+
+def test_default_plan_keeps_streams():
+    a = RNG(7).fork("transition", 3).random(4)
+    b = RNG(7, plan=SeedPlan()).fork("transition", 3).random(4)
+    assert np.array_equal(a, b)
+
+
+def test_antithetic_pairs_mirror_draws():
+    plan = SeedPlan("antithetic")
+    even, odd = RNG(10, plan=plan), RNG(11, plan=plan)
+    assert np.array_equal(even.fork("x").random(5), RNG(10).fork("x").random(5))
+    np.testing.assert_allclose(even.fork("x").random(5) + odd.fork("x").random(5), 1 - 2**-53)
+    np.testing.assert_allclose(even.fork("x").normal(2.0, 3.0, 4) + odd.fork("x").normal(2.0, 3.0, 4), 4.0)
+    assert even.fork("x").integers(0, 6) + odd.fork("x").integers(0, 6) == 5
+    keys = np.array([even.key("actor", "a")], dtype=np.uint64)
+    np.testing.assert_allclose(even.uniforms(keys, 2, 3) + odd.uniforms(keys, 2, 3), 1 - 2**-53)
+
+
+@pytest.mark.parametrize("mode", ["stratified", "sobol"])
+def test_design_plans_stratify_init_draws(mode):
+    plan = SeedPlan(mode, block=16, dims=2)
+    first = np.array([RNG(s, plan=plan).fork("init").uniform(0, 10) for s in range(16, 32)])
+    assert sorted(np.floor(first / 10 * 16).astype(int)) == list(range(16))
+    # other streams stay independent per seed
+    assert np.array_equal(
+        RNG(20, plan=plan).fork("transition", 0).random(3), RNG(20).fork("transition", 0).random(3)
+    )
+
+
+def test_plan_validation():
+    with pytest.raises(ValueError):
+        SeedPlan("sobol", block=12)
+    with pytest.raises(ValueError):
+        SeedPlan("lhs")
+
+
+def test_simulate_follows_plan():
+    plan = SeedPlan("antithetic")
+    cfg = RunConfig(horizon=4, sampling=plan)
+    even = simulate(DemandDomain(), Capacity(5.0), cfg, seed=0)
+    plain = simulate(DemandDomain(), Capacity(5.0), RunConfig(horizon=4), seed=0)
+    odd = simulate(DemandDomain(), Capacity(5.0), cfg, seed=1)
+    assert even.trajectory == plain.trajectory
+    level = lambda r: r.trajectory.final_state["level"]  # noqa: E731
+    assert level(odd) != level(even)
+
+
+def test_estimate_matches_iid_formula_without_plan():
+    y = np.random.default_rng(0).normal(size=200)
+    est = estimate(y)
+    assert est.stderr == pytest.approx(y.std(ddof=1) / np.sqrt(y.size))
+    assert est.ess == pytest.approx(200)
+
+
+@pytest.mark.parametrize(
+    "plan", [SeedPlan("antithetic"), SeedPlan("stratified", block=32), SeedPlan("sobol", block=32)]
+)
+def test_plans_raise_effective_sample_size(plan):
+    est = _run(plan, 128)
+    assert est.n == 128
+    assert est.ess > 2 * est.n
+
+
+def test_control_variate_raises_effective_sample_size():
+    plain = _run(None, 128)
+    adjusted = _run(None, 128, controls={"initial_level": 5.0})
+    assert plain.ess == pytest.approx(128)
+    assert adjusted.ess > 2 * plain.ess
+    assert len(adjusted.beta) == 1 and adjusted.beta[0] > 0
+    assert adjusted.ci_low < adjusted.mean < adjusted.ci_high
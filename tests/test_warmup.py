@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from typing import Any
+
+from policy_eval.abstractions.actor import Observation
+from policy_eval.abstractions.policy import PolicyContext
+from policy_eval.core.types import Event, RunConfig, Trajectory
+from policy_eval.engine.experiment import run_experiment
+from policy_eval.engine.simulator import simulate, simulate_prefix
+
+
+class Walker:
+    id = "w"
+
+    def act(self, obs: Observation, rng: Any) -> float:
+        return float(rng.normal())
+
+
+class CountingDomain:
+    """
+    Mutable state on purpose: continuations must not share it.
+    """
+    name = "counting"
+
+    def __init__(self) -> None:
+        self.transitions = 0
+
+    def initial_state(self, rng: Any) -> dict[str, Any]:
+        return {"x": float(rng.uniform()), "log": []}
+
+    def actors(self, state):
+        return [Walker()]
+
+    def policy_context(self, state, t: int) -> PolicyContext:
+        return PolicyContext(t=t, system_view=state["x"])
+
+    def observe(self, state, actor, t: int) -> Observation:
+        return Observation(t=t, data=state["x"])
+
+    def transition(self, state, policy_action, actor_actions, rng: Any, t: int):
+        self.transitions += 1
+        state["log"].append(policy_action)
+        state["x"] += (policy_action or 0.0) + actor_actions[0] + float(rng.normal())
+        return state
+
+    def record(self, state, t: int) -> Event:
+        return Event(t=t, payload=state["x"])
+
+    def finalize(self, events, final_state) -> Trajectory:
+        return Trajectory(events=tuple(events), final_state=final_state)
+
+
+class Nudge:
+    def __init__(self, k: float) -> None:
+        self.k = k
+        self.name = f"nudge_{k}"
+
+    def decide(self, ctx: PolicyContext) -> float:
+        return self.k
+
+
+class FinalX:
+    name = "x"
+
+    def evaluate(self, traj: Trajectory) -> float:
+        return float(traj.final_state["x"])
+
+
+def test_policy_not_consulted_during_warmup():
+    run = simulate(CountingDomain(), Nudge(1.0), RunConfig(horizon=6, warmup=4), seed=0)
+    assert run.trajectory.final_state["log"] == [None] * 4 + [1.0] * 2
+
+
+def test_prefix_continuation_matches_full_run():
+    cfg = RunConfig(horizon=12, warmup=6)
+    domain = CountingDomain()
+    prefix = simulate_prefix(domain, cfg, seed=3)
+
+    for k in (0.0, 1.0):
+        shared = simulate(domain, Nudge(k), cfg, seed=3, prefix=prefix)
+        full = simulate(CountingDomain(), Nudge(k), cfg, seed=3)
+        assert shared.trajectory == full.trajectory
+
+
+def test_run_experiment_shares_warmup_per_seed():
+    cfg = RunConfig(horizon=10, warmup=5)
+    policies = [Nudge(0.0), Nudge(0.5), Nudge(1.0)]
+    seeds = range(4)
+
+    domain = CountingDomain()
+    shared = run_experiment(domain=domain, policies=policies, metrics=[FinalX()], seeds=seeds, cfg=cfg)
+    # 4 seeds x 5 warm-up steps once, plus 3 policies x 4 seeds x 5 steps
+    assert domain.transitions == 4 * 5 + 3 * 4 * 5
+
+    reference = [
+        simulate(CountingDomain(), p, cfg, seed=s) for p in policies for s in seeds
+    ]
+    assert [(t.policy, t.seed) for t in shared] == [(r.policy, r.seed) for r in reference]
+    assert [t.run.trajectory for t in shared] == [r.trajectory for r in reference]
+
+    parallel = run_experiment(
+        domain=CountingDomain(), policies=policies, metrics=[FinalX()], seeds=seeds, cfg=cfg, workers=2
+    )
+    assert parallel == shared
+
+
+def test_duplicate_policy_names_stay_policy_major():
+    cfg = RunConfig(horizon=8, warmup=3)
+    twins = [Nudge(0.0), Nudge(1.0)]
+    for p in twins:
+        p.name = "same"
+    got = run_experiment(domain=CountingDomain(), policies=twins, metrics=[FinalX()], seeds=range(3), cfg=cfg)
+
+    reference = [simulate(CountingDomain(), p, cfg, seed=s) for p in twins for s in range(3)]
+    assert [t.seed for t in got] == [0, 1, 2, 0, 1, 2]
+    assert [t.run.trajectory for t in got] == [r.trajectory for r in reference]